@@ -0,0 +1,72 @@
+"""
+Benchmark provisioning users one request at a time vs in batched requests.
+
+Adds '--calls' users against the in-memory RACF simulator, first with one 'UserAdmin.add()'
+call per user and then with a batch ('UserAdmin.batch()') that packs up to '--batch-size'
+definitions into each IRRSMO00 call. Each call waits for a fixed latency, so this measures
+the round trips that batching saves. RACF still has to process every definition, which
+the simulated latency doesn't scale with.
+
+Usage:
+    python3 benchmarks/bench_batch_requests.py [--calls N] [--latency-us U] [--batch-size B]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--calls", type=int, default=2000)
+    parser.add_argument("--latency-us", type=int, default=2000)
+    parser.add_argument("--batch-size", type=int, default=100)
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    pyracf = importlib.import_module("pyracf")
+    simulator = importlib.import_module("pyracf.simulator")
+    latency = arguments.latency_us / 1000000
+
+    user_admin = pyracf.UserAdmin(
+        transport=simulator.SimulatedTransport(latency=latency)
+    )
+    start = time.perf_counter()
+    for user in range(arguments.calls):
+        user_admin.add(f"user{user}", traits={"omvs:uid": user})
+    individual_time = time.perf_counter() - start
+
+    user_admin = pyracf.UserAdmin(
+        transport=simulator.SimulatedTransport(latency=latency)
+    )
+    start = time.perf_counter()
+    batch = user_admin.batch(max_definitions=arguments.batch_size)
+    for user in range(arguments.calls):
+        batch.add(f"user{user}", traits={"omvs:uid": user})
+    results = batch.run()
+    batched_time = time.perf_counter() - start
+    if len(results) != arguments.calls or not all(
+        isinstance(result, dict) for result in results
+    ):
+        raise AssertionError("Not every user in the batch was added.")
+
+    batched_calls = -(-arguments.calls // arguments.batch_size)
+    print(f"simulated latency: {arguments.latency_us} us, users: {arguments.calls}")
+    print(
+        f"one request per user: {arguments.calls:6} calls "
+        + f"{arguments.calls / individual_time:10.1f} users/s"
+    )
+    print(
+        f"batches of {arguments.batch_size:<9} {batched_calls:6} calls "
+        + f"{arguments.calls / batched_time:10.1f} users/s"
+    )
+    print(f"speedup:              {individual_time / batched_time:17.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark converting request and result XML between cp1047 and text.
+
+Compares the cp1047 codec against the translation tables in 'pyracf.common.ebcdic'
+for encoding request XML, and decoding result XML to text and then parsing it against
+translating it to bytes that are handed to the parser directly. The cp1047 codec is only
+shipped with Python on z/OS, so cp037, which is implemented the same way, stands in for
+it everywhere else.
+
+Usage:
+    python3 benchmarks/bench_ebcdic.py [--calls N] [--messages M]
+"""
+
+import argparse
+import codecs
+import importlib
+import os
+import sys
+import time
+from typing import Callable
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def build_result_xml(messages: int) -> str:
+    """Build a listing result with 'messages' lines of output, like a large LISTUSER."""
+    lines = "".join(
+        f"<message>  USER=SQUIDWRD  NAME=SQUIDWARD  OWNER=LEONARD  LINE={line}</message>"
+        for line in range(messages)
+    )
+    return (
+        '<?xml version="1.0" encoding="IBM-1047"?>'
+        + '<securityresult xmlns="http://www.ibm.com/systems/zos/saf/IRRSMO00Result1">'
+        + '<user name="SQUIDWRD" operation="listdata" requestid="UserRequest">'
+        + "<command><safreturncode>0</safreturncode><returncode>0</returncode>"
+        + "<reasoncode>0</reasoncode><image>LISTUSER SQUIDWRD</image>"
+        + lines
+        + "</command></user><returncode>0</returncode><reasoncode>0</reasoncode>"
+        + "</securityresult>"
+    )
+
+
+def time_function(function: Callable[[], object], calls: int) -> float:
+    """Return the average time in milliseconds that 'function' takes."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1000
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--calls", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=20000)
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    ebcdic = importlib.import_module("pyracf.common.ebcdic")
+    security_result_class = importlib.import_module(
+        "pyracf.common.security_result"
+    ).SecurityResult
+    try:
+        codec = codecs.lookup("cp1047").name
+    except LookupError:
+        codec = "cp037"
+
+    result_text = build_result_xml(arguments.messages)
+    result_xml = ebcdic.encode_cp1047(result_text)
+    request_text = result_text.replace("securityresult", "securityrequest")
+    timings = {
+        "encode request (codec)": lambda: request_text.encode(codec),
+        "encode request (table)": lambda: ebcdic.encode_cp1047(request_text),
+        "decode result (codec)": lambda: result_xml.decode(codec),
+        "decode result (table)": lambda: ebcdic.decode_cp1047(result_xml),
+        "parse result (codec, text)": lambda: security_result_class(
+            result_xml.decode(codec)
+        ),
+        "parse result (table, bytes)": lambda: security_result_class(
+            ebcdic.cp1047_to_parser_bytes(result_xml)
+        ),
+    }
+
+    print(f"codec: {codec}, result size: {len(result_xml)} bytes")
+    for name, function in timings.items():
+        print(f"{name:28} {time_function(function, arguments.calls):8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
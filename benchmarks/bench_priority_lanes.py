@@ -0,0 +1,91 @@
+"""
+Benchmark interactive latency while a bulk job runs against the in-memory RACF simulator.
+
+A bulk job extracts and alters users from a pool of threads as fast as it can while
+one interactive caller looks up OMVS UIDs. Reads are limited to '--read-limit' calls in
+flight, so interactive lookups have to wait for a slot. The benchmark is run once with
+the bulk job using the same 'interactive' priority as the lookups, and once with it using
+the 'bulk' priority, and reports the latency percentiles of the interactive lookups.
+
+Usage:
+    python3 benchmarks/bench_priority_lanes.py [--calls N] [--threads T] [--latency-us U]
+"""
+
+import importlib
+import os
+import statistics
+import sys
+import threading
+import time
+
+from harness import parse_arguments
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+READ_LIMIT = 2
+
+
+def run_bulk_job(transport, priority: str, stop: threading.Event) -> None:
+    """Extract and alter users with 'priority' until 'stop' is set."""
+    user_admin = importlib.import_module("pyracf").UserAdmin(transport=transport)
+    user_admin.set_call_priority(priority)
+    uid = 0
+    while not stop.is_set():
+        uid += 1
+        user_admin.extract("bulkuser")
+        user_admin.set_omvs_uid("bulkuser", uid)
+
+
+def measure_lookups(transport, bulk_priority: str, calls: int, threads: int) -> list:
+    """Return the latencies of 'calls' interactive lookups made while a bulk job runs."""
+    stop = threading.Event()
+    bulk_threads = [
+        threading.Thread(target=run_bulk_job, args=(transport, bulk_priority, stop))
+        for _ in range(threads)
+    ]
+    for thread in bulk_threads:
+        thread.start()
+    user_admin = importlib.import_module("pyracf").UserAdmin(transport=transport)
+    latencies = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        user_admin.get_omvs_uid("squidwrd")
+        latencies.append(time.perf_counter() - start)
+    stop.set()
+    for thread in bulk_threads:
+        thread.join()
+    return latencies
+
+
+def main():
+    """Benchmark entrypoint."""
+    arguments = parse_arguments(__doc__)
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    transport = importlib.import_module("pyracf.simulator").SimulatedTransport(
+        latency=arguments.latency_us / 1000000
+    )
+    user_admin = importlib.import_module("pyracf").UserAdmin(transport=transport)
+    user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+    user_admin.add("bulkuser", traits={"omvs:uid": 0})
+    importlib.import_module("pyracf.common.irrsmo00").IRRSMO00.governor.set_limits(
+        read_limit=READ_LIMIT
+    )
+
+    print(
+        f"simulated latency: {arguments.latency_us} us, bulk threads: {arguments.threads}, "
+        + f"read limit: {READ_LIMIT}, lookups: {arguments.calls}"
+    )
+    for bulk_priority in ["interactive", "bulk"]:
+        latencies = measure_lookups(
+            transport, bulk_priority, arguments.calls, arguments.threads
+        )
+        percentiles = statistics.quantiles(latencies, n=100)
+        print(
+            f"bulk job priority {bulk_priority:11}  "
+            + f"p50: {percentiles[49] * 1000:7.2f} ms  "
+            + f"p99: {percentiles[98] * 1000:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark building security requests without making them.
+
+Builds alter requests with a mix of traits from several segments, including traits
+with operation prefixes, using 'UserAdmin' and 'ResourceAdmin' in generate requests
+only mode, which covers validating the traits, building the XML and serializing it.
+Also times a 'UserAdmin' alter of OMVS traits made with the operation and with a
+prepared request, which only writes the profile name and trait values into the XML.
+
+Usage:
+    python3 benchmarks/bench_request_building.py [--calls N]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+USER_TRAITS = {
+    "base:name": "Squidward",
+    "base:owner": "leonard",
+    "base:special": True,
+    "add:base:class_authorizations": ["tstcls01", "tstcls02"],
+    "omvs:uid": 2424,
+    "omvs:home": "/u/squidwrd",
+    "omvs:program": "/bin/sh",
+    "tso:acctnum": "acct1234",
+    "tso:proc": "proc01",
+    "delete:tso:size": True,
+}
+
+OMVS_TRAITS = {
+    "omvs:uid": 2424,
+    "omvs:home": "/u/squidwrd",
+    "omvs:program": "/bin/sh",
+}
+
+RESOURCE_TRAITS = {
+    "base:owner": "leonard",
+    "base:universal_access": "read",
+    "add:base:member": ["tstmem01"],
+    "ssigon:user": "squidwrd",
+    "ssigon:group": "tstgrp00",
+    "kerb:encrypt": "aes256",
+}
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--calls", type=int, default=5000)
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    pyracf = importlib.import_module("pyracf")
+    user_admin = pyracf.UserAdmin(generate_requests_only=True)
+    resource_admin = pyracf.ResourceAdmin(generate_requests_only=True)
+
+    start = time.perf_counter()
+    for _ in range(arguments.calls):
+        user_admin.alter("squidwrd", traits=USER_TRAITS)
+    user_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(arguments.calls):
+        resource_admin.alter("tstres01", "elijtest", traits=RESOURCE_TRAITS)
+    resource_time = time.perf_counter() - start
+    start = time.perf_counter()
+    for _ in range(arguments.calls):
+        user_admin.alter("squidwrd", traits=OMVS_TRAITS)
+    omvs_time = time.perf_counter() - start
+    prepared_alter = user_admin.prepare("alter", list(OMVS_TRAITS))
+    start = time.perf_counter()
+    for _ in range(arguments.calls):
+        prepared_alter.run("squidwrd", traits=OMVS_TRAITS)
+    prepared_time = time.perf_counter() - start
+
+    print(f"calls: {arguments.calls}")
+    print(
+        f"UserAdmin.alter():     {user_time / arguments.calls * 1000000:8.1f} us/call"
+    )
+    print(
+        f"ResourceAdmin.alter(): {resource_time / arguments.calls * 1000000:8.1f} us/call"
+    )
+    print(
+        f"UserAdmin.alter() OMVS: {omvs_time / arguments.calls * 1000000:7.1f} us/call"
+    )
+    print(
+        f"prepared alter OMVS:    {prepared_time / arguments.calls * 1000000:7.1f} us/call"
+    )
+
+
+if __name__ == "__main__":
+    main()
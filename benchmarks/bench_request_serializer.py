@@ -0,0 +1,115 @@
+"""
+Benchmark building and serializing request XML with ElementTree vs the request XML writer.
+
+Builds the same user alter request, with traits from several segments, by constructing
+an ElementTree and serializing it with 'tostring()', the way 'SecurityRequest' used to,
+and with 'SecurityRequest', which writes the XML straight into a string using
+'pyracf.common.request_xml'. The output of both is checked to be byte for byte the same.
+
+Usage:
+    python3 benchmarks/bench_request_serializer.py [--calls N]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+import xml.etree.ElementTree as XMLBuilder
+from typing import Callable
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+SEGMENTS = {
+    "base": {
+        "name": ("Squidward & Tentacles", None),
+        "owner": ("leonard", None),
+        "special": (True, None),
+        "clauth": (["tstcls01", "tstcls02"], "add"),
+    },
+    "omvs": {
+        "uid": (2424, None),
+        "home": ("/u/squidwrd", None),
+        "program": ("/bin/sh", None),
+    },
+    "tso": {
+        "acctnum": ("acct1234", None),
+        "proc": ("proc01", None),
+        "size": (True, "del"),
+    },
+}
+
+
+def build_with_element_tree() -> bytes:
+    """Build and serialize the request by constructing an ElementTree."""
+    racf_request = XMLBuilder.Element("securityrequest")
+    racf_request.attrib = {
+        "xmlns": "http://www.ibm.com/systems/zos/saf",
+        "xmlns:racf": "http://www.ibm.com/systems/zos/racf",
+    }
+    security_definition = XMLBuilder.SubElement(racf_request, "user")
+    security_definition.attrib = {
+        "name": "squidwrd",
+        "operation": "set",
+        "requestid": "UserRequest",
+    }
+    for segment_name, traits in SEGMENTS.items():
+        segment = XMLBuilder.SubElement(security_definition, segment_name)
+        for xml_tag, (value, operation) in traits.items():
+            trait_element = XMLBuilder.SubElement(segment, xml_tag)
+            trait_element.attrib = {"operation": operation or "set"}
+            if isinstance(value, list):
+                trait_element.text = " ".join(value)
+            elif not isinstance(value, bool):
+                trait_element.text = str(value)
+    return XMLBuilder.tostring(racf_request, encoding="utf-8")
+
+
+def build_with_security_request(user_request_class: type) -> bytes:
+    """Build and serialize the request with 'SecurityRequest'."""
+    user_request = user_request_class("squidwrd", "set")
+    for segment_name, traits in SEGMENTS.items():
+        user_request.build_segment(
+            segment_name,
+            {
+                xml_tag: {"value": value, "operation": operation}
+                for xml_tag, (value, operation) in traits.items()
+            },
+            {xml_tag: xml_tag for xml_tag in traits},
+            alter=True,
+        )
+    return user_request.dump_request_xml(encoding="utf-8")
+
+
+def time_function(function: Callable[[], object], calls: int) -> float:
+    """Return the average time in microseconds that 'function' takes."""
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    return (time.perf_counter() - start) / calls * 1000000
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--calls", type=int, default=20000)
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    user_request_class = importlib.import_module("pyracf.user.user_request").UserRequest
+    if build_with_element_tree() != build_with_security_request(user_request_class):
+        raise AssertionError("The request XML writer doesn't match ElementTree.")
+
+    element_tree_time = time_function(build_with_element_tree, arguments.calls)
+    security_request_time = time_function(
+        lambda: build_with_security_request(user_request_class), arguments.calls
+    )
+
+    print(f"calls: {arguments.calls}")
+    print(f"ElementTree:        {element_tree_time:8.1f} us/request")
+    print(f"request XML writer: {security_request_time:8.1f} us/request")
+    print(f"speedup:            {element_tree_time / security_request_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Benchmark parsing result XML into an element tree vs as a stream with 'SecurityResult'.
+
+Parses a multi megabyte listing, like the result of an RLIST of a resource with many
+users on its access list, and a batch result with many security definitions. Each
+is parsed with 'defusedxml.ElementTree.fromstring()' followed by walking the element
+tree, the way 'SecurityResult' used to, and with 'SecurityResult', which extracts
+the result dictionary from the parser's events without building an element tree.
+The result dictionaries of both are checked to be the same.
+
+Also times reading the return code of the result of an alter by parsing the whole
+result vs with 'SecurityResult.get_return_codes()', which reads it from the end of
+the result XML without parsing it.
+
+Usage:
+    python3 benchmarks/bench_result_parser.py [--messages N] [--definitions N] [--calls N]
+        [--alters N]
+"""
+
+import argparse
+import importlib
+import os
+import sys
+import time
+import tracemalloc
+from typing import Callable, Tuple
+
+import defusedxml.ElementTree as XMLParser
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+RESULT_NAMESPACE = "http://www.ibm.com/systems/zos/saf/IRRSMO00Result1"
+
+
+def build_listing_result(messages: int) -> bytes:
+    """Build the result of an RLIST with a message for each access list entry."""
+    access_list = "".join(
+        f"<message>  USER{user:06}     READ          000000</message>"
+        for user in range(messages)
+    )
+    return (
+        f'<securityresult xmlns="{RESULT_NAMESPACE}">'
+        + '<resource name="TESTING" class="FACILITY" operation="listdata" '
+        + 'requestid="ResourceRequest"><command><safreturncode>0</safreturncode>'
+        + "<returncode>0</returncode><reasoncode>0</reasoncode>"
+        + "<image>RLIST FACILITY (TESTING) AUTHUSER</image>"
+        + access_list
+        + "</command></resource><returncode>0</returncode>"
+        + "<reasoncode>0</reasoncode></securityresult>"
+    ).encode("utf-8")
+
+
+def build_batch_result(definitions: int) -> bytes:
+    """Build the result of a batch that alters the OMVS UID of many users."""
+    users = "".join(
+        f'<user name="USER{user:04}" operation="set" requestid="UserRequest{user}">'
+        + "<command><safreturncode>0</safreturncode><returncode>0</returncode>"
+        + f"<reasoncode>0</reasoncode><image>ALTUSER USER{user:04} OMVS (UID({user}))"
+        + "</image></command></user>"
+        for user in range(definitions)
+    )
+    return (
+        f'<securityresult xmlns="{RESULT_NAMESPACE}">'
+        + users
+        + "<returncode>0</returncode><reasoncode>0</reasoncode></securityresult>"
+    ).encode("utf-8")
+
+
+def get_key(tag: str) -> str:
+    """Get the dictionary key of a tag, without its namespace."""
+    key = tag.split("}")[-1]
+    for pascal_case_key in ("returnCode", "reasonCode", "safReturnCode", "errorCode"):
+        if key == pascal_case_key.lower():
+            return pascal_case_key
+    return key
+
+
+def get_value(text: str) -> object:
+    """Convert numeric text to an integer."""
+    try:
+        return int(text)
+    except ValueError:
+        return text
+
+
+def parse_with_element_tree(result_xml: bytes) -> dict:
+    """Parse the result into an element tree, and then walk it."""
+    result = XMLParser.fromstring(result_xml)
+    definition_results = []
+    return_codes = {}
+    for definition in result:
+        key = get_key(definition.tag)
+        if key in ("returnCode", "reasonCode"):
+            return_codes[key] = int(definition.text)
+            continue
+        definition_dictionary = dict(definition.attrib)
+        definition_dictionary["requestId"] = definition_dictionary.pop("requestid")
+        definition_results.append((key, definition_dictionary))
+        definition_dictionary["commands"] = []
+        for command in definition:
+            command_dictionary = {}
+            definition_dictionary["commands"].append(command_dictionary)
+            for item in command:
+                item_key = get_key(item.tag)
+                if item_key == "message":
+                    command_dictionary.setdefault("messages", []).append(item.text)
+                else:
+                    command_dictionary[item_key] = get_value(item.text)
+    result_dictionary = {"securityResult": dict(definition_results[:1])}
+    result_dictionary["securityResult"].update(return_codes)
+    return result_dictionary
+
+
+def measure_function(function: Callable[[], object], calls: int) -> Tuple[float, float]:
+    """
+    Return the average time in milliseconds that 'function' takes,
+    and the peak memory in megabytes that it allocates.
+    """
+    function()
+    start = time.perf_counter()
+    for _ in range(calls):
+        function()
+    elapsed = (time.perf_counter() - start) / calls * 1000
+    tracemalloc.start()
+    function()
+    peak = tracemalloc.get_traced_memory()[1] / 2**20
+    tracemalloc.stop()
+    return (elapsed, peak)
+
+
+def main():
+    """Benchmark entrypoint."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--messages", type=int, default=60000)
+    parser.add_argument("--definitions", type=int, default=10000)
+    parser.add_argument("--calls", type=int, default=5)
+    parser.add_argument("--alters", type=int, default=20000)
+    arguments = parser.parse_args()
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    security_result_class = importlib.import_module(
+        "pyracf.common.security_result"
+    ).SecurityResult
+
+    for name, result_xml in (
+        (
+            f"listing, {arguments.messages} messages",
+            build_listing_result(arguments.messages),
+        ),
+        (
+            f"batch, {arguments.definitions} definitions",
+            build_batch_result(arguments.definitions),
+        ),
+    ):
+        if (
+            parse_with_element_tree(result_xml)
+            != security_result_class(result_xml).get_result_dictionary()
+        ):
+            raise AssertionError("'SecurityResult' doesn't match the element tree.")
+        (element_tree_time, element_tree_peak) = measure_function(
+            lambda result_xml=result_xml: parse_with_element_tree(result_xml),
+            arguments.calls,
+        )
+        (streaming_time, streaming_peak) = measure_function(
+            lambda result_xml=result_xml: security_result_class(
+                result_xml
+            ).get_result_dictionary()["securityResult"],
+            arguments.calls,
+        )
+        print(f"{name} ({len(result_xml) / 2**20:.1f} MiB of result XML)")
+        print(
+            f"  element tree:    {element_tree_time:8.1f} ms/result "
+            + f"{element_tree_peak:6.1f} MiB peak"
+        )
+        print(
+            f"  SecurityResult:  {streaming_time:8.1f} ms/result "
+            + f"{streaming_peak:6.1f} MiB peak"
+        )
+        print(
+            f"  speedup:         {element_tree_time / streaming_time:8.2f}x "
+            + f"{element_tree_peak / streaming_peak:6.2f}x less memory"
+        )
+
+    alter_result_xml = build_batch_result(1)
+    (parse_time, _) = measure_function(
+        lambda: security_result_class(alter_result_xml).get_result_dictionary()[
+            "securityResult"
+        ]["returnCode"],
+        arguments.alters,
+    )
+    (scan_time, _) = measure_function(
+        lambda: security_result_class(alter_result_xml).get_return_codes()[0],
+        arguments.alters,
+    )
+    print(f"alter, return code only ({arguments.alters} results)")
+    print(f"  parsed result:   {parse_time * 1000:8.1f} us/result")
+    print(f"  return code scan:{scan_time * 1000:8.1f} us/result")
+    print(f"  speedup:         {parse_time / scan_time:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
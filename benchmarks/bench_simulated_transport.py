@@ -0,0 +1,67 @@
+"""
+End to end throughput benchmark using the in-memory RACF simulator.
+
+Each call goes through the whole pyRACF pipeline: 'UserAdmin' builds an alter request,
+'SimulatedTransport' applies it to an in-memory RACF database and builds the result XML
+the way IRRSMO00 does, and 'UserAdmin' parses the result. Every call waits for a fixed
+latency to approximate the time RACF takes to process requests. The calls are made
+serially and then from a thread pool to show how throughput scales with threads.
+
+Usage:
+    python3 benchmarks/bench_simulated_transport.py [--calls N] [--threads T] [--latency-us U]
+"""
+
+import importlib
+import os
+import sys
+import threading
+
+from harness import parse_arguments, time_calls
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+
+
+def run_calls(transport, calls: int, threads: int) -> float:
+    """Make 'calls' alter requests using 'threads' threads and return the elapsed time."""
+    user_admin_class = importlib.import_module("pyracf").UserAdmin
+
+    class ThreadUserAdmin(threading.local):
+        """Admin objects hold per-request state, so each thread gets its own."""
+
+        def __init__(self) -> None:
+            self.user_admin = user_admin_class(transport=transport)
+
+    thread_user_admin = ThreadUserAdmin()
+    return time_calls(
+        lambda call: thread_user_admin.user_admin.alter(
+            "squidwrd", traits={"omvs:uid": 2424 + call}
+        ),
+        calls,
+        threads,
+    )
+
+
+def main():
+    """Benchmark entrypoint."""
+    arguments = parse_arguments(__doc__)
+
+    sys.path.insert(0, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+    transport = importlib.import_module("pyracf.simulator").SimulatedTransport(
+        latency=arguments.latency_us / 1000000
+    )
+    importlib.import_module("pyracf").UserAdmin(transport=transport).add(
+        "squidwrd", traits={}
+    )
+    serial_time = run_calls(transport, arguments.calls, 1)
+    threaded_time = run_calls(transport, arguments.calls, arguments.threads)
+
+    print(f"simulated latency: {arguments.latency_us} us, calls: {arguments.calls}")
+    print(f"serial:     {arguments.calls / serial_time:10.1f} calls/s")
+    print(
+        f"{arguments.threads:>2} threads: {arguments.calls / threaded_time:10.1f} calls/s"
+    )
+    print(f"speedup:    {serial_time / threaded_time:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Threaded throughput benchmark for the cpyracf extension.
+
+The cpyracf extension is built against a local IRRSMO64 stub that sleeps for a fixed
+latency to simulate RACF processing time. Each call builds a request with 'UserAdmin' in
+'generate_requests_only' mode, makes the call through 'call_irrsmo00()' and parses the
+response with 'SecurityResult'. The calls are made serially and then from a thread pool.
+Since the extension releases the GIL while IRRSMO64 runs, other threads keep building
+requests and parsing results while a call is in progress, so the stub calls overlap and
+throughput scales with the number of threads.
+
+Usage:
+    python3 benchmarks/bench_threaded_irrsmo00.py [--calls N] [--threads T] [--latency-us U]
+"""
+
+import ctypes
+import importlib
+import os
+import sys
+import tempfile
+import threading
+
+from harness import parse_arguments, time_calls
+from stub_extension import BENCHMARKS_DIRECTORY, build_stub_extension
+
+
+def run_calls(calls: int, threads: int) -> float:
+    """Make 'calls' alter requests using 'threads' threads and return the elapsed time."""
+    call_irrsmo00 = importlib.import_module("cpyracf").call_irrsmo00
+    user_admin_class = importlib.import_module("pyracf").UserAdmin
+    security_result_class = importlib.import_module(
+        "pyracf.common.security_result"
+    ).SecurityResult
+    thread_local = threading.local()
+
+    def alter_user(_: int) -> dict:
+        # Admin objects hold per-request state, so each thread gets its own.
+        if not hasattr(thread_local, "user_admin"):
+            thread_local.user_admin = user_admin_class(generate_requests_only=True)
+        request_xml = thread_local.user_admin.alter(
+            "squidwrd", traits={"omvs:uid": 2424}
+        )
+        response_xml = call_irrsmo00(
+            xml_str=request_xml, xml_len=len(request_xml), opts=3
+        )[0]
+        return security_result_class(
+            response_xml.decode("utf-8")
+        ).get_result_dictionary()
+
+    return time_calls(alter_user, calls, threads)
+
+
+def main():
+    """Benchmark entrypoint."""
+    arguments = parse_arguments(__doc__)
+
+    os.environ["PYRACF_STUB_LATENCY_US"] = str(arguments.latency_us)
+    with tempfile.TemporaryDirectory() as build_directory:
+        extension = build_stub_extension(build_directory)
+        sys.path.insert(0, build_directory)
+        sys.path.insert(1, os.path.join(BENCHMARKS_DIRECTORY, ".."))
+        stub = ctypes.CDLL(extension)
+        max_in_flight = ctypes.c_int.in_dll(stub, "irrsmo64_stub_max_in_flight")
+
+        serial_time = run_calls(arguments.calls, 1)
+        serial_max_in_flight = max_in_flight.value
+        max_in_flight.value = 0
+        threaded_time = run_calls(arguments.calls, arguments.threads)
+        threaded_max_in_flight = max_in_flight.value
+
+    print(f"stub latency: {arguments.latency_us} us, calls: {arguments.calls}")
+    print(
+        f"serial:     {arguments.calls / serial_time:10.1f} calls/s"
+        + f"  (max calls in flight: {serial_max_in_flight})"
+    )
+    print(
+        f"{arguments.threads:>2} threads: {arguments.calls / threaded_time:10.1f} calls/s"
+        + f"  (max calls in flight: {threaded_max_in_flight})"
+    )
+    print(f"speedup:    {serial_time / threaded_time:10.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+"""Command line and timing helpers shared by the benchmarks."""
+
+import argparse
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+
+def time_calls(function: Callable[[int], object], calls: int, threads: int) -> float:
+    """Call 'function' 'calls' times using 'threads' threads and return the elapsed time."""
+    start = time.perf_counter()
+    if threads == 1:
+        for call in range(calls):
+            function(call)
+    else:
+        with ThreadPoolExecutor(max_workers=threads) as executor:
+            list(executor.map(function, range(calls)))
+    return time.perf_counter() - start
+
+
+def parse_arguments(docstring: str) -> argparse.Namespace:
+    """Parse the '--calls', '--threads' and '--latency-us' options of a benchmark."""
+    parser = argparse.ArgumentParser(description=docstring.split("\n\n", maxsplit=1)[0])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--latency-us", type=int, default=2000)
+    return parser.parse_args()
@@ -0,0 +1,70 @@
+/*
+ * Local stand-in for the IRRSMO64 RACF callable service.
+ *
+ * This header is force included ahead of 'pyracf/common/irrsmo00.c' (gcc -include)
+ * so that the cpyracf extension can be built and driven off z/OS for benchmarking.
+ * It is never used by the real build.
+ *
+ * OS linkage passes arguments that are not pointers by reference, so the
+ * IRRSMO64 macro below takes the address of the response length. The return
+ * and reason codes are already passed as pointers by 'irrsmo00.c'.
+ *
+ * The canned response is provided by 'irrsmo64_stub_response.h', which is
+ * generated by the benchmark build helper.
+ */
+#include <stdlib.h>
+#include <string.h>
+#include <time.h>
+
+#include "irrsmo64_stub_response.h"
+
+/* Number of stub calls currently in progress and the highest value observed. */
+int irrsmo64_stub_in_flight = 0;
+int irrsmo64_stub_max_in_flight = 0;
+
+static void irrsmo64_stub(
+    unsigned int *saf_rc,
+    unsigned int *racf_rc,
+    unsigned int *racf_rsn,
+    char *req_handle,
+    unsigned int *rsp_len,
+    char *rsp
+) {
+    int in_flight = __atomic_add_fetch(&irrsmo64_stub_in_flight, 1, __ATOMIC_SEQ_CST);
+    int max_in_flight = __atomic_load_n(&irrsmo64_stub_max_in_flight, __ATOMIC_SEQ_CST);
+    while (in_flight > max_in_flight &&
+           !__atomic_compare_exchange_n(&irrsmo64_stub_max_in_flight, &max_in_flight,
+                                        in_flight, 0, __ATOMIC_SEQ_CST, __ATOMIC_SEQ_CST)) {
+    }
+
+    // Simulate the time RACF spends processing the request.
+    const char *latency = getenv("PYRACF_STUB_LATENCY_US");
+    long latency_us = latency ? atol(latency) : 1000;
+    struct timespec delay = {latency_us / 1000000, (latency_us % 1000000) * 1000};
+    nanosleep(&delay, NULL);
+
+    // Like IRRSMO00, responses that do not fit in the response area are returned
+    // over multiple calls, with the current position saved in the request handle.
+    size_t offset = 0;
+    memcpy(&offset, req_handle, sizeof(offset));
+    size_t length = sizeof(stub_response) - offset;
+    if (length > *rsp_len) {
+        length = *rsp_len;
+    }
+    memcpy(rsp, stub_response + offset, length);
+    offset += length;
+    if (offset == sizeof(stub_response)) {
+        offset = 0;
+    }
+    memcpy(req_handle, &offset, sizeof(offset));
+    *saf_rc = 0;
+    *racf_rc = 0;
+    *racf_rsn = 0;
+
+    __atomic_sub_fetch(&irrsmo64_stub_in_flight, 1, __ATOMIC_SEQ_CST);
+}
+
+#define IRRSMO64(work_area, alet1, saf_rc, alet2, racf_rc, alet3, racf_rsn,   \
+                 num_parms, fn, opts, xml_len, xml, req_handle, userid, acee,  \
+                 rsp_len, rsp)                                                 \
+    irrsmo64_stub((saf_rc), (racf_rc), (racf_rsn), (req_handle), &(rsp_len), (rsp))
@@ -0,0 +1,64 @@
+"""Build the cpyracf extension against a local IRRSMO64 stub for off-platform benchmarks."""
+
+import os
+import subprocess
+import sysconfig
+
+BENCHMARKS_DIRECTORY = os.path.dirname(os.path.abspath(__file__))
+IRRSMO00_C = os.path.join(BENCHMARKS_DIRECTORY, "..", "pyracf", "common", "irrsmo00.c")
+
+ALTER_USER_RESULT_XML = (
+    '<?xml version="1.0" encoding="UTF-8"?>'
+    + '<securityresult xmlns="http://www.ibm.com/systems/zos/saf/IRRSMO00Result1">'
+    + '<user name="SQUIDWRD" operation="set" requestid="UserRequest">'
+    + "<command>"
+    + "<safreturncode>0</safreturncode>"
+    + "<returncode>0</returncode>"
+    + "<reasoncode>0</reasoncode>"
+    + "<image>ALTUSER SQUIDWRD  OMVS     (UID         (2424))</image>"
+    + "</command>"
+    + "</user>"
+    + "<returncode>0</returncode>"
+    + "<reasoncode>0</reasoncode>"
+    + "</securityresult>"
+)
+
+
+def build_stub_extension(
+    build_directory: str, response_xml: str = ALTER_USER_RESULT_XML
+) -> str:
+    """
+    Compile 'irrsmo00.c' with gcc, replacing IRRSMO64 with the stub
+    in 'irrsmo64_stub.h', and return the path of the shared object.
+    The stub always responds with 'response_xml'.
+    """
+    # Off z/OS request XML is dumped as UTF-8, so the stub responds in kind.
+    response_bytes = response_xml.encode("utf-8")
+    response_header = os.path.join(build_directory, "irrsmo64_stub_response.h")
+    with open(response_header, "w", encoding="utf-8") as response_header_file:
+        response_header_file.write(
+            "static const unsigned char stub_response[] = {"
+            + ",".join(str(byte) for byte in response_bytes)
+            + "};\n"
+        )
+    extension = os.path.join(
+        build_directory, f"cpyracf{sysconfig.get_config_var('EXT_SUFFIX')}"
+    )
+    subprocess.run(
+        [
+            "gcc",
+            "-shared",
+            "-fPIC",
+            "-O2",
+            "-Wno-unknown-pragmas",
+            f"-I{sysconfig.get_paths()['include']}",
+            f"-I{build_directory}",
+            "-include",
+            os.path.join(BENCHMARKS_DIRECTORY, "irrsmo64_stub.h"),
+            IRRSMO00_C,
+            "-o",
+            extension,
+        ],
+        check=True,
+    )
+    return extension
@@ -3,7 +3,9 @@
 from typing import Union
 
 from pyracf.access.access_request import AccessRequest
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 
 class AccessAdmin(SecurityAdmin):
@@ -37,9 +39,10 @@ class AccessAdmin(SecurityAdmin):
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "permission",
@@ -47,6 +50,7 @@ class AccessAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -84,7 +88,7 @@ class AccessAdmin(SecurityAdmin):
         self._add_traits_directly_to_request_xml_with_no_segments(
             access_request, alter=True
         )
-        return self._make_request(access_request)
+        return self._make_request(access_request, deferrable=True)
 
     def delete(
         self,
@@ -0,0 +1,20 @@
+"""Exception to use when a security request is abandoned because its deadline passed."""
+
+
+class DeadlineExceededError(Exception):
+    """
+    Raised when the deadline set by 'call_deadline()' passes before a security
+    request gets its turn to be made to IRRSMO00. The request is never made.
+    """
+
+    def __init__(self, queue_wait_time: float) -> None:
+        self.message = (
+            "The deadline for the security request passed before it could be made "
+            + "to IRRSMO00, so it was abandoned."
+        )
+        self.queue_wait_time = queue_wait_time
+        self.message += f"\n\nQueue Wait Time: {queue_wait_time:.6f} seconds"
+        self.message = f"({self.__class__.__name__}) {self.message}"
+
+    def __str__(self) -> str:
+        return self.message
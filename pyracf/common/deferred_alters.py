@@ -0,0 +1,139 @@
+"""Alters that are held back and merged by profile until a unit of work ends."""
+
+import contextvars
+from typing import Callable, List, Union
+
+from .downstream_fatal_error import DownstreamFatalError
+from .security_request import SecurityRequest
+from .security_request_error import SecurityRequestError
+
+# The 'DeferredAlters' of each admin in a 'deferred()' block in the current thread.
+DEFERRED_ALTERS = contextvars.ContextVar("deferred_alters", default=None)
+
+
+def get_deferred_alters(admin) -> Union["DeferredAlters", None]:
+    """Get the alters that 'admin' is holding back, or None if it isn't deferring them."""
+    deferred_alters = DEFERRED_ALTERS.get()
+    if deferred_alters is None:
+        return None
+    return deferred_alters.get(admin)
+
+
+def merge_segment_traits(segment_traits: dict, other_segment_traits: dict) -> dict:
+    """Merge two request dictionaries, which are dictionaries of segment traits."""
+    merged_segment_traits = dict(segment_traits)
+    for segment, traits in other_segment_traits.items():
+        merged_segment_traits[segment] = {**segment_traits.get(segment, {}), **traits}
+    return merged_segment_traits
+
+
+class DeferredResult(dict):
+    """The result of an alter that is held back, which is filled in when it is made."""
+
+
+class DeferredAlters:
+    """
+    Hold back the alter requests of an admin, including the ones that its
+    convenience setters make, and merge the requests to the same profile into
+    one request when they are flushed. A request is only merged into the last
+    request held back for the same profile if they don't set any of the same
+    traits, so that the merged request does the same thing as the requests
+    that it replaces.
+    """
+
+    def __init__(self, make_request: Callable, generate_requests_only: bool) -> None:
+        self.__make_request = make_request
+        self.__generate_requests_only = generate_requests_only
+        self.__pending = []
+        # The result of each request that has been made, in the order they were made.
+        self.results = []
+
+    def hold(
+        self,
+        security_request: SecurityRequest,
+        irrsmo00_options: int,
+        redact_strings: List[str],
+        segment_traits: dict,
+    ) -> Union[DeferredResult, bytes]:
+        """
+        Hold back an alter request and return the 'DeferredResult' that its result
+        is copied into when it is made, or empty bytes in generate requests only mode.
+        """
+        profile = (
+            security_request._security_definition.tag,
+            dict(security_request._security_definition.attrib),
+            irrsmo00_options,
+        )
+        # Adding to and removing from the same trait also conflict.
+        trait_names = {
+            trait.split(":", 1)[1] if trait.startswith(("add:", "remove:")) else trait
+            for traits in segment_traits.values()
+            for trait in traits
+        }
+        pending_request = self.__get_pending_request(profile, trait_names)
+        if pending_request is None:
+            pending_request = {
+                "profile": profile,
+                "securityRequest": security_request,
+                "redactStrings": [],
+                "segmentTraits": {},
+                "traitNames": set(),
+                "results": [],
+            }
+            self.__pending.append(pending_request)
+        else:
+            pending_request["securityRequest"]._merge_segments(security_request)
+        pending_request["redactStrings"] += redact_strings
+        pending_request["segmentTraits"] = merge_segment_traits(
+            pending_request["segmentTraits"], segment_traits
+        )
+        pending_request["traitNames"] |= trait_names
+        result = DeferredResult()
+        pending_request["results"].append(result)
+        if self.__generate_requests_only:
+            return b""
+        return result
+
+    def flush(self) -> None:
+        """
+        Make the requests that have been held back, in the order they were held back.
+        A request that fails doesn't stop the requests to other profiles from being
+        made. The result of a request that fails with a 'SecurityRequestError' is
+        copied into its 'DeferredResult' like any other, and the first error that
+        is raised is raised again once every request has been made.
+        """
+        (pending, self.__pending) = (self.__pending, [])
+        first_error = None
+        for pending_request in pending:
+            (_, _, irrsmo00_options) = pending_request["profile"]
+            try:
+                result = self.__make_request(
+                    pending_request["securityRequest"],
+                    irrsmo00_options,
+                    pending_request["redactStrings"],
+                    pending_request["segmentTraits"],
+                )
+            except (SecurityRequestError, DownstreamFatalError) as error:
+                first_error = first_error or error
+                if not isinstance(error, SecurityRequestError):
+                    # There is no result to copy into the 'DeferredResult'.
+                    continue
+                result = error.result
+            self.results.append(result)
+            if isinstance(result, dict):
+                for deferred_result in pending_request["results"]:
+                    deferred_result.update(result)
+        if first_error is not None:
+            raise first_error
+
+    def __get_pending_request(
+        self, profile: tuple, trait_names: set
+    ) -> Union[dict, None]:
+        """Get the pending request to the same profile that a request can be merged into."""
+        for pending_request in reversed(self.__pending):
+            if pending_request["profile"] != profile:
+                continue
+            if trait_names & pending_request["traitNames"]:
+                return None
+            return pending_request
+        return None
@@ -0,0 +1,25 @@
+"""Exception to use when IRRSMO00 fails before it is able to return result XML."""
+
+
+class DownstreamFatalError(Exception):
+    """
+    Raised when IRRSMO00 returns a non-zero SAF return code without any result XML.
+    """
+
+    def __init__(
+        self, saf_return_code: int, racf_return_code: int, racf_reason_code: int
+    ) -> None:
+        self.message = "IRRSMO00 failed before it could process the security request."
+        self.saf_return_code = saf_return_code
+        self.racf_return_code = racf_return_code
+        self.racf_reason_code = racf_reason_code
+        self.message += (
+            f"\n\nSAF Return Code: {saf_return_code}"
+            + f"\nRACF Return Code: {racf_return_code}"
+            + f"\nRACF Reason Code: {racf_reason_code}"
+            + "\n\nSee the IRRSMO00 documentation for the meaning of these codes."
+        )
+        self.message = f"({self.__class__.__name__}) {self.message}"
+
+    def __str__(self) -> str:
+        return self.message
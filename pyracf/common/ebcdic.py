@@ -0,0 +1,78 @@
+"""Table driven conversion between cp1047 (EBCDIC) and text."""
+
+# Each cp1047 byte maps to exactly one Latin-1 character, so converting
+# between the two is a single 'bytes.translate()' pass plus a Latin-1
+# encode or decode, both of which are much cheaper than a charmap codec.
+try:
+    _CP1047_CHARACTERS = bytes(range(256)).decode("cp1047")
+except LookupError:
+    # The cp1047 codec is only shipped with Python on z/OS. Everywhere else,
+    # build IBM-1047 from cp037, which only differs in where it puts these
+    # six characters.
+    _CP1047_CHARACTERS = "".join(
+        {
+            0x5F: "^",
+            0xAD: "[",
+            0xB0: "¬",
+            0xBA: "Ý",
+            0xBB: "¨",
+            0xBD: "]",
+        }.get(byte, character)
+        for byte, character in enumerate(bytes(range(256)).decode("cp037"))
+    )
+
+CP1047_TO_LATIN1 = bytes.maketrans(
+    bytes(range(256)), _CP1047_CHARACTERS.encode("latin-1")
+)
+LATIN1_TO_CP1047 = bytes.maketrans(
+    _CP1047_CHARACTERS.encode("latin-1"), bytes(range(256))
+)
+
+# ElementTree writes this declaration when it serializes XML as cp1047.
+CP1047_XML_DECLARATION = "<?xml version='1.0' encoding='cp1047'?>\n"
+
+
+def encode_cp1047(text: str, errors: str = "strict") -> bytes:
+    """
+    Encode text as cp1047 bytes. 'errors' is handled the same way as it is by
+    'str.encode()', which works because cp1047 and Latin-1 share a character set.
+    """
+    try:
+        return text.encode("latin-1", errors).translate(LATIN1_TO_CP1047)
+    except UnicodeEncodeError as encode_error:
+        raise UnicodeEncodeError(
+            "cp1047",
+            encode_error.object,
+            encode_error.start,
+            encode_error.end,
+            "character maps to <undefined>",
+        ) from None
+
+
+def decode_cp1047(data: bytes) -> str:
+    """Decode cp1047 bytes as text."""
+    return data.translate(CP1047_TO_LATIN1).decode("latin-1")
+
+
+def strip_xml_declaration(data: bytes) -> bytes:
+    """
+    Remove the XML declaration from XML bytes. IRRSMO00 declares its
+    result XML as IBM-1047, which is an encoding the parser doesn't know.
+    """
+    if data.startswith(b"<?xml"):
+        return data[data.index(b"?>") + 2 :]
+    return data
+
+
+def cp1047_to_parser_bytes(data: bytes) -> bytes:
+    """
+    Convert cp1047 encoded XML into bytes that the XML parser can read directly.
+    Parsing text makes the parser encode it as utf-8 again, so handing it bytes
+    skips both the decode and the encode. ASCII only documents, which is almost
+    every IRRSMO00 result, are handed over as utf-8, which the parser reads the
+    fastest. Anything else is handed over as Latin-1.
+    """
+    data = strip_xml_declaration(data.translate(CP1047_TO_LATIN1))
+    if data.isascii():
+        return data
+    return b'<?xml version="1.0" encoding="ISO-8859-1"?>' + data
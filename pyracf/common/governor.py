@@ -0,0 +1,246 @@
+"""Limit how many IRRSMO00 calls are in flight at the same time."""
+
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Iterator, Union
+
+from .deadline_exceeded_error import DeadlineExceededError
+from .ebcdic import encode_cp1047
+
+# Request XML is dumped as cp1047 on z/OS and as utf-8 everywhere else.
+LISTDATA_OPERATIONS = (
+    b'operation="listdata"',
+    encode_cp1047('operation="listdata"'),
+)
+
+# Calls waiting in the same lane are let through in this order of priority.
+PRIORITIES = ("interactive", "bulk")
+
+# Priority set by 'call_priority()' for calls made in the current thread.
+CALL_PRIORITY = contextvars.ContextVar("call_priority", default=None)
+
+# Deadline set by 'call_deadline()' for calls made in the current thread,
+# in the same units as 'time.perf_counter()'.
+CALL_DEADLINE = contextvars.ContextVar("call_deadline", default=None)
+
+
+def get_lane(request_xml: bytes) -> str:
+    """Return 'read' for 'listdata' requests and 'write' for everything else."""
+    if any(operation in request_xml for operation in LISTDATA_OPERATIONS):
+        return "read"
+    return "write"
+
+
+def check_priority(priority: str) -> None:
+    """Raise ValueError if 'priority' is not one of the call priorities."""
+    if priority not in PRIORITIES:
+        raise ValueError(
+            f"'{priority}' is not a valid priority. Use one of: {', '.join(PRIORITIES)}."
+        )
+
+
+@contextmanager
+def call_priority(priority: str) -> Iterator[None]:
+    """
+    Make every IRRSMO00 call in the current thread with 'priority', whatever
+    the priority of the admin making the call is, until the block exits.
+    """
+    check_priority(priority)
+    token = CALL_PRIORITY.set(priority)
+    try:
+        yield
+    finally:
+        CALL_PRIORITY.reset(token)
+
+
+@contextmanager
+def call_deadline(timeout: float) -> Iterator[None]:
+    """
+    Abandon every IRRSMO00 call in the current thread that hasn't been made
+    within 'timeout' seconds of entering the block, and raise a
+    'DeadlineExceededError' instead. Calls that have already been made when the
+    deadline passes are not interrupted. When blocks are nested, the earliest
+    deadline applies.
+    """
+    deadline = time.perf_counter() + timeout
+    outer_deadline = CALL_DEADLINE.get()
+    if outer_deadline is not None:
+        deadline = min(deadline, outer_deadline)
+    token = CALL_DEADLINE.set(deadline)
+    try:
+        yield
+    finally:
+        CALL_DEADLINE.reset(token)
+
+
+class Governor:
+    """
+    Limit the number of IRRSMO00 calls that are in flight at the same time.
+    Reads ('listdata' requests) and writes ('set' and 'del' requests) have
+    separate limits so that lookups keep flowing while updates are throttled.
+    Calls over a limit wait their turn in first come, first served order,
+    except that waiting 'interactive' calls go before waiting 'bulk' calls.
+    So that bulk work still makes progress while interactive calls keep
+    arriving, a bulk call that has waited for 'starvation_timeout' seconds
+    goes before the interactive calls.
+    Calls whose deadline passes while they wait are abandoned.
+    A limit of None means that calls in that lane are never held back.
+    """
+
+    def __init__(
+        self,
+        read_limit: Union[int, None] = None,
+        write_limit: Union[int, None] = None,
+        starvation_timeout: float = 1.0,
+    ) -> None:
+        self.starvation_timeout = starvation_timeout
+        self.__condition = threading.Condition()
+        self.__limits = {"read": None, "write": None}
+        self.__queues = {
+            lane: {priority: deque() for priority in PRIORITIES}
+            for lane in ["read", "write"]
+        }
+        self.__in_flight = {"read": 0, "write": 0}
+        self.__statistics = {}
+        self.set_limits(read_limit=read_limit, write_limit=write_limit)
+        self.reset_statistics()
+
+    def set_limits(
+        self,
+        read_limit: Union[int, None] = None,
+        write_limit: Union[int, None] = None,
+    ) -> None:
+        """Set the maximum number of reads and writes that can be in flight."""
+        for limit in [read_limit, write_limit]:
+            if limit is not None and limit < 1:
+                raise ValueError("Limits must be at least 1 or None for no limit.")
+        with self.__condition:
+            self.__limits = {"read": read_limit, "write": write_limit}
+            # Raising a limit may let waiting calls through.
+            self.__condition.notify_all()
+
+    def get_statistics(self) -> dict:
+        """
+        Return the limit and the number of calls in flight for each lane, and
+        the number of calls waiting, the number of calls made and how long they
+        waited in seconds, for each lane and for each priority within the lane.
+        """
+        with self.__condition:
+            return {
+                lane: {
+                    "limit": self.__limits[lane],
+                    "inFlight": self.__in_flight[lane],
+                    "maxInFlight": self.__statistics[lane]["maxInFlight"],
+                    **self.__get_queue_statistics(lane, PRIORITIES),
+                    **{
+                        priority: self.__get_queue_statistics(lane, (priority,))
+                        for priority in PRIORITIES
+                    },
+                }
+                for lane in ["read", "write"]
+            }
+
+    def reset_statistics(self) -> None:
+        """Reset the call counts and queue wait times."""
+        with self.__condition:
+            self.__statistics = {
+                lane: {
+                    "maxInFlight": self.__in_flight[lane],
+                    **{
+                        priority: {
+                            "calls": 0,
+                            "expired": 0,
+                            "queueWaitTime": 0.0,
+                            "maxQueueWaitTime": 0.0,
+                        }
+                        for priority in PRIORITIES
+                    },
+                }
+                for lane in ["read", "write"]
+            }
+
+    @contextmanager
+    def call_slot(
+        self,
+        lane: str,
+        priority: str = "interactive",
+        deadline: Union[float, None] = None,
+    ) -> Iterator[None]:
+        """
+        Wait until a call can be made in 'lane' and hold its slot until done.
+        Raise 'DeadlineExceededError' if the call doesn't get a slot by
+        'deadline', which is in the same units as 'time.perf_counter()'.
+        """
+        check_priority(priority)
+        start = time.perf_counter()
+        with self.__condition:
+            self.__wait_for_turn(lane, priority, start, deadline)
+            self.__in_flight[lane] += 1
+            self.__record_call(lane, priority, time.perf_counter() - start)
+        try:
+            yield
+        finally:
+            with self.__condition:
+                self.__in_flight[lane] -= 1
+                self.__condition.notify_all()
+
+    def __wait_for_turn(
+        self, lane: str, priority: str, start: float, deadline: Union[float, None]
+    ) -> None:
+        queue = self.__queues[lane][priority]
+        ticket = (start, object())
+        queue.append(ticket)
+        try:
+            while deadline is None or time.perf_counter() < deadline:
+                if self.__is_turn(lane, ticket):
+                    return
+                if deadline is None:
+                    self.__condition.wait()
+                else:
+                    self.__condition.wait(deadline - time.perf_counter())
+            self.__statistics[lane][priority]["expired"] += 1
+            raise DeadlineExceededError(time.perf_counter() - start)
+        finally:
+            queue.remove(ticket)
+            # The next call in line may be able to go as well.
+            self.__condition.notify_all()
+
+    def __is_turn(self, lane: str, ticket: tuple) -> bool:
+        limit = self.__limits[lane]
+        if limit is not None and self.__in_flight[lane] >= limit:
+            return False
+        interactive = self.__queues[lane]["interactive"]
+        bulk = self.__queues[lane]["bulk"]
+        if bulk and (
+            not interactive
+            or time.perf_counter() - bulk[0][0] >= self.starvation_timeout
+        ):
+            return bulk[0] is ticket
+        return interactive[0] is ticket
+
+    def __record_call(self, lane: str, priority: str, queue_wait_time: float) -> None:
+        statistics = self.__statistics[lane]
+        statistics["maxInFlight"] = max(
+            statistics["maxInFlight"], self.__in_flight[lane]
+        )
+        statistics = statistics[priority]
+        statistics["calls"] += 1
+        statistics["queueWaitTime"] += queue_wait_time
+        statistics["maxQueueWaitTime"] = max(
+            statistics["maxQueueWaitTime"], queue_wait_time
+        )
+
+    def __get_queue_statistics(self, lane: str, priorities: tuple) -> dict:
+        statistics = [self.__statistics[lane][priority] for priority in priorities]
+        return {
+            "waiting": sum(
+                len(self.__queues[lane][priority]) for priority in priorities
+            ),
+            "calls": sum(entry["calls"] for entry in statistics),
+            "expired": sum(entry["expired"] for entry in statistics),
+            "queueWaitTime": sum(entry["queueWaitTime"] for entry in statistics),
+            "maxQueueWaitTime": max(entry["maxQueueWaitTime"] for entry in statistics),
+        }
@@ -1,3 +1,4 @@
+#define PY_SSIZE_T_CLEAN
 #include <Python.h>
 
 #include <unistd.h>
@@ -5,6 +6,11 @@
 #include <stdio.h>
 
 #define BUFFER_SIZE (100000)
+#define MAX_BUFFER_SIZE (64 * 1024 * 1024)
+// A grown response buffer goes back to the base size once this many calls
+// in a row have returned responses that fit in the base size.
+#define IDLE_CALLS_BEFORE_SHRINK (16)
+#define RESPONSE_BUFFER_KEY "cpyracf.response_buffer"
 
 #pragma linkage(IRRSMO64, OS)
 
@@ -13,53 +19,221 @@ typedef struct {
         char str[8];
 } VarStr_T;
 
+typedef struct {
+        char *data;
+        unsigned int size;
+        unsigned int length;
+        // Bytes past 'dirty' are always zero, so only the part of
+        // the buffer used by the last response has to be cleared.
+        unsigned int dirty;
+        unsigned int idle_calls;
+} ResponseBuffer_T;
+
+static int resize_response_buffer(ResponseBuffer_T *rsp, unsigned int size) {
+   // One extra byte is allocated so that the response is always null terminated.
+   char *data = PyMem_RawRealloc(rsp->data, (size_t)size + 1);
+   if (data == NULL) {
+      return 0;
+   }
+   if (size > rsp->size) {
+      memset(data + rsp->size, 0, (size_t)size - rsp->size + 1);
+   } else if (rsp->dirty > size) {
+      rsp->dirty = size;
+   }
+   rsp->data = data;
+   rsp->size = size;
+   return 1;
+}
+
+static void free_response_buffer(PyObject *capsule) {
+   ResponseBuffer_T *rsp = PyCapsule_GetPointer(capsule, RESPONSE_BUFFER_KEY);
+   PyMem_RawFree(rsp->data);
+   PyMem_RawFree(rsp);
+}
+
+static ResponseBuffer_T *get_thread_response_buffer(void) {
+   // Each thread keeps its response buffer in its thread state dictionary, so
+   // the buffer is reused across calls without locking and is freed when the
+   // thread goes away.
+   PyObject *thread_dict = PyThreadState_GetDict();
+   if (thread_dict == NULL) {
+      PyErr_SetString(PyExc_RuntimeError, "unable to get thread state dictionary");
+      return NULL;
+   }
+   PyObject *capsule = PyDict_GetItemString(thread_dict, RESPONSE_BUFFER_KEY);
+   if (capsule != NULL) {
+      return PyCapsule_GetPointer(capsule, RESPONSE_BUFFER_KEY);
+   }
+   ResponseBuffer_T *rsp = PyMem_RawCalloc(1, sizeof(ResponseBuffer_T));
+   if (rsp == NULL) {
+      PyErr_NoMemory();
+      return NULL;
+   }
+   capsule = PyCapsule_New(rsp, RESPONSE_BUFFER_KEY, free_response_buffer);
+   if (capsule == NULL) {
+      PyMem_RawFree(rsp);
+      return NULL;
+   }
+   int rc = PyDict_SetItemString(thread_dict, RESPONSE_BUFFER_KEY, capsule);
+   Py_DECREF(capsule);
+   return rc == 0 ? rsp : NULL;
+}
+
+static int prepare_response_buffer(
+      ResponseBuffer_T *rsp, unsigned int base_size, unsigned int max_size) {
+   if (rsp->size > base_size
+         && (rsp->idle_calls >= IDLE_CALLS_BEFORE_SHRINK || rsp->size > max_size)) {
+      rsp->idle_calls = 0;
+      if (!resize_response_buffer(rsp, base_size)) {
+         return 0;
+      }
+   }
+   if (rsp->size < base_size && !resize_response_buffer(rsp, base_size)) {
+      return 0;
+   }
+   memset(rsp->data, 0, rsp->dirty);
+   rsp->dirty = 0;
+   rsp->length = 0;
+   return 1;
+}
+
+static unsigned int get_response_length(const char *rsp, unsigned int rsp_len) {
+   // Messages in the response can contain null bytes, so the response length
+   // is found by looking for the last non-null byte in the response area.
+   while (rsp_len > 0 && rsp[rsp_len - 1] == '\0') {
+      rsp_len--;
+   }
+   return rsp_len;
+}
+
+static int is_continuation_pending(const char *req_handle) {
+   // IRRSMO00 saves its position in the request handle when the response
+   // does not fit in the response area, so a non-zero request handle
+   // means that there is more output to retrieve.
+   for (int i = 0; i < 64; i++) {
+      if (req_handle[i] != 0) {
+         return 1;
+      }
+   }
+   return 0;
+}
+
 static PyObject* call_irrsmo00(PyObject* self, PyObject* args, PyObject *kwargs) {
-   const unsigned int xml_len;
-   const unsigned int input_opts;
+   unsigned int xml_len = 0;
+   unsigned int input_opts = 1;
+   unsigned int input_rsp_len = BUFFER_SIZE;
+   unsigned int input_max_rsp_len = MAX_BUFFER_SIZE;
    const char *input_xml;
 
-   static char *kwlist[] = {"xml_str", "xml_len", "opts", NULL};
+   static char *kwlist[] = {"xml_str", "xml_len", "opts", "rsp_len", "max_rsp_len", NULL};
 
-    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y|II", kwlist, &input_xml, &xml_len, &input_opts)) {
+    if (!PyArg_ParseTupleAndKeywords(args, kwargs, "y|IIII", kwlist, &input_xml, &xml_len, &input_opts, &input_rsp_len, &input_max_rsp_len)) {
+        return NULL;
+    }
+    if (input_max_rsp_len > MAX_BUFFER_SIZE) {
+        PyErr_Format(PyExc_ValueError, "max_rsp_len must not be larger than %u", MAX_BUFFER_SIZE);
+        return NULL;
+    }
+    if (input_rsp_len == 0 || input_rsp_len > input_max_rsp_len) {
+        PyErr_SetString(PyExc_ValueError, "rsp_len must be between 1 and max_rsp_len");
         return NULL;
     }
 
+    ResponseBuffer_T *rsp = get_thread_response_buffer();
+    if (rsp == NULL) {
+        return NULL;
+    }
+    if (!prepare_response_buffer(rsp, input_rsp_len, input_max_rsp_len)) {
+        return PyErr_NoMemory();
+    }
 
     char work_area[1024];
     char req_handle[64] = { 0 };
     VarStr_T userid = { 0, {0}};
     unsigned int alet = 0;
     unsigned int acee = 0;
-    char rsp[BUFFER_SIZE+1];
-    memset(rsp, 0, BUFFER_SIZE);
     unsigned int saf_rc=0, racf_rc=0, racf_rsn=0;
-    unsigned int num_parms=17, fn=1, opts = input_opts, rsp_len = sizeof(rsp)-1;
-
-    IRRSMO64(
-        work_area, 
-        alet, 
-        saf_rc, 
-        alet, 
-        racf_rc, 
-        alet, 
-        racf_rsn, 
-        num_parms, 
-        fn, 
-        opts, 
-        xml_len, 
-        input_xml, 
-        req_handle, 
-        userid, 
-        acee, 
-        rsp_len, 
-        rsp
-    );
-
-   return Py_BuildValue("y", rsp);
+    unsigned int num_parms=17, fn=1, opts = input_opts;
+    int out_of_memory = 0;
+    int too_large = 0;
+
+    // IRRSMO64 only works with the C buffers above and never touches Python objects,
+    // so the GIL can be released while RACF processes the request. 'input_xml' stays
+    // valid since the bytes object it points to is owned by 'args' for the whole call,
+    // and the response buffer belongs to this thread.
+    Py_BEGIN_ALLOW_THREADS
+    for (;;) {
+        // Each call writes its part of the response right after the part
+        // returned by the previous call, so the response ends up in one piece.
+        char *rsp_chunk = rsp->data + rsp->length;
+        unsigned int rsp_len = rsp->size - rsp->length;
+        // The return and reason codes are passed as pointers so that IRRSMO64
+        // updates these variables rather than temporary copies of them.
+        IRRSMO64(
+            work_area, 
+            alet, 
+            &saf_rc, 
+            alet, 
+            &racf_rc, 
+            alet, 
+            &racf_rsn, 
+            num_parms, 
+            fn, 
+            opts, 
+            xml_len, 
+            input_xml, 
+            req_handle, 
+            userid, 
+            acee, 
+            rsp_len, 
+            rsp_chunk
+        );
+        unsigned int rsp_chunk_len = get_response_length(rsp_chunk, rsp_len);
+        rsp->length += rsp_chunk_len;
+        rsp->dirty = rsp->length;
+        if (rsp_chunk_len < rsp_len || !is_continuation_pending(req_handle)) {
+            break;
+        }
+        // The response area was filled and there is more output, so grow the
+        // buffer and call again with the same request handle. The buffer keeps
+        // its new size, so similar responses fit in a single call from now on.
+        if (rsp->size >= input_max_rsp_len) {
+            too_large = 1;
+            break;
+        }
+        unsigned int size = rsp->size > input_max_rsp_len / 2 ? input_max_rsp_len : rsp->size * 2;
+        if (!resize_response_buffer(rsp, size)) {
+            out_of_memory = 1;
+            break;
+        }
+    }
+    Py_END_ALLOW_THREADS
+
+    if (rsp->length > input_rsp_len) {
+        rsp->idle_calls = 0;
+    } else {
+        rsp->idle_calls++;
+    }
+    if (too_large) {
+        PyErr_Format(PyExc_OverflowError, "response is larger than %u bytes", input_max_rsp_len);
+        return NULL;
+    }
+    if (out_of_memory) {
+        return PyErr_NoMemory();
+    }
+    // Build the response from its exact length so that null bytes in
+    // messages don't cut it short, and return the SAF/RACF return and
+    // reason codes so that the caller can check them without parsing.
+    return Py_BuildValue(
+        "(y#III)", rsp->data, (Py_ssize_t)rsp->length, saf_rc, racf_rc, racf_rsn);
 }
 
 static char call_irrsmo00_docs[] =
-   "call_irrsmo00(input_xml: bytes, xml_len: uint, opts: uint): Returns an XML response from the IRRSMO00 RACF Callable Service.\n";
+   "call_irrsmo00(input_xml: bytes, xml_len: uint, opts: uint, rsp_len: uint, max_rsp_len: uint): Returns a tuple containing\n"
+   "an XML response from the IRRSMO00 RACF Callable Service, the SAF return code, the RACF return code and the RACF reason code.\n"
+   "rsp_len is the base size of the per-thread response buffer given to IRRSMO00. Responses that do not fit are retrieved\n"
+   "in multiple calls using the same request handle and returned as one complete response, growing the buffer up to\n"
+   "max_rsp_len bytes. A grown buffer shrinks back to rsp_len bytes once it has not been needed for a while.\n";
 
 static PyMethodDef cpyracf_methods[] = {
    {"call_irrsmo00", (PyCFunction)call_irrsmo00,
@@ -1,26 +1,60 @@
 """Interface to irrsmo00.dll."""
 import platform
+from typing import Union
 
-try:
-    from cpyracf import call_irrsmo00
-except ImportError as import_error:
-    if platform.system() == "OS/390":
-        raise import_error
-
-    # Ignore import of extension on non-z/OS platforms to allow for unit testing off platform.
-    def call_irrsmo00() -> None:
-        return None
+from .downstream_fatal_error import DownstreamFatalError
+from .ebcdic import cp1047_to_parser_bytes, decode_cp1047, strip_xml_declaration
+from .governor import CALL_DEADLINE, CALL_PRIORITY, Governor, get_lane
+from .transport import NativeTransport, Transport
 
 
 class IRRSMO00:
     """Interface to irrsmo00.dll."""
 
-    def __init__(self) -> None:
-        # Initialize size of output buffer
-        self.buffer_size = 100000
+    # Shared by every instance so that limits on
+    # concurrent calls apply to the whole process.
+    governor = Governor()
+
+    def __init__(self, transport: Union[Transport, None] = None) -> None:
+        # Requests go through the cpyracf extension unless
+        # another transport is provided (i.e. for testing).
+        if transport is None:
+            transport = NativeTransport()
+        self.transport = transport
+        # Used unless 'call_priority()' sets a priority for the call.
+        self.priority = "interactive"
 
-    def call_racf(self, request_xml: bytes, options: int = 1) -> str:
-        """Make request to call_irrsmo00 from pyracf_backend Python extension."""
-        return call_irrsmo00(
-            xml_str=request_xml, xml_len=len(request_xml), opts=options
-        ).decode("cp1047")
+    def call_racf(
+        self, request_xml: bytes, options: int = 1, decode: bool = True
+    ) -> Union[str, bytes]:
+        """
+        Make request to IRRSMO00 using the configured transport.
+        When 'decode' is False, the result XML is returned as
+        bytes that can be handed to the XML parser directly.
+        """
+        priority = CALL_PRIORITY.get() or self.priority
+        with self.governor.call_slot(
+            get_lane(request_xml), priority, CALL_DEADLINE.get()
+        ):
+            (
+                response_xml,
+                saf_return_code,
+                racf_return_code,
+                racf_reason_code,
+            ) = self.transport.call(request_xml, options)
+        if saf_return_code != 0 and not response_xml:
+            # IRRSMO00 failed before it could process the request (e.g. parameter
+            # list errors or missing authorization to use IRRSMO00), so there is
+            # no result XML to parse. Fail fast using the return and reason codes.
+            raise DownstreamFatalError(
+                saf_return_code, racf_return_code, racf_reason_code
+            )
+        if platform.system() != "OS/390":
+            # Request XML is dumped as utf-8 when not running on z/OS,
+            # so transports used off platform respond in kind.
+            if not decode:
+                return strip_xml_declaration(response_xml)
+            return response_xml.decode("utf-8")
+        if not decode:
+            return cp1047_to_parser_bytes(response_xml)
+        return decode_cp1047(response_xml)
@@ -0,0 +1,139 @@
+"""Requests that are prepared once and run for many profiles."""
+
+import inspect
+import re
+from typing import Callable, List, Tuple, Union
+
+from .request_xml import escape_attribute, escape_text
+from .security_request import RenderedRequest
+
+# Stands in for argument and trait values while a request is prepared.
+# Private use characters are never escaped, so they come out of the XML as is.
+PLACEHOLDER = "\ue000{}\ue001"
+PLACEHOLDER_PATTERN = re.compile("\ue000([0-9]+)\ue001")
+
+# Operations that build a request from a set of traits.
+PREPARABLE_OPERATIONS = ("add", "alter")
+
+
+class PreparedRequest:
+    """
+    An admin operation that has been prepared for a set of traits, like a
+    prepared statement. Traits are validated and the request XML is built
+    once, when the request is prepared, and each run only writes the profile
+    name, the other positional arguments of the operation and the trait values
+    into it. Use 'prepare()' on an admin to create one.
+    """
+
+    def __init__(
+        self,
+        admin,
+        operation: str,
+        traits: List[str],
+        keyword_arguments: dict,
+    ) -> None:
+        if operation not in PREPARABLE_OPERATIONS:
+            raise ValueError(
+                f"'{operation}' can't be prepared. Use one of: "
+                + f"{', '.join(PREPARABLE_OPERATIONS)}."
+            )
+        self.__admin = admin
+        self.__operation = getattr(admin, operation)
+        self.__traits = tuple(traits)
+        self.__keyword_arguments = keyword_arguments
+        self.__argument_count = self.__count_arguments(self.__operation)
+        placeholders = [
+            PLACEHOLDER.format(index)
+            for index in range(self.__argument_count + len(self.__traits))
+        ]
+        (security_request, self.__irrsmo00_options, _) = admin._capture_request(
+            self.__operation,
+            (
+                *placeholders[: self.__argument_count],
+                dict(zip(self.__traits, placeholders[self.__argument_count :])),
+            ),
+            keyword_arguments,
+        )
+        (self.__literals, self.__slots) = self.__compile(
+            security_request.dump_request_xml(encoding="unicode")
+        )
+
+    def run(self, *arguments: str, traits: dict) -> Union[dict, bytes]:
+        """
+        Run the operation with positional 'arguments', like the profile name,
+        and 'traits', which must set the prepared traits. Runs with other
+        traits, or with values that change the structure of the request,
+        like booleans and empty values, are made with the operation as usual.
+        """
+        if len(arguments) != self.__argument_count:
+            raise TypeError(
+                f"Expected {self.__argument_count} positional arguments, "
+                + f"but {len(arguments)} were given."
+            )
+        values = self.__get_values(arguments, traits)
+        if values is None:
+            return self.__operation(
+                *arguments, dict(traits), **self.__keyword_arguments
+            )
+        request_xml = [self.__literals[0]]
+        for (index, escape), literal in zip(self.__slots, self.__literals[1:]):
+            request_xml.append(escape(values[index]))
+            request_xml.append(literal)
+        return self.__admin._make_prepared_request(
+            RenderedRequest("".join(request_xml)),
+            self.__irrsmo00_options,
+            traits,
+        )
+
+    def __get_values(
+        self, arguments: Tuple[str, ...], traits: dict
+    ) -> Union[List[str], None]:
+        """
+        Get the text of each argument and trait value, or None if the
+        traits don't fit the structure of the prepared request.
+        """
+        if len(traits) != len(self.__traits):
+            return None
+        if not all(isinstance(argument, str) and argument for argument in arguments):
+            return None
+        values = list(arguments)
+        for trait in self.__traits:
+            value = traits.get(trait)
+            if value is None or isinstance(value, bool):
+                return None
+            if isinstance(value, list):
+                value = " ".join(value)
+            else:
+                value = str(value)
+            if not value:
+                return None
+            values.append(value)
+        return values
+
+    @staticmethod
+    def __count_arguments(operation: Callable) -> int:
+        """Count the positional arguments that come before the traits."""
+        parameters = list(inspect.signature(operation).parameters)
+        for traits_parameter in ["traits", "options"]:
+            if traits_parameter in parameters:
+                return parameters.index(traits_parameter)
+        raise ValueError(f"'{operation.__name__}' doesn't take any traits.")
+
+    @staticmethod
+    def __compile(request_xml: str) -> Tuple[List[str], List[Tuple[int, Callable]]]:
+        """
+        Split the request XML into the text between placeholders, and the
+        index of the value and the escape function for each placeholder.
+        """
+        tokens = PLACEHOLDER_PATTERN.split(request_xml)
+        literals = tokens[0::2]
+        slots = []
+        written = ""
+        for index, literal in zip(tokens[1::2], literals):
+            written += literal
+            escape = escape_text
+            if written.rfind("<") > written.rfind(">"):
+                # The placeholder is in an attribute value of a start tag.
+                escape = escape_attribute
+            slots.append((int(index), escape))
+        return (literals, slots)
@@ -0,0 +1,98 @@
+"""Compare the traits of an alter with the fields of an extracted profile."""
+
+from typing import Any, List, Union
+
+# Values that are extracted as None, like a universal access of NONE.
+NULL_VALUES = ("n/a", "none", "none specified", "no")
+
+
+def get_changed_traits(
+    profile: dict,
+    traits: dict,
+    trait_index: dict,
+    profile_fields: dict,
+    profile_attributes: dict,
+    case_sensitive_fields: tuple = (),
+) -> dict:
+    """
+    Get the traits that would change the profile if they were altered.
+    'profile_fields' maps traits to the profile field they are extracted as,
+    in the same segment, and 'profile_attributes' maps traits to the keyword
+    that is in the base segment's attributes when they are set. Traits that
+    aren't mapped to a field can't be compared, so they are always changed.
+    'case_sensitive_fields' are the traits whose case is kept by RACF.
+    """
+    changed_traits = {}
+    for trait, value in traits.items():
+        for segment, valid_trait, _, operation in trait_index.get(trait, ()):
+            if valid_trait in profile_attributes:
+                attributes = profile.get("base", {}).get("attributes", [])
+                changed = (profile_attributes[valid_trait] in attributes) != (
+                    operation is None and value is True
+                )
+            elif valid_trait in profile_fields:
+                current_value = profile.get(segment, {}).get(
+                    profile_fields[valid_trait]
+                )
+                changed = field_changed(
+                    current_value,
+                    value,
+                    operation,
+                    case_sensitive=valid_trait in case_sensitive_fields,
+                )
+            else:
+                changed = True
+            if changed:
+                changed_traits[trait] = value
+                break
+    return changed_traits
+
+
+def field_changed(
+    current_value: Any,
+    value: Any,
+    operation: Union[str, None],
+    case_sensitive: bool = False,
+) -> bool:
+    """
+    Check if setting a trait to 'value' with 'operation' would change a field.
+    Extracted profiles are lower case, so a value of a case sensitive field
+    that isn't lower case can't be compared with them, and always changes it.
+    """
+    if operation == "delete" or (operation is None and value is False):
+        return current_value not in (None, [], "") and current_value is not False
+    if value is True:
+        return current_value is not True
+    if case_sensitive and any(token != token.lower() for token in get_words(value)):
+        return True
+    current_tokens = get_tokens(current_value)
+    tokens = get_tokens(value)
+    if operation in ("add", "remove"):
+        common_tokens = set(tokens) & set(current_tokens)
+        # Adding changes the field unless it has all of the tokens already,
+        # and removing changes it if it has any of them.
+        return (
+            common_tokens != set(tokens) if operation == "add" else bool(common_tokens)
+        )
+    if isinstance(value, list):
+        return sorted(tokens) != sorted(current_tokens)
+    if current_value is None:
+        return " ".join(tokens) not in NULL_VALUES
+    return tokens != current_tokens
+
+
+def get_tokens(value: Any) -> List[str]:
+    """
+    Split a value into lower case words, since extracted profiles are lower
+    case and split some values into lists of words.
+    """
+    return [word.lower() for word in get_words(value)]
+
+
+def get_words(value: Any) -> List[str]:
+    """Split a value into words."""
+    if value is None:
+        return []
+    if isinstance(value, list):
+        return [word for item in value for word in get_words(item)]
+    return str(value).split()
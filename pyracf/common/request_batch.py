@@ -0,0 +1,235 @@
+"""Operations that are made together in as few IRRSMO00 calls as possible."""
+
+import functools
+from typing import Callable, List, Union
+
+from .request_xml import SECURITY_REQUEST_END, SECURITY_REQUEST_START
+from .security_request import RenderedRequest
+from .security_request_error import SecurityRequestError
+from .security_result import LazyResultDictionary, SecurityResult
+
+
+class RequestBatch:
+    """
+    Queue 'add', 'alter', 'delete' and 'extract' operations of an admin and
+    make them together. IRRSMO00 accepts several security definitions in one
+    request, so each call packs in as many operations as the batch limits allow.
+    Operations with different IRRSMO00 options, like 'add' and 'alter', can't
+    share a call, so a call is only shared by operations queued one after another
+    with the same options. Use 'batch()' on an admin to create one.
+    """
+
+    def __init__(
+        self,
+        admin,
+        max_definitions: int = 100,
+        max_request_length: Union[int, None] = None,
+    ) -> None:
+        if max_definitions < 1:
+            raise ValueError("Batches must allow at least 1 definition per request.")
+        self.__admin = admin
+        self.__max_definitions = max_definitions
+        self.__max_request_length = max_request_length
+        self.__operations = []
+
+    def __len__(self) -> int:
+        return len(self.__operations)
+
+    def add(self, *arguments, **keyword_arguments) -> None:
+        """Queue an 'add' operation, which takes the same arguments as the admin's."""
+        self.__queue("add", arguments, keyword_arguments)
+
+    def alter(self, *arguments, **keyword_arguments) -> None:
+        """Queue an 'alter' operation, which takes the same arguments as the admin's."""
+        self.__queue("alter", arguments, keyword_arguments)
+
+    def delete(self, *arguments, **keyword_arguments) -> None:
+        """Queue a 'delete' operation, which takes the same arguments as the admin's."""
+        self.__queue("delete", arguments, keyword_arguments)
+
+    def extract(
+        self, *arguments, profile_only: bool = False, **keyword_arguments
+    ) -> None:
+        """Queue an 'extract' operation, which takes the same arguments as the admin's."""
+        self.__queue("extract", arguments, keyword_arguments, profile_only)
+
+    def run(self) -> List[Union[dict, SecurityRequestError, bytes]]:
+        """
+        Make the queued operations and return their results in the order they
+        were queued. The result of an operation that failed is the
+        'SecurityRequestError' that it would have raised if it was made on its
+        own, which isn't raised, so that the other results aren't lost.
+        The results of calls that every operation succeeded in are only parsed
+        when they are accessed, unless one of the operations is an extract.
+        In generate requests only mode, the request XML of each call is returned.
+        """
+        (operations, self.__operations) = (self.__operations, [])
+        results = []
+        for request in self.__pack(operations):
+            results += self.__make_request(request)
+        return results
+
+    def __queue(
+        self,
+        operation: str,
+        arguments: tuple,
+        keyword_arguments: dict,
+        profile_only: bool = False,
+    ) -> None:
+        """Build the request of an operation, which validates it, and queue it."""
+        (
+            security_request,
+            irrsmo00_options,
+            redact_strings,
+        ) = self.__admin._capture_request(
+            getattr(self.__admin, operation), arguments, keyword_arguments
+        )
+        # Definitions are told apart in the result by their request id.
+        attributes = security_request._security_definition.attrib
+        request_id = attributes["requestid"]
+        attributes["requestid"] = f"{request_id}{len(self.__operations) + 1}"
+        self.__operations.append(
+            {
+                "operation": operation,
+                "requestId": request_id,
+                "batchRequestId": attributes["requestid"],
+                "definitionXml": security_request._write_security_definition_xml(),
+                "irrsmo00Options": irrsmo00_options,
+                "redactStrings": redact_strings,
+                "profileOnly": profile_only,
+            }
+        )
+
+    def __pack(self, operations: List[dict]) -> List[List[dict]]:
+        """Split operations into requests that fit within the batch limits."""
+        requests = []
+        request_length = 0
+        for operation in operations:
+            operation_length = len(operation["definitionXml"])
+            if (
+                not requests
+                or len(requests[-1]) == self.__max_definitions
+                or requests[-1][0]["irrsmo00Options"] != operation["irrsmo00Options"]
+                or (
+                    self.__max_request_length is not None
+                    and request_length + operation_length > self.__max_request_length
+                )
+            ):
+                requests.append([])
+                request_length = len(SECURITY_REQUEST_START + SECURITY_REQUEST_END)
+            requests[-1].append(operation)
+            request_length += operation_length
+        return requests
+
+    def __make_request(self, operations: List[dict]) -> List[Union[dict, bytes]]:
+        """Make one request and match each definition's result to its operation."""
+        response = self.__admin._make_batch_request(
+            RenderedRequest(
+                SECURITY_REQUEST_START
+                + "".join(operation["definitionXml"] for operation in operations)
+                + SECURITY_REQUEST_END
+            ),
+            operations[0]["irrsmo00Options"],
+            [
+                redact_string
+                for operation in operations
+                for redact_string in operation["redactStrings"]
+            ],
+        )
+        if isinstance(response, bytes):
+            return [response]
+        (return_code, reason_code, security_result) = response
+        if return_code == 0 and all(
+            operation["operation"] != "extract" for operation in operations
+        ):
+            # Every operation succeeded and none of them has a profile to format,
+            # so the result is only parsed if one of their results is accessed.
+            get_definition_results = functools.cache(
+                lambda: self.__get_definition_results(security_result)
+            )
+            return [
+                LazyResultDictionary(
+                    (0, 0),
+                    functools.partial(
+                        self.__get_lazy_operation_result,
+                        operation,
+                        get_definition_results,
+                    ),
+                )
+                for operation in operations
+            ]
+        definition_results = self.__get_definition_results(security_result)
+        results = []
+        for operation in operations:
+            result = self.__get_operation_result(
+                operation,
+                definition_results.get(operation["batchRequestId"]),
+                return_code,
+                reason_code,
+            )
+            results.append(result)
+        return results
+
+    def __get_definition_results(self, security_result: SecurityResult) -> dict:
+        """Get the result of each definition of a request by its request id."""
+        return {
+            definition_dictionary["requestId"]: (definition_tag, definition_dictionary)
+            for (
+                definition_tag,
+                definition_dictionary,
+            ) in security_result.get_definition_results()
+        }
+
+    def __get_lazy_operation_result(
+        self, operation: dict, get_definition_results: Callable[[], dict]
+    ) -> dict:
+        """Build the result dictionary of an operation of a successful request."""
+        result = self.__get_operation_result(
+            operation, get_definition_results().get(operation["batchRequestId"]), 0, 0
+        )
+        if isinstance(result, SecurityRequestError):
+            return result.result
+        return result
+
+    def __get_operation_result(
+        self,
+        operation: dict,
+        definition_result: Union[tuple, None],
+        return_code: int,
+        reason_code: int,
+    ) -> Union[dict, SecurityRequestError]:
+        """
+        Build the result dictionary of an operation from the result of its definition.
+        An operation succeeded if its definition has no error and all of its commands
+        have a return code of 0, in which case its return and reason codes are 0.
+        Otherwise, they are the return and reason codes of the whole call.
+        """
+        if definition_result is None:
+            return SecurityRequestError(
+                {
+                    "securityResult": {
+                        "returnCode": return_code,
+                        "reasonCode": reason_code,
+                    }
+                }
+            )
+        (definition_tag, definition_dictionary) = definition_result
+        definition_dictionary["requestId"] = operation["requestId"]
+        succeeded = "error" not in definition_dictionary and all(
+            command.get("returnCode", 0) == 0
+            for command in definition_dictionary.get("commands", [])
+        )
+        result = {
+            "securityResult": {
+                definition_tag: definition_dictionary,
+                "returnCode": 0 if succeeded else return_code,
+                "reasonCode": 0 if succeeded else reason_code,
+            }
+        }
+        if not succeeded:
+            return SecurityRequestError(result)
+        if operation["operation"] == "extract":
+            self.__admin._format_profile(result)
+            if operation["profileOnly"]:
+                return self.__admin._get_profile(result)
+        return result
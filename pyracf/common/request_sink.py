@@ -0,0 +1,36 @@
+"""Stream the requests generated in generate requests only mode."""
+
+import threading
+from typing import BinaryIO, Callable, Union
+
+
+class RequestSink:
+    """
+    Write each request that an admin generates to 'target' as soon as it is
+    built, instead of returning it, so that dry runs of any size don't have to
+    be kept in memory. 'target' is a binary file or pipe, or a callable that is
+    called with the request XML of each request, like the 'append' method of a
+    list or the 'put' method of a queue. Requests written to a file or pipe are
+    followed by 'separator'. Pass a sink as 'generate_requests_only' to use it.
+    """
+
+    def __init__(
+        self,
+        target: Union[BinaryIO, Callable[[bytes], object]],
+        separator: bytes = b"\n",
+    ) -> None:
+        self.__write = getattr(target, "write", target)
+        self.__separator = separator if hasattr(target, "write") else b""
+        self.__lock = threading.Lock()
+        # The number of requests and bytes of request XML written so far.
+        self.request_count = 0
+        self.byte_count = 0
+
+    def write(self, request_xml: bytes) -> None:
+        """Write the request XML of a generated request to the target."""
+        with self.__lock:
+            self.__write(
+                request_xml + self.__separator if self.__separator else request_xml
+            )
+            self.request_count += 1
+            self.byte_count += len(request_xml)
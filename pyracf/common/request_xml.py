@@ -0,0 +1,72 @@
+"""Write security request XML straight into a string."""
+
+from typing import Dict
+
+# The envelope around the security definition, which is the same in every request.
+SECURITY_REQUEST_START = (
+    '<securityrequest xmlns="http://www.ibm.com/systems/zos/saf" '
+    + 'xmlns:racf="http://www.ibm.com/systems/zos/racf">'
+)
+SECURITY_REQUEST_END = "</securityrequest>"
+
+# Encodings that ElementTree writes without an XML declaration.
+UNDECLARED_ENCODINGS = ("utf-8", "us-ascii")
+
+
+class RequestElement:
+    """The tag and attributes of an element, which requests set up before it is written."""
+
+    __slots__ = ("tag", "attrib")
+
+    def __init__(self, tag: str) -> None:
+        self.tag = tag
+        self.attrib = {}
+
+
+def escape_text(text: str) -> str:
+    """Escape text the same way ElementTree escapes element text."""
+    if "&" in text:
+        text = text.replace("&", "&amp;")
+    if "<" in text:
+        text = text.replace("<", "&lt;")
+    if ">" in text:
+        text = text.replace(">", "&gt;")
+    return text
+
+
+def escape_attribute(value: str) -> str:
+    """Escape an attribute value the same way ElementTree escapes it."""
+    value = escape_text(value)
+    if '"' in value:
+        value = value.replace('"', "&quot;")
+    if "\r" in value:
+        value = value.replace("\r", "&#13;")
+    if "\n" in value:
+        value = value.replace("\n", "&#10;")
+    if "\t" in value:
+        value = value.replace("\t", "&#09;")
+    return value
+
+
+def build_element(tag: str, attributes: Dict[str, str], content: str = "") -> str:
+    """
+    Write an element with already escaped 'content', or an empty element tag
+    if there is no content, exactly like ElementTree writes it.
+    """
+    start_tag = "<" + tag
+    for name, value in attributes.items():
+        start_tag += f' {name}="{escape_attribute(value)}"'
+    if not content:
+        return start_tag + " />"
+    return f"{start_tag}>{content}</{tag}>"
+
+
+def encode_request_xml(request_xml: str, encoding: str) -> bytes:
+    """
+    Encode request XML, with the XML declaration that ElementTree would write
+    for 'encoding' and with character references for characters that can't
+    be encoded.
+    """
+    if encoding.lower() not in UNDECLARED_ENCODINGS:
+        request_xml = f"<?xml version='1.0' encoding='{encoding}'?>\n" + request_xml
+    return request_xml.encode(encoding, errors="xmlcharrefreplace")
@@ -1,21 +1,45 @@
 """Base Class for RACF Administration Interface."""
 
+import functools
 import platform
 import re
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, List, Tuple, Union
-
+from types import MappingProxyType
+from typing import Any, Callable, Iterator, List, Tuple, Union
+
+from .deferred_alters import (
+    DEFERRED_ALTERS,
+    DeferredAlters,
+    DeferredResult,
+    get_deferred_alters,
+)
+from .governor import check_priority
 from .irrsmo00 import IRRSMO00
 from .logger import Logger
+from .prepared_request import PreparedRequest
+from .profile_diff import get_changed_traits
+from .request_batch import RequestBatch
+from .request_sink import RequestSink
 from .security_request import SecurityRequest
 from .security_request_error import SecurityRequestError
-from .security_result import SecurityResult
+from .security_result import LazyResultDictionary, SecurityResult
+from .trait_index import build_trait_index, freeze_field_data
+from .transport import Transport
 
 
 class SecurityAdmin:
     """Base Class for RACF Administration Interface."""
 
     _valid_segment_traits = {}
+    # Built from '_valid_segment_traits' the first time a request is built.
+    _trait_index = None
+    # The extracted profile fields and base segment attributes that traits
+    # are compared with by 'ensure()', which only alters traits that differ.
+    _profile_fields = {}
+    _profile_attributes = {}
+    # The fields whose case RACF keeps, which are extracted in lower case.
+    _case_sensitive_fields = ()
     _common_base_traits_data_set_generic = {
         "base:aclcnt": "racf:aclcnt",
         "base:aclacnt": "racf:aclacnt",
@@ -52,37 +76,221 @@ class SecurityAdmin:
         self,
         profile_type: str,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
-        self.__irrsmo00 = IRRSMO00()
+        self.__irrsmo00 = IRRSMO00(transport=transport)
         self.__profile_type = profile_type
         self._segment_traits = {}
         # used to preserve segment traits for debug logging.
         self.__preserved_segment_traits = {}
         self._trait_map = {}
         self.__debug = debug
+        # Either True or a 'RequestSink' that generated requests are written to.
         self.__generate_requests_only = generate_requests_only
-        if add_field_data is not None:
-            self.__add_field_data(add_field_data)
-        if overwrite_field_data is not None:
-            self.__overwrite_field_data(overwrite_field_data)
+        # Collects requests instead of making them while a request is prepared.
+        self.__captured_requests = None
+        if add_field_data is not None or overwrite_field_data is not None:
+            # Custom field data only applies to this admin, so it is overlaid
+            # on a copy of the class's valid segment traits, which are shared
+            # by every admin of the class and are never modified.
+            (self._valid_segment_traits, self._trait_index) = self.__compile_field_data(
+                freeze_field_data(add_field_data),
+                freeze_field_data(overwrite_field_data),
+            )
 
     # ============================================================================
     # Custom Fields
     # ============================================================================
-    def __add_field_data(self, field_data: dict):
-        """Add additional fields to valid segment traits dictionary."""
-        for segment in field_data:
-            if segment in self._valid_segment_traits:
-                self._valid_segment_traits[segment].update(field_data[segment])
-            else:
-                self._valid_segment_traits[segment] = field_data[segment]
+    @classmethod
+    @functools.lru_cache(maxsize=256)
+    def __compile_field_data(
+        cls,
+        add_field_data: Union[tuple, None],
+        overwrite_field_data: Union[tuple, None],
+    ) -> Tuple[MappingProxyType, dict]:
+        """
+        Build the valid segment traits and trait index of an admin with custom
+        field data. Results are cached, so admins created with the same field
+        data share them. Segments without custom fields are not copied.
+        """
+        if overwrite_field_data is not None:
+            valid_segment_traits = {
+                segment: MappingProxyType(dict(traits))
+                for segment, traits in overwrite_field_data
+            }
+        else:
+            valid_segment_traits = dict(cls._valid_segment_traits)
+            for segment, traits in add_field_data:
+                valid_segment_traits[segment] = MappingProxyType(
+                    {**valid_segment_traits.get(segment, {}), **dict(traits)}
+                )
+        return (
+            MappingProxyType(valid_segment_traits),
+            build_trait_index(valid_segment_traits),
+        )
+
+    # ============================================================================
+    # Call Priority
+    # ============================================================================
+    def set_call_priority(self, priority: str) -> None:
+        """
+        Set the priority that requests made by this admin wait for IRRSMO00 with,
+        which is either 'interactive' (the default) or 'bulk'. Use 'call_priority()'
+        from 'pyracf.common.governor' to set the priority of individual calls.
+        """
+        check_priority(priority)
+        self.__irrsmo00.priority = priority
+
+    # ============================================================================
+    # Prepared Requests
+    # ============================================================================
+    def prepare(
+        self, operation: str, traits: List[str], **keyword_arguments
+    ) -> PreparedRequest:
+        """
+        Prepare 'operation' ('add' or 'alter') for a set of traits, so that it can
+        be run for many profiles without validating the traits and building the
+        request every time. Keyword arguments of the operation, like 'volume' and
+        'generic', are the same for every run.
+        """
+        return PreparedRequest(self, operation, traits, keyword_arguments)
+
+    def _capture_request(
+        self, operation: Callable, arguments: tuple, keyword_arguments: dict
+    ) -> Tuple[SecurityRequest, int, List[str]]:
+        """
+        Build the request that 'operation' makes, without making it, and get
+        its IRRSMO00 options and the secrets to redact from its result.
+        """
+        self.__captured_requests = []
+        try:
+            operation(*arguments, **keyword_arguments)
+            captured_requests = self.__captured_requests
+        finally:
+            self.__captured_requests = None
+        if len(captured_requests) != 1:
+            raise ValueError(
+                f"'{operation.__name__}' doesn't make exactly one request."
+            )
+        return captured_requests[0]
+
+    def _make_prepared_request(
+        self,
+        security_request: SecurityRequest,
+        irrsmo00_options: int,
+        traits: dict,
+    ) -> Union[dict, bytes]:
+        """Make a request that was written by a prepared request for 'traits'."""
+        if self.__debug:
+            # The request dictionary is only needed to log it.
+            self._build_segment_dictionaries(traits)
+        else:
+            # Only the secrets to redact are needed from the request dictionary.
+            self.__preserved_segment_traits = {
+                "base": {
+                    trait: {"value": str(traits[trait])}
+                    for trait in ("base:password", "base:passphrase")
+                    if trait in traits
+                }
+            }
+        # Prepared requests can't be merged with other alters, so they are never
+        # held back in 'deferred()' blocks, but are made after the alters that are.
+        return self._make_request(security_request, irrsmo00_options)
+
+    # ============================================================================
+    # Batched Requests
+    # ============================================================================
+    def batch(
+        self,
+        max_definitions: int = 100,
+        max_request_length: Union[int, None] = None,
+    ) -> RequestBatch:
+        """
+        Start a batch of 'add', 'alter', 'delete' and 'extract' operations that
+        are made together in as few IRRSMO00 calls as possible, with at most
+        'max_definitions' operations and 'max_request_length' characters of
+        request XML in each call.
+        """
+        return RequestBatch(self, max_definitions, max_request_length)
+
+    def _make_batch_request(
+        self,
+        security_request: SecurityRequest,
+        irrsmo00_options: int,
+        redact_strings: List[str],
+    ) -> Union[Tuple[int, int, SecurityResult], bytes]:
+        """
+        Make a request with several security definitions and return the
+        call's return and reason codes followed by its result, whose
+        definition results are only parsed if they are asked for.
+        """
+        # Each definition has its own request dictionary, so there is no
+        # single request dictionary to log.
+        self.__preserved_segment_traits = {}
+        results = self.__get_security_result(
+            security_request, irrsmo00_options, redact_strings
+        )
+        if self.__generate_requests_only:
+            return results
+        (return_code, reason_code) = results.get_return_codes()
+        return (return_code, reason_code, results)
+
+    # ============================================================================
+    # Deferred Alters
+    # ============================================================================
+    @contextmanager
+    def deferred(self) -> Iterator[list]:
+        """
+        Hold back the alters made in the block, including the ones made by
+        convenience setters, and merge the alters to the same profile into one
+        request when the block exits. Each held back alter returns a
+        'DeferredResult' dictionary that the result of its merged request is
+        copied into, so the steps dictionaries returned by setters still hold
+        their results afterwards. Other requests made in the block make the
+        alters held back before them first. Yields a list of the results of the
+        merged requests, which is filled in when they are made. If a merged
+        request fails, the others are still made, and the first error is raised
+        afterwards. If the block raises an exception, the alters that are still
+        held back are discarded.
+        """
+        deferred_alters = get_deferred_alters(self)
+        if deferred_alters is not None:
+            # Nested blocks are part of the outer block.
+            yield deferred_alters.results
+            return
+        deferred_alters = DeferredAlters(
+            self.__make_deferred_request, self.__generate_requests_only
+        )
+        token = DEFERRED_ALTERS.set(
+            {**(DEFERRED_ALTERS.get() or {}), self: deferred_alters}
+        )
+        try:
+            yield deferred_alters.results
+            deferred_alters.flush()
+        finally:
+            DEFERRED_ALTERS.reset(token)
 
-    def __overwrite_field_data(self, field_data: dict):
-        """Overwrite field data in valid segment traits dictionary"""
-        self._valid_segment_traits = field_data
+    def __make_deferred_request(
+        self,
+        security_request: SecurityRequest,
+        irrsmo00_options: int,
+        redact_strings: List[str],
+        segment_traits: dict,
+    ) -> Union[dict, bytes]:
+        """Make an alter that was held back, with its merged request dictionary."""
+        preserved_segment_traits = self.__preserved_segment_traits
+        self.__preserved_segment_traits = segment_traits
+        try:
+            return self.__make_request_and_redact_secrets(
+                security_request,
+                irrsmo00_options=irrsmo00_options,
+                redact_strings=redact_strings,
+            )
+        finally:
+            self.__preserved_segment_traits = preserved_segment_traits
 
     # ============================================================================
     # Request Execution
@@ -93,7 +301,7 @@ class SecurityAdmin:
     ) -> dict:
         """Extract a RACF profile."""
         result = self._make_request(security_request)
-        if self.__generate_requests_only:
+        if self.__generate_requests_only or self.__captured_requests is not None:
             return result
         self._format_profile(result)
         if self.__debug:
@@ -109,8 +317,12 @@ class SecurityAdmin:
         self,
         security_request: SecurityRequest,
         irrsmo00_options: int = 1,
+        deferrable: bool = False,
     ) -> Union[dict, bytes]:
-        """Make request to IRRSMO00."""
+        """
+        Make request to IRRSMO00.
+        Note: 'deferrable' requests, which are alters, are held back in 'deferred()' blocks.
+        """
         redact_password = (
             self.__preserved_segment_traits.get("base", {})
             .get("base:password", {})
@@ -121,6 +333,26 @@ class SecurityAdmin:
             .get("base:passphrase", {})
             .get("value", "")
         )
+        if self.__captured_requests is not None:
+            self.__captured_requests.append(
+                (
+                    security_request,
+                    irrsmo00_options,
+                    [redact_password, redact_passphrase],
+                )
+            )
+            return b""
+        deferred_alters = get_deferred_alters(self)
+        if deferred_alters is not None:
+            if deferrable:
+                return deferred_alters.hold(
+                    security_request,
+                    irrsmo00_options,
+                    [redact_password, redact_passphrase],
+                    self.__preserved_segment_traits,
+                )
+            # Make the alters held back before this request first.
+            deferred_alters.flush()
         return self.__make_request_and_redact_secrets(
             security_request,
             irrsmo00_options=irrsmo00_options,
@@ -137,47 +369,84 @@ class SecurityAdmin:
         Make request to IRRSMO00.
         Note: Passwords are redacted from result and from log messages.
         """
+        results = self.__get_security_result(
+            security_request, irrsmo00_options, redact_strings
+        )
+        if self.__generate_requests_only:
+            return results
+        return_codes = results.get_return_codes()
+        if return_codes[0] != 0:
+            # All non-zero return codes should cause a SecurityRequestError to be raised.
+            # Even if a return code of 4 is not indicative of a problem, it it is
+            # up to the user to interogate the result dictionary attached to the
+            # SecurityRequestError and decided whether or not the return code 4 is
+            # indicative of a problem.
+            raise SecurityRequestError(results.get_result_dictionary())
+        if self.__debug:
+            # The result dictionary has already been built to log it.
+            return results.get_result_dictionary()
+        # Only the return code has been read, so the result XML is only
+        # parsed if the caller accesses the result dictionary.
+        return LazyResultDictionary(return_codes, results.get_result_dictionary)
+
+    def __get_security_result(
+        self,
+        security_request: SecurityRequest,
+        irrsmo00_options: int,
+        redact_strings: List[str],
+    ) -> Union[SecurityResult, bytes]:
+        """
+        Make request to IRRSMO00 and parse the result, or return the request XML
+        in generate requests only mode.
+        """
         if self.__debug:
             self.__logger.log_dictionary(
                 "Request Dictionary",
                 self.__preserved_segment_traits,
                 redact_strings=redact_strings,
             )
+            # The request XML is only serialized once, so logging it here
+            # and returning it or making the request below reuse the same bytes.
             self.__logger.log_xml(
                 "Request XML",
                 security_request.dump_request_xml(encoding="utf-8"),
                 redact_strings=redact_strings,
             )
         if self.__generate_requests_only:
-            return self.__logger.redact_strings(
+            request_xml = self.__logger.redact_strings(
                 security_request.dump_request_xml(encoding="utf-8"),
                 redact_strings=redact_strings,
             )
-        result_xml = self.__irrsmo00.call_racf(
-            security_request.dump_request_xml(), irrsmo00_options
-        )
-        if self.__debug:
-            self.__logger.log_xml(
-                "Result XML", result_xml, redact_strings=redact_strings
+            if isinstance(self.__generate_requests_only, RequestSink):
+                self.__generate_requests_only.write(request_xml)
+                return b""
+            return request_xml
+        if not self.__debug and not any(redact_strings):
+            # Nothing needs to be logged or redacted, so the result XML
+            # can be handed to the parser without decoding it first.
+            results = SecurityResult(
+                self.__irrsmo00.call_racf(
+                    security_request.dump_request_xml(), irrsmo00_options, decode=False
+                )
+            )
+        else:
+            result_xml = self.__irrsmo00.call_racf(
+                security_request.dump_request_xml(), irrsmo00_options
+            )
+            if self.__debug:
+                self.__logger.log_xml(
+                    "Result XML", result_xml, redact_strings=redact_strings
+                )
+            results = SecurityResult(
+                self.__logger.redact_strings(result_xml, redact_strings=redact_strings)
             )
-        results = SecurityResult(
-            self.__logger.redact_strings(result_xml, redact_strings=redact_strings)
-        )
         if self.__debug:
             # No need to redact anything here since the result dictionary
             # already has secrets redacted when it is built.
             self.__logger.log_dictionary(
                 "Result Dictionary", results.get_result_dictionary()
             )
-        result_dictionary = results.get_result_dictionary()
-        if result_dictionary["securityResult"]["returnCode"] != 0:
-            # All non-zero return codes should cause a SecurityRequestError to be raised.
-            # Even if a return code of 4 is not indicative of a problem, it it is
-            # up to the user to interogate the result dictionary attached to the
-            # SecurityRequestError and decided whether or not the return code 4 is
-            # indicative of a problem.
-            raise SecurityRequestError(result_dictionary)
-        return result_dictionary
+        return results
 
     def _to_steps(self, results: Union[List[dict], dict, bytes]) -> Union[dict, bytes]:
         """
@@ -192,13 +461,14 @@ class SecurityAdmin:
         if isinstance(results, dict) or isinstance(results, bytes):
             results = [results]
         if self.__generate_requests_only:
-            concatenated_xml = b""
-            for request_xml in results:
-                if request_xml:
-                    concatenated_xml += request_xml
-            return concatenated_xml
+            return b"".join(request_xml for request_xml in results if request_xml)
         pre_processed_results = []
         for result in results:
+            if isinstance(result, (DeferredResult, LazyResultDictionary)):
+                # Held back alters are empty until they are made, and
+                # results that haven't been parsed aren't parsed here.
+                pre_processed_results.append(result)
+                continue
             if not result:
                 continue
             if list(result.keys())[0] == "step1":
@@ -219,31 +489,13 @@ class SecurityAdmin:
         self._segment_traits = {}
         self._trait_map = {}
 
-    def __validate_and_add_trait(
-        self, trait: str, segment: str, value: Union[str, dict]
-    ):
-        """Validate the specified trait exists in the specified segment"""
-        if segment not in self._valid_segment_traits:
-            return False
-        if trait not in self._valid_segment_traits[segment]:
-            tokens = trait.split(":")
-            operation = tokens[0]
-            if operation not in ["add", "remove", "delete"] or len(tokens) == 1:
-                return False
-            trait = trait[len(operation) + 1 :]
-            if trait not in self._valid_segment_traits[segment]:
-                return False
-            value_operation_dictionary = {"value": value, "operation": operation}
-        else:
-            operation = None
-            if isinstance(value, bool) and not value:
-                operation = "delete"
-            value_operation_dictionary = {"value": value, "operation": operation}
-        if segment not in self._segment_traits:
-            self._segment_traits[segment] = {}
-        self._segment_traits[segment][trait] = value_operation_dictionary
-        self._trait_map[trait] = self._valid_segment_traits[segment][trait]
-        return True
+    def __get_trait_index(self) -> dict:
+        """Get the index of trait spellings, building it if it hasn't been built yet."""
+        if self._trait_index is None:
+            # Only admins without custom field data get here, so the
+            # index can be shared by every admin of the class.
+            type(self)._trait_index = build_trait_index(self._valid_segment_traits)
+        return self._trait_index
 
     def _build_bool_segment_dictionaries(self, segments: dict) -> None:
         """Build segment dictionaries for profile extract."""
@@ -259,9 +511,26 @@ class SecurityAdmin:
         """Build segemnt dictionaries for each segment."""
         # Clear state for new request
         self._clear_state()
-        for trait in traits:
-            for segment in self._valid_segment_traits:
-                self.__validate_and_add_trait(trait, segment, traits[trait])
+        trait_index = self.__get_trait_index()
+        for trait, value in traits.items():
+            for segment, valid_trait, xml_tag, operation in trait_index.get(trait, ()):
+                if operation is None and isinstance(value, bool) and not value:
+                    operation = "delete"
+                if segment not in self._segment_traits:
+                    self._segment_traits[segment] = {}
+                other_operation = {"add": "remove", "remove": "add"}.get(operation)
+                if other_operation is not None and (
+                    self._segment_traits[segment].get(valid_trait, {}).get("operation")
+                    == other_operation
+                ):
+                    # A trait can be added to and removed from in the same request,
+                    # so the second of them is keyed by its prefixed spelling.
+                    valid_trait = f"{operation}:{valid_trait}"
+                self._segment_traits[segment][valid_trait] = {
+                    "value": value,
+                    "operation": operation,
+                }
+                self._trait_map[valid_trait] = xml_tag
         # preserve segment traits for debug logging.
         self.__preserved_segment_traits = self._segment_traits
 
@@ -288,6 +557,32 @@ class SecurityAdmin:
         # Clear state for subsequent requests
         self._clear_state()
 
+    # ============================================================================
+    # Ensure
+    # ============================================================================
+    def _get_ensure_segments(self, traits: dict) -> dict:
+        """Get the segments to extract to compare traits with a profile."""
+        return {
+            segment: True
+            for trait in traits
+            for segment, _, _, _ in self.__get_trait_index().get(trait, ())
+            if segment != "base"
+        }
+
+    def _get_changed_traits(self, profile: Union[dict, bytes], traits: dict) -> dict:
+        """Get the traits that differ from an extracted profile."""
+        if self.__generate_requests_only:
+            # There is no profile to compare with in generate requests only mode.
+            return traits
+        return get_changed_traits(
+            profile,
+            traits,
+            self.__get_trait_index(),
+            self._profile_fields,
+            self._profile_attributes,
+            self._case_sensitive_fields,
+        )
+
     # ============================================================================
     # Profile Dictionary Building
     # ============================================================================
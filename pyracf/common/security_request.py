@@ -1,22 +1,29 @@
 """Generic Security Request builder."""
 
 import platform
-import xml.etree.ElementTree as XMLBuilder
 from typing import Union
 
+from .ebcdic import CP1047_XML_DECLARATION, encode_cp1047
+from .request_xml import (
+    SECURITY_REQUEST_END,
+    SECURITY_REQUEST_START,
+    RequestElement,
+    build_element,
+    encode_request_xml,
+    escape_text,
+)
+
 
 class SecurityRequest:
     """Generic Security Request builder."""
 
     def __init__(self) -> None:
-        self.__racf_request = XMLBuilder.Element("securityrequest")
-        self.__racf_request.attrib = {
-            "xmlns": "http://www.ibm.com/systems/zos/saf",
-            "xmlns:racf": "http://www.ibm.com/systems/zos/racf",
-        }
-        self._security_definition = XMLBuilder.SubElement(
-            self.__racf_request, "undefined"
-        )
+        self._security_definition = RequestElement("undefined")
+        # XML of the traits in each segment of the security definition,
+        # with traits that aren't in a segment under None.
+        self.__segments = {}
+        # Serialized request XML for each encoding it has been dumped in.
+        self.__request_xml = {}
 
     def _get_volume_and_generic_security_definition_values(
         self, volume: Union[str, None], generic: bool
@@ -56,39 +63,120 @@ class SecurityRequest:
         extract: bool = False,
     ) -> None:
         """Build segment in XML format."""
+        self.__request_xml.clear()
         if not traits:
             return
-        if segment_name:
-            segment = XMLBuilder.SubElement(self._security_definition, segment_name)
-        else:
-            segment = self._security_definition
         if isinstance(traits, bool):
+            if segment_name:
+                self.__segments.setdefault(segment_name, [])
             return
+        trait_elements = []
         for trait in traits:
             if isinstance(traits[trait], bool) and not traits[trait] and not alter:
                 continue
-            trait_element = XMLBuilder.SubElement(segment, trait_map[trait])
             value = traits[trait]["value"]
             operation = traits[trait]["operation"]
+            attributes = {}
             if operation:
                 if operation == "delete":
                     operation = "del"
-                trait_element.attrib = {"operation": operation}
+                attributes = {"operation": operation}
             if not operation and alter:
-                trait_element.attrib = {"operation": "set"}
+                attributes = {"operation": "set"}
+            text = ""
             if isinstance(value, list):
-                trait_element.text = " ".join(value)
-                # trait_element.attrib = {"operation": operation}
-                continue
-            if not isinstance(value, bool):
-                trait_element.text = str(value)
-        if len(list(segment.iter())) == 1 and not extract:
-            self._security_definition.remove(segment)
+                text = escape_text(" ".join(value))
+            elif not isinstance(value, bool):
+                text = escape_text(str(value))
+            trait_elements.append(build_element(trait_map[trait], attributes, text))
+        if not segment_name:
+            self.__segments.setdefault(None, []).extend(trait_elements)
+        elif trait_elements or extract:
+            self.__segments.setdefault(segment_name, []).extend(trait_elements)
+
+    def build_segment(
+        self,
+        segment_name: str,
+        traits: Union[dict, bool],
+        trait_map: dict,
+        alter: bool = False,
+        extract: bool = False,
+    ) -> None:
+        """
+        Build segment in XML format, for requests that are built without an admin.
+        'traits' is True to list a segment in a profile extract.
+        """
+        self._build_segment(
+            segment_name, traits, trait_map, alter=alter, extract=extract
+        )
+
+    def _merge_segments(self, security_request: "SecurityRequest") -> None:
+        """Add the traits of another request for the same security definition."""
+        self.__request_xml.clear()
+        for segment_name, trait_elements in security_request.__segments.items():
+            self.__segments.setdefault(segment_name, []).extend(trait_elements)
 
     def dump_request_xml(self, encoding: str = "cp1047") -> bytes:
-        """Dump XML as EBCDIC encoded bytes. (Encoding can be overridden)."""
+        """
+        Dump XML as EBCDIC encoded bytes. (Encoding can be overridden).
+        The XML is only serialized once for each encoding, until segments
+        are built again.
+        """
         if platform.system() != "OS/390" and encoding == "cp1047":
             # If not running on z/OS, EBCDIC is most likely not supported.
             # Force utf-8 if running tests on Linux, Mac, Windows, etc...
             encoding = "utf-8"
-        return XMLBuilder.tostring(self.__racf_request, encoding=encoding)
+        request_xml = self.__request_xml.get(encoding)
+        if request_xml is None:
+            request_xml = self.__serialize_request_xml(encoding)
+            self.__request_xml[encoding] = request_xml
+        return request_xml
+
+    def _write_security_definition_xml(self) -> str:
+        """Write the XML of the security definition as text."""
+        content = ""
+        for segment_name, trait_elements in self.__segments.items():
+            if segment_name is None:
+                content += "".join(trait_elements)
+            else:
+                content += build_element(segment_name, {}, "".join(trait_elements))
+        return build_element(
+            self._security_definition.tag, self._security_definition.attrib, content
+        )
+
+    def _write_request_xml(self) -> str:
+        """Write the request XML as text."""
+        return (
+            SECURITY_REQUEST_START
+            + self._write_security_definition_xml()
+            + SECURITY_REQUEST_END
+        )
+
+    def __serialize_request_xml(self, encoding: str) -> bytes:
+        request_xml = self.__request_xml.get("unicode")
+        if request_xml is None:
+            request_xml = self._write_request_xml()
+            self.__request_xml["unicode"] = request_xml
+        if encoding == "unicode":
+            return request_xml
+        if encoding == "cp1047":
+            # Translate the text to EBCDIC in one pass,
+            # rather than going through the cp1047 codec.
+            return encode_cp1047(
+                CP1047_XML_DECLARATION + request_xml,
+                # Like ElementTree, write characters that can't be encoded
+                # as character references.
+                errors="xmlcharrefreplace",
+            )
+        return encode_request_xml(request_xml, encoding)
+
+
+class RenderedRequest(SecurityRequest):
+    """A security request whose XML has already been written."""
+
+    def __init__(self, request_xml: str) -> None:
+        super().__init__()
+        self.__rendered_request_xml = request_xml
+
+    def _write_request_xml(self) -> str:
+        return self.__rendered_request_xml
@@ -1,89 +1,352 @@
 """Generic Security Result Parser."""
 
-from xml.etree.ElementTree import Element  # Only used for type hints.
+import re
+from typing import Any, Callable, Iterator, List, Tuple, Union
 
 import defusedxml.ElementTree as XMLParser
 
+# The return and reason codes of a result are its last elements,
+# so they can be read from the end of the result XML without parsing it.
+RETURN_CODES_PATTERN = (
+    r"<returncode>\s*(-?\d+)\s*</returncode>\s*"
+    + r"<reasoncode>\s*(-?\d+)\s*</reasoncode>\s*</securityresult>\s*$"
+)
+RETURN_CODES = {
+    str: re.compile(RETURN_CODES_PATTERN),
+    bytes: re.compile(RETURN_CODES_PATTERN.encode("utf-8")),
+}
+# How far from the end of the result XML the return and reason codes are looked for.
+RETURN_CODES_LENGTH = 512
+
 
 class SecurityResult:
-    """Generic Security Result Parser."""
+    """
+    Generic Security Result Parser.
+    The result XML is only parsed when the result dictionary or the definition
+    results are asked for, so results that are only checked for their return
+    codes with 'get_return_codes()' don't have to be parsed at all. Admins
+    return the results of successful requests as a 'LazyResultDictionary',
+    which only asks for the result dictionary when it is accessed.
+    It is parsed as a stream of start, end and text events that are extracted
+    straight into the result dictionary, so no element tree is built for the
+    result. The parser is defusedxml's, which forbids entity declarations and
+    external references, so XML bombs are still rejected.
+    """
 
-    def __init__(self, result_xml: str) -> None:
-        self.__result = XMLParser.fromstring(result_xml)
-        self.__result_dictionary = {"securityResult": {}}
-        self.__extract_results()
+    def __init__(self, result_xml: Union[str, bytes]) -> None:
+        self.__result_xml = result_xml
+        self.__result_dictionary = None
+        self.__definition_results = None
 
     def __extract_results(self) -> None:
-        """Extract XML results into a dictionary."""
-        self.definition = self.__result[0]
-        self.definition.attrib["requestId"] = self.definition.attrib["requestid"]
-        del self.definition.attrib["requestid"]
-        definition_tag = self.__to_pascal_case(self.definition.tag.split("}")[-1])
-        self.__result_dictionary["securityResult"][
-            definition_tag
-        ] = self.definition.attrib
-        self.definition_dictionary = self.__result_dictionary["securityResult"][
-            definition_tag
-        ]
-        try:
-            if self.definition[0].tag.split("}")[-1] == "info":
-                self.__extract_info()
-            if self.definition[0].tag.split("}")[-1] == "error":
-                self.__extract_error()
-            else:
-                self.__extract_commands()
-        except IndexError:
-            # Index Error indicates that there is no
-            # additional information to extract from the definition.
-            pass
-        return_code = self.__result[1]
-        self.__result_dictionary["securityResult"]["returnCode"] = int(return_code.text)
-        reason_code = self.__result[2]
-        self.__result_dictionary["securityResult"]["reasonCode"] = int(reason_code.text)
-
-    def __extract_info(self) -> None:
-        """Extract info section from XML into a list."""
-        self.definition_dictionary["info"] = []
-        info = self.definition_dictionary["info"]
-        while self.definition[0].tag.split("}")[-1] == "info":
-            item = self.definition[0]
-            if item.tag.split("}")[-1] != "info":
+        """Extract XML results into a dictionary, unless they already have been."""
+        if self.__result_dictionary is not None:
+            return
+        parser = XMLParser.DefusedXMLParser(target=SecurityResultBuilder())
+        parser.feed(self.__result_xml)
+        (definition_results, return_codes) = parser.close()
+        result_dictionary = {"securityResult": {}}
+        # Requests that aren't batched have exactly one definition,
+        # which is what the result dictionary describes.
+        for definition_tag, definition_dictionary in definition_results[:1]:
+            result_dictionary["securityResult"][definition_tag] = definition_dictionary
+        result_dictionary["securityResult"].update(return_codes)
+        self.__result_dictionary = result_dictionary
+        self.__definition_results = definition_results
+        self.__result_xml = None
+
+    def get_return_codes(self) -> Tuple[int, int]:
+        """
+        Return the return code and reason code of the result. They are read
+        from the end of the result XML if it hasn't been parsed yet.
+        """
+        result_xml = self.__result_xml
+        if result_xml is not None:
+            match = RETURN_CODES[type(result_xml)].search(
+                result_xml, max(len(result_xml) - RETURN_CODES_LENGTH, 0)
+            )
+            if match is not None:
+                return (int(match[1]), int(match[2]))
+        security_result = self.get_result_dictionary()["securityResult"]
+        return (security_result["returnCode"], security_result["reasonCode"])
+
+    def get_result_dictionary(self) -> dict:
+        """Return result dictionary."""
+        self.__extract_results()
+        return self.__result_dictionary
+
+    def get_definition_results(self) -> List[tuple]:
+        """
+        Return a (definition tag, definition dictionary) tuple for each security
+        definition in the result, in the order that they were requested.
+        """
+        self.__extract_results()
+        return self.__definition_results
+
+
+class LazyResultDictionary(dict):
+    """
+    The result dictionary of a request whose return codes have been checked,
+    which is filled in by 'get_result_dictionary' the first time it is accessed,
+    so results that are never looked at, like the results of most alters, are
+    never parsed. Until then, it only holds the return and reason codes, which
+    is also what code that reads it without accessing it, like 'json.dumps()'
+    checking whether it is empty, sees. The security result dictionary is filled
+    in place, so references to it that were taken without accessing it are filled
+    in too. It is a dictionary like any other from then on.
+    """
+
+    def __init__(
+        self,
+        return_codes: Tuple[int, int],
+        get_result_dictionary: Callable[[], dict],
+    ) -> None:
+        (return_code, reason_code) = return_codes
+        super().__init__(
+            securityResult={"returnCode": return_code, "reasonCode": reason_code}
+        )
+        self.__get_result_dictionary = get_result_dictionary
+
+    def __fill_in(self) -> None:
+        """Fill in the dictionary, unless it already has been."""
+        get_result_dictionary = self.__get_result_dictionary
+        if get_result_dictionary is None:
+            return
+        self.__get_result_dictionary = None
+        security_result = super().__getitem__("securityResult")
+        security_result.clear()
+        security_result.update(get_result_dictionary()["securityResult"])
+
+    def __getitem__(self, key: str) -> Any:
+        self.__fill_in()
+        return super().__getitem__(key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self.__fill_in()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self.__fill_in()
+        super().__delitem__(key)
+
+    def __contains__(self, key: object) -> bool:
+        self.__fill_in()
+        return super().__contains__(key)
+
+    def __iter__(self) -> Iterator[str]:
+        self.__fill_in()
+        return super().__iter__()
+
+    def __reversed__(self) -> Iterator[str]:
+        self.__fill_in()
+        return super().__reversed__()
+
+    def __len__(self) -> int:
+        self.__fill_in()
+        return super().__len__()
+
+    def __eq__(self, other: object) -> bool:
+        self.__fill_in()
+        if isinstance(other, LazyResultDictionary):
+            # Compared as a copy, so that it is filled in first.
+            other = dict(other)
+        return super().__eq__(other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __or__(self, other: dict) -> dict:
+        self.__fill_in()
+        return super().__or__(other)
+
+    def __ror__(self, other: dict) -> dict:
+        self.__fill_in()
+        return super().__ror__(other)
+
+    def __ior__(self, other: dict) -> dict:
+        self.__fill_in()
+        return super().__ior__(other)
+
+    def __repr__(self) -> str:
+        self.__fill_in()
+        return super().__repr__()
+
+    def __reduce__(self) -> tuple:
+        # Copies and pickles are plain dictionaries.
+        return (dict, (dict(self),))
+
+    def keys(self) -> Any:
+        """Return the keys of the dictionary."""
+        self.__fill_in()
+        return super().keys()
+
+    def values(self) -> Any:
+        """Return the values of the dictionary."""
+        self.__fill_in()
+        return super().values()
+
+    def items(self) -> Any:
+        """Return the items of the dictionary."""
+        self.__fill_in()
+        return super().items()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value of 'key', or 'default' if there is no such key."""
+        self.__fill_in()
+        return super().get(key, default)
+
+    def copy(self) -> dict:
+        """Return a shallow copy of the dictionary."""
+        self.__fill_in()
+        return super().copy()
+
+    def pop(self, *arguments: Any) -> Any:
+        """Remove 'key' and return its value."""
+        self.__fill_in()
+        return super().pop(*arguments)
+
+    def popitem(self) -> tuple:
+        """Remove and return the last item of the dictionary."""
+        self.__fill_in()
+        return super().popitem()
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        """Return the value of 'key', setting it to 'default' if there is no such key."""
+        self.__fill_in()
+        return super().setdefault(key, default)
+
+    def update(self, *arguments: Any, **keyword_arguments: Any) -> None:
+        """Update the dictionary with the items of a dictionary or keyword arguments."""
+        self.__fill_in()
+        super().update(*arguments, **keyword_arguments)
+
+    def clear(self) -> None:
+        """Remove all items from the dictionary."""
+        self.__fill_in()
+        super().clear()
+
+
+class SecurityResultBuilder:
+    """
+    Parser target that extracts the events of a result into dictionaries.
+    The result is a security result element with a return code, a reason code
+    and an element for each security definition. A definition has leading info
+    elements, followed by either an error or commands, each of which has items.
+    """
+
+    def __init__(self) -> None:
+        self.__definition_results = []
+        self.__return_codes = {}
+        self.__depth = 0
+        self.__definition_dictionary = {}
+        # The dictionary that the items of the open error or command element
+        # are extracted into, whether the open element is a command,
+        # and whether it is a leading info element.
+        self.__section = None
+        self.__command = False
+        self.__info = False
+        # The text of the open element, or None if it has no text.
+        self.__text = None
+        # The dictionary key of each tag, converted the first time it is seen.
+        self.__keys = {}
+
+    def start(self, tag: str, attributes: dict) -> None:
+        """Start extracting an element."""
+        self.__depth += 1
+        self.__text = None
+        if self.__depth == 2:
+            self.__start_definition(attributes)
+        elif self.__depth == 3:
+            self.__start_section(self.__get_key(tag))
+
+    def data(self, text: str) -> None:
+        """Collect the text of the open element."""
+        if self.__text is None:
+            self.__text = text
+        else:
+            self.__text += text
+
+    def end(self, tag: str) -> None:
+        """Finish extracting an element."""
+        self.__depth -= 1
+        text = self.__text
+        self.__text = None
+        if self.__depth == 3:
+            # Items are by far the most common elements, so they are
+            # extracted here rather than in a method of their own.
+            if self.__section is None:
                 return
-            info.append(item.text)
-            self.definition.remove(item)
-
-    def __extract_commands(self) -> None:
-        """Extract commands section from XML into a list."""
-        self.definition_dictionary["commands"] = []
-        commands = self.definition_dictionary["commands"]
-        for command in self.definition:
-            self.__extract_command(commands, command)
-
-    def __extract_command(self, commands: dict, command: Element) -> None:
-        command_dictionary = {}
-        commands.append(command_dictionary)
-        for item in command:
-            item_tag = self.__to_pascal_case(item.tag.split("}")[-1])
-            if item_tag == "message":
-                if "messages" not in command_dictionary:
-                    command_dictionary["messages"] = []
-                command_dictionary["messages"].append(item.text)
-            else:
+            key = self.__keys.get(tag) or self.__get_key(tag)
+            if key == "message" and self.__command:
                 try:
-                    command_dictionary[item_tag] = int(item.text)
-                except ValueError:
-                    command_dictionary[item_tag] = item.text
-
-    def __extract_error(self) -> None:
-        """Extract error section from XML into a dictionary."""
-        self.definition_dictionary["error"] = {}
-        error = self.definition[0]
-        for item in error:
-            item_tag = self.__to_pascal_case(item.tag.split("}")[-1])
+                    self.__section["messages"].append(text)
+                except KeyError:
+                    self.__section["messages"] = [text]
+                return
             try:
-                self.definition_dictionary["error"][item_tag] = int(item.text)
+                self.__section[key] = int(text)
             except ValueError:
-                self.definition_dictionary["error"][item_tag] = item.text
+                self.__section[key] = text
+        elif self.__depth == 2:
+            if self.__info:
+                self.__definition_dictionary["info"].append(text)
+        elif self.__depth == 1:
+            key = self.__get_key(tag)
+            if key in ("returnCode", "reasonCode"):
+                self.__return_codes[key] = int(text)
+            else:
+                if self.__definition_dictionary.get("info") == []:
+                    del self.__definition_dictionary["info"]
+                self.__definition_results.append((key, self.__definition_dictionary))
+
+    def close(self) -> Tuple[List[tuple], dict]:
+        """Return the definition results and the return codes of the result."""
+        return (self.__definition_results, self.__return_codes)
+
+    def __start_definition(self, attributes: dict) -> None:
+        """Start the dictionary of a security definition from its attributes."""
+        self.__definition_dictionary = dict(attributes)
+        if "requestid" in self.__definition_dictionary:
+            self.__definition_dictionary[
+                "requestId"
+            ] = self.__definition_dictionary.pop("requestid")
+        # Removed again if the definition has no info.
+        self.__definition_dictionary["info"] = []
+
+    def __start_section(self, key: str) -> None:
+        """
+        Start extracting an element of a security definition. Leading info
+        elements are extracted into the info list, and the element after them
+        is either the error, or the first of the commands. Anything after an
+        error is ignored.
+        """
+        definition_dictionary = self.__definition_dictionary
+        self.__section = None
+        self.__command = False
+        self.__info = False
+        if "error" in definition_dictionary:
+            return
+        if "commands" not in definition_dictionary:
+            if key == "info":
+                self.__info = True
+                return
+            if key == "error":
+                definition_dictionary["error"] = {}
+                self.__section = definition_dictionary["error"]
+                return
+            definition_dictionary["commands"] = []
+        self.__section = {}
+        self.__command = True
+        definition_dictionary["commands"].append(self.__section)
+
+    def __get_key(self, tag: str) -> str:
+        """Get the dictionary key of a tag, without its namespace."""
+        try:
+            return self.__keys[tag]
+        except KeyError:
+            key = self.__to_pascal_case(tag.split("}")[-1])
+            self.__keys[tag] = key
+            return key
 
     def __to_pascal_case(self, key: str) -> str:
         """Convert result dictionary keys to pascal case."""
@@ -114,7 +377,3 @@ class SecurityResult:
                 return "systemSettings"
             case _:
                 return key
-
-    def get_result_dictionary(self) -> dict:
-        """Return result dictionary."""
-        return self.__result_dictionary
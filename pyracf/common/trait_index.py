@@ -0,0 +1,41 @@
+"""Index of every trait spelling an admin accepts."""
+
+from typing import Dict, Tuple, Union
+
+# Operations that can prefix a trait, i.e. 'add:base:special'.
+TRAIT_OPERATIONS = ("add", "remove", "delete")
+
+
+def freeze_field_data(field_data: Union[dict, None]) -> Union[tuple, None]:
+    """
+    Convert custom field data into nested tuples, which can't be modified
+    after the fact and can be used as a key to cache what is built from it.
+    """
+    if field_data is None:
+        return None
+    return tuple(
+        (segment, tuple(traits.items())) for segment, traits in field_data.items()
+    )
+
+
+def build_trait_index(
+    valid_segment_traits: dict,
+) -> Dict[str, Tuple[Tuple[str, str, str, str], ...]]:
+    """
+    Map every accepted trait spelling, with and without an operation prefix,
+    to a tuple of (segment, trait, XML tag, operation) entries, one for each
+    segment that accepts it. Within a segment, a trait that is spelled with
+    what looks like an operation prefix takes precedence over the prefixed
+    spelling of another trait.
+    """
+    index = {}
+    for segment, segment_traits in valid_segment_traits.items():
+        spellings = {}
+        for trait, xml_tag in segment_traits.items():
+            for operation in TRAIT_OPERATIONS:
+                spellings[f"{operation}:{trait}"] = (segment, trait, xml_tag, operation)
+        for trait, xml_tag in segment_traits.items():
+            spellings[trait] = (segment, trait, xml_tag, None)
+        for spelling, entry in spellings.items():
+            index[spelling] = index.get(spelling, ()) + (entry,)
+    return index
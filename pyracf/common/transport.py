@@ -0,0 +1,59 @@
+"""Transports used to deliver security requests to IRRSMO00."""
+
+import platform
+from typing import Tuple
+
+try:
+    from cpyracf import call_irrsmo00
+except ImportError as import_error:
+    if platform.system() == "OS/390":
+        raise import_error
+
+    # Ignore import of extension on non-z/OS platforms to allow for unit testing off platform.
+    def call_irrsmo00(
+        *, xml_str: bytes, xml_len: int, opts: int, rsp_len: int, max_rsp_len: int
+    ) -> Tuple[bytes, int, int, int]:
+        _ = xml_str, xml_len, opts, rsp_len, max_rsp_len
+        return (b"", 0, 0, 0)
+
+
+class Transport:
+    """
+    Base class for transports.
+    A transport takes request XML bytes and IRRSMO00 options and returns a tuple
+    containing the response XML bytes, the SAF return code, the RACF return code
+    and the RACF reason code. Subclasses implement 'call()'.
+    """
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        """Deliver a security request and return the response and return codes."""
+        raise NotImplementedError(
+            f"'{type(self).__name__}' does not implement 'call()'."
+        )
+
+
+class NativeTransport(Transport):
+    """Deliver security requests to IRRSMO00 using the cpyracf Python extension."""
+
+    def __init__(
+        self, buffer_size: int = 100000, max_buffer_size: int = 64 * 1024 * 1024
+    ) -> None:
+        # Initialize size of output buffer.
+        # Each thread reuses its own output buffer across calls.
+        # Responses that are larger than the output buffer are
+        # retrieved in multiple calls by the cpyracf extension,
+        # which grows the output buffer up to 'max_buffer_size'.
+        # A grown output buffer shrinks back to 'buffer_size'
+        # once the extra space has not been needed for a while.
+        self.buffer_size = buffer_size
+        self.max_buffer_size = max_buffer_size
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        """Make request to call_irrsmo00 from cpyracf Python extension."""
+        return call_irrsmo00(
+            xml_str=request_xml,
+            xml_len=len(request_xml),
+            opts=options,
+            rsp_len=self.buffer_size,
+            max_rsp_len=self.max_buffer_size,
+        )
@@ -2,7 +2,9 @@
 
 from typing import Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 from pyracf.connection.connection_request import ConnectionRequest
 
 
@@ -33,9 +35,10 @@ class ConnectionAdmin(SecurityAdmin):
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "groupConnection",
@@ -43,6 +46,7 @@ class ConnectionAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -134,7 +138,7 @@ class ConnectionAdmin(SecurityAdmin):
         self._add_traits_directly_to_request_xml_with_no_segments(
             connection_request, alter=True
         )
-        return self._make_request(connection_request)
+        return self._make_request(connection_request, deferrable=True)
 
     def delete(self, userid: str, group: str) -> Union[dict, bytes]:
         """Delete a group connection."""
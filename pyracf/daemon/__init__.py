@@ -0,0 +1,5 @@
+"""Serve pyRACF admin calls from a long running process over a UNIX domain socket."""
+from .daemon_call_error import DaemonCallError
+from .daemon_client import DaemonClient
+from .profile_cache import ProfileCache
+from .pyracf_daemon import PyracfDaemon
@@ -0,0 +1,30 @@
+"""
+Run the pyRACF daemon.
+
+Usage:
+    python3 -m pyracf.daemon --socket PATH [--threads T] [--cache-ttl SECONDS]
+"""
+
+import argparse
+
+from .pyracf_daemon import PyracfDaemon
+
+
+def main():
+    """Daemon entrypoint."""
+    parser = argparse.ArgumentParser(description="Run the pyRACF daemon.")
+    parser.add_argument("--socket", required=True, help="Path of the UNIX socket.")
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--cache-ttl", type=float, default=5.0)
+    arguments = parser.parse_args()
+    with PyracfDaemon(
+        arguments.socket, threads=arguments.threads, cache_ttl=arguments.cache_ttl
+    ) as daemon:
+        try:
+            daemon.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,20 @@
+"""Exception to use when the pyRACF daemon fails to complete a call."""
+
+
+class DaemonCallError(Exception):
+    """
+    Raised when a call made through the pyRACF daemon fails with an error
+    that is not a 'SecurityRequestError' or a 'DownstreamFatalError'.
+    """
+
+    def __init__(self, error_type: str, error_message: str) -> None:
+        self.error_type = error_type
+        self.error_message = error_message
+        self.message = (
+            "The pyRACF daemon failed to complete the call."
+            + f"\n\n{error_type}: {error_message}"
+        )
+        self.message = f"({self.__class__.__name__}) {self.message}"
+
+    def __str__(self) -> str:
+        return self.message
@@ -0,0 +1,118 @@
+"""Thin client that makes admin calls through the pyRACF daemon."""
+
+import json
+import socket
+import threading
+from typing import Any, Callable, Union
+
+from pyracf import DownstreamFatalError, SecurityRequestError
+
+from .daemon_call_error import DaemonCallError
+from .pyracf_daemon import is_admin_method
+
+
+class AdminProxy:
+    """
+    Stand in for an admin that makes every method call through the daemon.
+    Takes the same arguments and returns the same results as the admin does.
+    """
+
+    def __init__(self, client: "DaemonClient", admin_type: str) -> None:
+        self.__client = client
+        self.__admin_type = admin_type
+
+    def __getattr__(self, method: str) -> Callable[..., Any]:
+        if not is_admin_method(self.__admin_type, method):
+            raise AttributeError(
+                f"'{self.__admin_type}' object has no attribute '{method}'"
+            )
+
+        def call(*args, **kwargs) -> Any:
+            return self.__client.call(self.__admin_type, method, *args, **kwargs)
+
+        return call
+
+
+# Attributes of the client that stand in for each admin.
+ADMIN_ATTRIBUTES = {
+    "access_admin": "AccessAdmin",
+    "connection_admin": "ConnectionAdmin",
+    "data_set_admin": "DataSetAdmin",
+    "group_admin": "GroupAdmin",
+    "resource_admin": "ResourceAdmin",
+    "setropts_admin": "SetroptsAdmin",
+    "user_admin": "UserAdmin",
+}
+
+
+class DaemonClient:
+    """
+    Connect to the pyRACF daemon listening on 'socket_path'.
+    Admin calls are made through the 'access_admin', 'connection_admin',
+    'data_set_admin', 'group_admin', 'resource_admin', 'setropts_admin'
+    and 'user_admin' attributes, i.e. 'client.user_admin.extract("squidwrd")'.
+    A client can be shared by threads, but makes one call at a time.
+    """
+
+    def __init__(self, socket_path: str, timeout: Union[float, None] = None) -> None:
+        self.socket_path = socket_path
+        self.timeout = timeout
+        self.__lock = threading.Lock()
+        self.__file = None
+
+    def __getattr__(self, name: str) -> AdminProxy:
+        if name not in ADMIN_ATTRIBUTES:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            )
+        return AdminProxy(self, ADMIN_ATTRIBUTES[name])
+
+    def __enter__(self) -> "DaemonClient":
+        return self
+
+    def __exit__(self, *_) -> None:
+        self.close()
+
+    def call(self, admin_type: str, method: str, *args, **kwargs) -> Any:
+        """Call 'method' of the admin called 'admin_type' in the daemon."""
+        request = json.dumps(
+            {"admin": admin_type, "method": method, "args": args, "kwargs": kwargs},
+            separators=(",", ":"),
+        ).encode("utf-8")
+        with self.__lock:
+            if self.__file is None:
+                self.__connect()
+            try:
+                self.__file.write(request + b"\n")
+                self.__file.flush()
+                line = self.__file.readline()
+            except OSError:
+                self.close()
+                raise
+        if not line:
+            self.close()
+            raise ConnectionError("The pyRACF daemon closed the connection.")
+        response = json.loads(line)
+        if "error" in response:
+            self.__raise_error(response["error"])
+        return response["result"]
+
+    def close(self) -> None:
+        """Close the connection to the daemon."""
+        if self.__file is not None:
+            self.__file.close()
+        self.__file = None
+
+    def __connect(self) -> None:
+        # The connection stays open until the file made from the socket is closed.
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as unix_socket:
+            unix_socket.settimeout(self.timeout)
+            unix_socket.connect(self.socket_path)
+            self.__file = unix_socket.makefile("rwb")
+
+    def __raise_error(self, error: dict) -> None:
+        if error["type"] == "SecurityRequestError":
+            raise SecurityRequestError(error["result"])
+        if error["type"] == "DownstreamFatalError":
+            raise DownstreamFatalError(*error["returnCodes"])
+        raise DaemonCallError(error["type"], error["message"])
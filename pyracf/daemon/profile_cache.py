@@ -0,0 +1,53 @@
+"""Cache of read results shared by every connection to the pyRACF daemon."""
+
+import threading
+import time
+from typing import Union
+
+
+class ProfileCache:
+    """
+    Cache serialized results of read calls for 'ttl' seconds.
+    Every write invalidates the whole cache, since writes such as connecting
+    a user to a group change more than one profile. A 'ttl' of 0 disables it.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self.__lock = threading.Lock()
+        self.__entries = {}
+        self.__generation = 0
+
+    def get(self, key: str) -> Union[str, None]:
+        """Return the cached result for 'key', or None if there isn't one."""
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            (expires, result) = entry
+            if time.monotonic() >= expires:
+                del self.__entries[key]
+                return None
+            return result
+
+    def get_generation(self) -> int:
+        """Return a number that changes every time the cache is invalidated."""
+        with self.__lock:
+            return self.__generation
+
+    def put(self, key: str, result: str, generation: int) -> None:
+        """
+        Cache 'result' for 'key' unless the cache was invalidated since
+        'generation' was read, which means 'result' may already be stale.
+        """
+        if self.ttl <= 0:
+            return
+        with self.__lock:
+            if generation == self.__generation:
+                self.__entries[key] = (time.monotonic() + self.ttl, result)
+
+    def invalidate(self) -> None:
+        """Remove every result from the cache."""
+        with self.__lock:
+            self.__entries.clear()
+            self.__generation += 1
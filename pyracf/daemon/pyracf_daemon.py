@@ -0,0 +1,204 @@
+"""Long running pyRACF server that takes admin calls over a UNIX domain socket."""
+
+import json
+import os
+import socketserver
+import stat
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Tuple, Union
+
+from pyracf import (
+    AccessAdmin,
+    ConnectionAdmin,
+    DataSetAdmin,
+    DownstreamFatalError,
+    GroupAdmin,
+    ResourceAdmin,
+    SecurityRequestError,
+    SetroptsAdmin,
+    UserAdmin,
+)
+from pyracf.common.transport import Transport
+
+from .profile_cache import ProfileCache
+
+ADMIN_CLASSES = {
+    admin_class.__name__: admin_class
+    for admin_class in [
+        AccessAdmin,
+        ConnectionAdmin,
+        DataSetAdmin,
+        GroupAdmin,
+        ResourceAdmin,
+        SetroptsAdmin,
+        UserAdmin,
+    ]
+}
+
+# Admin methods that only read RACF, whose results can be cached.
+READ_METHOD_PREFIXES = ("extract", "get_", "has_", "list_")
+# The admin methods that can be called through the daemon, which are the ones
+# that extract, add, alter or delete profiles, and the getters and setters.
+ADMIN_METHOD_PREFIXES = READ_METHOD_PREFIXES + (
+    "add",
+    "alter",
+    "delete",
+    "give_",
+    "refresh_",
+    "remove_",
+    "set_",
+    "take_away_",
+)
+# Public admin methods that can't be called through the daemon, either because
+# their results can't be sent as JSON, or because they change the admins that
+# every client shares.
+EXCLUDED_ADMIN_METHODS = ("batch", "deferred", "ensure", "prepare", "set_call_priority")
+ADMIN_METHODS = {
+    admin_type: frozenset(
+        method
+        for method in dir(admin_class)
+        if method.startswith(ADMIN_METHOD_PREFIXES)
+        and method not in EXCLUDED_ADMIN_METHODS
+        and callable(getattr(admin_class, method))
+    )
+    for admin_type, admin_class in ADMIN_CLASSES.items()
+}
+
+
+def is_admin_method(admin_type: str, method: str) -> bool:
+    """Return True if 'method' of the admin called 'admin_type' can be called."""
+    return method in ADMIN_METHODS.get(admin_type, ())
+
+
+def encode_response(response: dict) -> bytes:
+    """Encode a response as one line of JSON."""
+    return json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n"
+
+
+def get_error_response(error: BaseException) -> dict:
+    """Describe an error raised by an admin call as the error of a response."""
+    if isinstance(error, SecurityRequestError):
+        return {"type": "SecurityRequestError", "result": error.result}
+    if isinstance(error, DownstreamFatalError):
+        return {
+            "type": "DownstreamFatalError",
+            "returnCodes": [
+                error.saf_return_code,
+                error.racf_return_code,
+                error.racf_reason_code,
+            ],
+        }
+    return {"type": type(error).__name__, "message": str(error)}
+
+
+class DaemonRequestHandler(socketserver.StreamRequestHandler):
+    """Answer each line of JSON sent over a connection with one line of JSON."""
+
+    def handle(self) -> None:
+        for line in self.rfile:
+            if line.strip():
+                self.wfile.write(self.server.call(line))
+
+
+class PyracfDaemon(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """
+    Serve admin calls to clients connecting to 'socket_path'.
+    Calls are made on a pool of 'threads' threads, each of which keeps its own
+    warm admin instances, so no more than 'threads' calls are ever in flight.
+    Results of read calls are shared by every client for 'cache_ttl' seconds.
+    Every call is made with the authority of the user running the daemon, so
+    the socket is only accessible to that user unless 'socket_mode' says otherwise.
+    """
+
+    daemon_threads = True
+
+    def __init__(
+        self,
+        socket_path: str,
+        transport: Union[Transport, None] = None,
+        threads: int = 8,
+        cache_ttl: float = 5.0,
+        socket_mode: int = 0o600,
+    ) -> None:
+        self.transport = transport
+        self.socket_mode = socket_mode
+        self.cache = ProfileCache(cache_ttl)
+        self.__executor = ThreadPoolExecutor(max_workers=threads)
+        self.__admins = threading.local()
+        if os.path.exists(socket_path) and stat.S_ISSOCK(os.stat(socket_path).st_mode):
+            # Left behind by a daemon that didn't shut down cleanly.
+            os.unlink(socket_path)
+        super().__init__(socket_path, DaemonRequestHandler)
+
+    def server_bind(self) -> None:
+        # Create the socket without any permissions for other users
+        # so that nobody can connect before it has been locked down.
+        umask = os.umask(0o177)
+        try:
+            super().server_bind()
+        finally:
+            os.umask(umask)
+        os.chmod(self.server_address, self.socket_mode)
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.__executor.shutdown(wait=True)
+        if os.path.exists(self.server_address):
+            os.unlink(self.server_address)
+
+    def call(self, request: bytes) -> bytes:
+        """Make the admin call described by one line of JSON and return the response."""
+        try:
+            call = json.loads(request)
+            (admin_type, method) = (call["admin"], call["method"])
+            (args, kwargs) = (call.get("args", []), call.get("kwargs", {}))
+            if not isinstance(args, list) or not isinstance(kwargs, dict):
+                raise TypeError("'args' must be a list and 'kwargs' an object.")
+            if not is_admin_method(admin_type, method):
+                raise ValueError(f"'{admin_type}.{method}()' is not an admin method.")
+        except (ValueError, KeyError, TypeError) as error:
+            return encode_response(
+                {"error": {"type": type(error).__name__, "message": str(error)}}
+            )
+        if not method.startswith(READ_METHOD_PREFIXES):
+            try:
+                return self.__submit(admin_type, method, args, kwargs)[0]
+            finally:
+                self.cache.invalidate()
+        key = json.dumps([admin_type, method, args, kwargs], sort_keys=True)
+        response = self.cache.get(key)
+        if response is None:
+            generation = self.cache.get_generation()
+            (response, succeeded) = self.__submit(admin_type, method, args, kwargs)
+            if succeeded:
+                self.cache.put(key, response, generation)
+        return response
+
+    def __submit(
+        self, admin_type: str, method: str, args: list, kwargs: dict
+    ) -> Tuple[bytes, bool]:
+        """
+        Make an admin call on the pool and return its response, and whether it
+        succeeded. Every error, including results that can't be sent as JSON,
+        is answered with an error response, so the connection stays open.
+        """
+        future = self.__executor.submit(
+            self.__call_admin, admin_type, method, args, kwargs
+        )
+        error = future.exception()
+        if error is None:
+            try:
+                return (encode_response({"result": future.result()}), True)
+            except (TypeError, ValueError) as encode_error:
+                error = encode_error
+        return (encode_response({"error": get_error_response(error)}), False)
+
+    def __call_admin(
+        self, admin_type: str, method: str, args: list, kwargs: dict
+    ) -> Any:
+        admin = getattr(self.__admins, admin_type, None)
+        if admin is None:
+            admin = ADMIN_CLASSES[admin_type](transport=self.transport)
+            setattr(self.__admins, admin_type, admin)
+        return getattr(admin, method)(*args, **kwargs)
@@ -1,8 +1,10 @@
 """RACF Data Set Profile Administration."""
 
-from typing import Union
+from typing import Literal, Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .data_set_request import DataSetRequest
 
@@ -49,17 +51,33 @@ class DataSetAdmin(SecurityAdmin):
             "base:volume": "racf:volume",
             "base:volser": "racf:volser",
             "base:warning": "racf:warning",
+            **{
+                trait: xml_tag
+                for trait, xml_tag in (
+                    SecurityAdmin._common_base_traits_data_set_generic.items()
+                )
+                if trait != "base:generic"
+            },
         },
         "dfp": {"dfp:resowner": "racf:resowner", "dfp:datakey": "racf:datakey"},
         "tme": {"tme:roles": "racf:roles"},
     }
+    _profile_fields = {
+        "base:data": "installationData",
+        "base:level": "level",
+        "base:notify": "notify",
+        "base:owner": "owner",
+        "base:universal_access": "universalAccess",
+    }
+    _case_sensitive_fields = ("base:data",)
 
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "dataSet",
@@ -67,11 +85,8 @@ class DataSetAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
-        self._valid_segment_traits["base"].update(
-            self._common_base_traits_data_set_generic
-        )
-        del self._valid_segment_traits["base"]["base:generic"]
 
     # ============================================================================
     # Access
@@ -120,7 +135,31 @@ class DataSetAdmin(SecurityAdmin):
         self._build_segment_dictionaries(traits)
         data_set_request = DataSetRequest(data_set, "set", volume, generic)
         self._build_xml_segments(data_set_request, alter=True)
-        return self._make_request(data_set_request, irrsmo00_options=3)
+        return self._make_request(data_set_request, irrsmo00_options=3, deferrable=True)
+
+    def ensure(
+        self,
+        data_set: str,
+        traits: dict,
+        volume: Union[str, None] = None,
+        generic: bool = False,
+    ) -> Union[dict, Literal[False], bytes]:
+        """
+        Alter only the traits of a data set profile that differ from its profile,
+        which is extracted once. Returns False without making an alter
+        if the profile already has all of the traits.
+        """
+        profile = self.extract(
+            data_set,
+            segments=self._get_ensure_segments(traits),
+            volume=volume,
+            generic=generic,
+            profile_only=True,
+        )
+        changed_traits = self._get_changed_traits(profile, traits)
+        if not changed_traits:
+            return False
+        return self.alter(data_set, changed_traits, volume=volume, generic=generic)
 
     def extract(
         self,
@@ -1,8 +1,10 @@
 """Group Administration."""
 
-from typing import Union
+from typing import Literal, Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .group_request import GroupRequest
 
@@ -38,13 +40,24 @@ class GroupAdmin(SecurityAdmin):
         "ovm": {"ovm:gid": "racf:gid"},
         "tme": {"tme:roles": "racf:roles"},
     }
+    _profile_fields = {
+        "base:data": "installationData",
+        "base:model": "modelDataSet",
+        "base:owner": "owner",
+        "base:supgroup": "superiorGroup",
+        "base:termuacc": "terminalUniversalAccess",
+        "omvs:gid": "gid",
+        "ovm:gid": "gid",
+    }
+    _case_sensitive_fields = ("base:data",)
 
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "group",
@@ -52,6 +65,7 @@ class GroupAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -133,7 +147,21 @@ class GroupAdmin(SecurityAdmin):
         self._build_segment_dictionaries(traits)
         group_request = GroupRequest(group, "set")
         self._build_xml_segments(group_request, alter=True)
-        return self._make_request(group_request, irrsmo00_options=3)
+        return self._make_request(group_request, irrsmo00_options=3, deferrable=True)
+
+    def ensure(self, group: str, traits: dict) -> Union[dict, Literal[False], bytes]:
+        """
+        Alter only the traits of a group that differ from its profile,
+        which is extracted once. Returns False without making an alter
+        if the profile already has all of the traits.
+        """
+        profile = self.extract(
+            group, segments=self._get_ensure_segments(traits), profile_only=True
+        )
+        changed_traits = self._get_changed_traits(profile, traits)
+        if not changed_traits:
+            return False
+        return self.alter(group, traits=changed_traits)
 
     def extract(
         self, group: str, segments: dict = {}, profile_only: bool = False
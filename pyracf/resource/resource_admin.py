@@ -1,8 +1,10 @@
 """General Resource Profile Administration."""
 
-from typing import Union
+from typing import Literal, Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .resource_request import ResourceRequest
 
@@ -168,13 +170,23 @@ class ResourceAdmin(SecurityAdmin):
             "tme:roles": "racf:roles",
         },
     }
+    _profile_fields = {
+        "base:appldata": "applicationData",
+        "base:data": "installationData",
+        "base:level": "level",
+        "base:notify": "notify",
+        "base:owner": "owner",
+        "base:universal_access": "universalAccess",
+    }
+    _case_sensitive_fields = ("base:appldata", "base:data")
 
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "resource",
@@ -182,6 +194,7 @@ class ResourceAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -230,7 +243,26 @@ class ResourceAdmin(SecurityAdmin):
         self._build_segment_dictionaries(traits)
         profile_request = ResourceRequest(resource, class_name, "set")
         self._build_xml_segments(profile_request, alter=True)
-        return self._make_request(profile_request, irrsmo00_options=3)
+        return self._make_request(profile_request, irrsmo00_options=3, deferrable=True)
+
+    def ensure(
+        self, resource: str, class_name: str, traits: dict
+    ) -> Union[dict, Literal[False], bytes]:
+        """
+        Alter only the traits of a general resource profile that differ from its profile,
+        which is extracted once. Returns False without making an alter
+        if the profile already has all of the traits.
+        """
+        profile = self.extract(
+            resource,
+            class_name,
+            segments=self._get_ensure_segments(traits),
+            profile_only=True,
+        )
+        changed_traits = self._get_changed_traits(profile, traits)
+        if not changed_traits:
+            return False
+        return self.alter(resource, class_name, traits=changed_traits)
 
     def extract(
         self, resource: str, class_name: str, segments={}, profile_only: bool = False
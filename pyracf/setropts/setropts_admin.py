@@ -2,7 +2,9 @@
 
 from typing import List, Tuple, Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .setropts_requset import SetroptsRequest
 
@@ -100,9 +102,10 @@ class SetroptsAdmin(SecurityAdmin):
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "systemSettings",
@@ -110,6 +113,7 @@ class SetroptsAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -295,7 +299,7 @@ class SetroptsAdmin(SecurityAdmin):
         self._build_segment_dictionaries(options)
         setropts_request = SetroptsRequest()
         self._add_traits_directly_to_request_xml_with_no_segments(setropts_request)
-        return self._make_request(setropts_request)
+        return self._make_request(setropts_request, deferrable=True)
 
     # ============================================================================
     # Private/Protected Utility Functions
@@ -0,0 +1,3 @@
+"""In-memory RACF simulator for running pyRACF off platform."""
+from .racf_database import RacfDatabase
+from .simulated_transport import SimulatedTransport
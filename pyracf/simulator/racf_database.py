@@ -0,0 +1,979 @@
+"""In-memory RACF database used by the RACF simulator."""
+
+import threading
+from datetime import date
+from typing import Iterable, List, Tuple, Union
+
+from .setropts_listing import SETROPTS_CLASS_LISTS, list_setropts
+
+ACCESS_LEVELS = ["NONE", "EXECUTE", "READ", "UPDATE", "CONTROL", "ALTER"]
+
+# Commands that complete normally or fail with one of these return and reason codes.
+SUCCESS = (0, 0, 0)
+NOT_FOUND = (8, 16, 4)
+INVALID = (8, 16, 8)
+
+DEFAULT_CLASSES = [
+    "ACCTNUM",
+    "APPL",
+    "CDT",
+    "CONSOLE",
+    "DASDVOL",
+    "DIGTCERT",
+    "DIGTRING",
+    "FACILITY",
+    "FIELD",
+    "JESSPOOL",
+    "OPERCMDS",
+    "PROGRAM",
+    "RACFVARS",
+    "SDSF",
+    "SERVAUTH",
+    "STARTED",
+    "SURROGAT",
+    "TAPEVOL",
+    "TERMINAL",
+    "TSOAUTH",
+    "TSOPROC",
+    "UNIXPRIV",
+    "XFACILIT",
+]
+
+# Keywords that differ from the XML tags used by IRRSMO00.
+KEYWORDS = {
+    "assize": "ASSIZEMAX",
+    "cputime": "CPUTIMEMAX",
+    "defgroup": "DFLTGRP",
+    "filemax": "FILEPROCMAX",
+    "memlim": "MEMLIMIT",
+    "mmaparea": "MMAPAREAMAX",
+    "oper": "OPERATIONS",
+    "pgm": "PROGRAM",
+    "procmax": "PROCUSERMAX",
+    "resumedate": "RESUME",
+    "revokedate": "REVOKE",
+    "threads": "THREADSMAX",
+}
+
+# Fields that are always shown in user and group segment listings, in listing order.
+SEGMENT_LISTING_FIELDS = {
+    ("user", "omvs"): [
+        "uid",
+        "home",
+        "pgm",
+        "cputime",
+        "assize",
+        "filemax",
+        "procmax",
+        "threads",
+        "mmaparea",
+    ]
+}
+SEGMENT_LISTING_DEFAULTS = {
+    "cputime": "NONE",
+    "assize": "NONE",
+    "filemax": "NONE",
+    "procmax": "NONE",
+    "threads": "NONE",
+    "mmaparea": "NONE",
+}
+
+
+class RacfDatabase:
+    """
+    In-memory RACF database.
+    Processes the security definitions of IRRSMO00 requests as the RACF
+    commands that IRRSMO00 would issue, keeping users, groups, connections,
+    data set and general resource profiles, permits and SETROPTS options.
+    """
+
+    def __init__(
+        self, issuer: str = "IBMUSER", classes: Union[Iterable[str], None] = None
+    ) -> None:
+        self.__lock = threading.Lock()
+        self.issuer = issuer.upper()
+        self.classes = set(DEFAULT_CLASSES)
+        if classes is not None:
+            self.classes.update(class_name.upper() for class_name in classes)
+        self.users = {}
+        self.groups = {}
+        self.connections = {}
+        self.data_sets = {}
+        self.resources = {}
+        self.setropts = {
+            "classtat": [],
+            "audit": [],
+            "classact": ["DATASET", "USER", "GROUP"],
+            "generic": ["DATASET"],
+            "gencmd": ["DATASET"],
+            "genlist": [],
+            "global": [],
+            "raclist": [],
+            "egn": True,
+            "grplist": True,
+            "initstat": True,
+            "interval": "186",
+            "jesbatch": True,
+            "minchang": "0",
+            "retpd": "0",
+            "tapedsn": True,
+            "terminal": "READ",
+            "warning": "10",
+        }
+        self.__add_group("SYS1", {}, owner=self.issuer, superior_group=None)
+        self.__add_user(self.issuer, {}, owner=self.issuer)
+
+    # ============================================================================
+    # Request Processing
+    # ============================================================================
+    def process(
+        self,
+        definition_type: str,
+        attributes: dict,
+        segments: dict,
+        precheck: bool = False,
+    ) -> Tuple[List[dict], List[str]]:
+        """
+        Process a security definition and return the commands that
+        were issued along with any informational messages.
+        """
+        handlers = {
+            "user": self.__process_user,
+            "group": self.__process_group,
+            "groupconnection": self.__process_connection,
+            "dataset": self.__process_data_set,
+            "resource": self.__process_resource,
+            "permission": self.__process_permission,
+            "systemsettings": self.__process_setropts,
+        }
+        with self.__lock:
+            return handlers[definition_type](attributes, segments, precheck)
+
+    def __process_profile(
+        self,
+        commands: dict,
+        profile_exists: bool,
+        attributes: dict,
+        segments: dict,
+        precheck: bool,
+    ) -> Tuple[List[dict], List[str]]:
+        """Process a definition of a profile that can be added, altered, listed and deleted."""
+        operation = attributes.get("operation")
+        if operation == "listdata":
+            return ([commands["list"](segments)], [])
+        if operation == "del":
+            return ([commands["delete"]()], [])
+        if precheck and profile_exists:
+            return (
+                [commands["alter"](segments)],
+                ["Definition exists. Add command skipped due  to precheck option"],
+            )
+        return ([commands["add"](), commands["alter"](segments)], [])
+
+    # ============================================================================
+    # Users
+    # ============================================================================
+    def __process_user(
+        self, attributes: dict, segments: dict, precheck: bool
+    ) -> Tuple[List[dict], List[str]]:
+        userid = attributes["name"].upper()
+        return self.__process_profile(
+            {
+                "add": lambda: self.__add_user_command(userid),
+                "alter": lambda segments: self.__alter_user_command(userid, segments),
+                "list": lambda segments: self.__list_user_command(userid, segments),
+                "delete": lambda: self.__delete_user_command(userid),
+            },
+            userid in self.users,
+            attributes,
+            segments,
+            precheck,
+        )
+
+    def __add_user(self, userid: str, segments: dict, owner: str) -> None:
+        default_group = (
+            self.users.get(owner, {}).get("base", {}).get("defgroup", "SYS1")
+        )
+        self.users[userid] = {
+            "base": {"owner": owner, "defgroup": default_group},
+            "created": self.__today(),
+        }
+        self.__connect(userid, default_group)
+        self.__apply_segments(self.users[userid], segments)
+
+    def __add_user_command(self, userid: str) -> dict:
+        image = f"ADDUSER {userid} "
+        if userid in self.users or userid in self.groups:
+            return self.__command(
+                image, [f"IKJ56702I INVALID USERID, {userid}"], INVALID
+            )
+        self.__add_user(userid, {}, owner=self.issuer)
+        return self.__command(
+            image, [f"ICH01024I User {userid} is defined as PROTECTED."]
+        )
+
+    def __alter_user_command(self, userid: str, segments: dict) -> dict:
+        image = self.__image("ALTUSER", userid, segments)
+        if userid not in self.users:
+            return self.__command(
+                image, [f"IKJ56702I INVALID USERID, {userid}"], INVALID
+            )
+        error = self.__validate_segments(segments)
+        if error:
+            return self.__command(image, [error], INVALID)
+        self.__apply_segments(self.users[userid], segments)
+        default_group = self.users[userid]["base"]["defgroup"].upper()
+        if (userid, default_group) not in self.connections:
+            self.__connect(userid, default_group)
+        return self.__command(image)
+
+    def __delete_user_command(self, userid: str) -> dict:
+        image = f"DELUSER {userid}"
+        if userid not in self.users:
+            return self.__command(
+                image, [f"IKJ56702I INVALID USERID, {userid}"], INVALID
+            )
+        del self.users[userid]
+        for connection in [key for key in self.connections if key[0] == userid]:
+            del self.connections[connection]
+        self.__remove_from_access_lists(userid)
+        return self.__command(image)
+
+    def __list_user_command(self, userid: str, segments: dict) -> dict:
+        image = f"LISTUSER {userid} " + "".join(
+            f" {segment.upper():<8}" for segment in segments if segment != "base"
+        )
+        if userid not in self.users:
+            return self.__command(
+                image, [f"ICH30001I UNABLE TO LOCATE USER    ENTRY {userid}"], NOT_FOUND
+            )
+        user = self.users[userid]
+        base = user["base"]
+        attributes = [
+            keyword
+            for keyword in ["SPECIAL", "OPERATIONS", "AUDITOR", "ROAUDIT"]
+            if base.get(self.__tag(keyword))
+        ]
+        if "password" not in base and "phrase" not in base:
+            attributes.append("PROTECTED")
+        messages = [
+            f"USER={userid:<8}  NAME={self.__upper(base.get('name', 'UNKNOWN')):<20}  "
+            + f"OWNER={self.__upper(base['owner']):<8}  CREATED={user['created']}",
+            f" DEFAULT-GROUP={self.__upper(base['defgroup']):<8} "
+            + f"PASSDATE={base.get('passdate', '00.000'):<6} "
+            + f"PASS-INTERVAL={base.get('passint', '186'):>3} "
+            + f"PHRASEDATE={base.get('phrdate', 'N/A')}",
+            f" ATTRIBUTES={' '.join(attributes) if attributes else 'NONE'}",
+            f" REVOKE DATE={self.__upper(base.get('revokedate', 'NONE')):<6} "
+            + f" RESUME DATE={self.__upper(base.get('resumedate', 'NONE'))}",
+            " LAST-ACCESS=UNKNOWN",
+            f" CLASS AUTHORIZATIONS={' '.join(base.get('clauth', [])) or 'NONE'}",
+            f" INSTALLATION-DATA={base['data']}"
+            if "data" in base
+            else " NO-INSTALLATION-DATA",
+            f" MODEL-NAME={self.__upper(base['model'])}"
+            if "model" in base
+            else " NO-MODEL-NAME",
+            " LOGON ALLOWED   (DAYS)          (TIME)",
+            " ---------------------------------------------",
+            " ANYDAY                          ANYTIME",
+        ]
+        for (connected_userid, group), connection in self.connections.items():
+            if connected_userid != userid:
+                continue
+            messages += [
+                f"  GROUP={group:<8}  AUTH={connection['auth']:<8} "
+                + f"CONNECT-OWNER={connection['owner']:<8}  "
+                + f"CONNECT-DATE={connection['created']}",
+                f"    CONNECTS=    00  UACC={connection['uacc']:<8} LAST-CONNECT=UNKNOWN",
+                f"    CONNECT ATTRIBUTES={self.__connect_attributes(connection)}",
+                "    REVOKE DATE=NONE   RESUME DATE=NONE",
+            ]
+        messages += [
+            "SECURITY-LEVEL=NONE SPECIFIED",
+            "CATEGORY-AUTHORIZATION",
+            " NONE SPECIFIED",
+            "SECURITY-LABEL=NONE SPECIFIED",
+        ]
+        messages += self.__list_segments(user, "user", segments)
+        return self.__command(image, messages)
+
+    # ============================================================================
+    # Groups
+    # ============================================================================
+    def __process_group(
+        self, attributes: dict, segments: dict, precheck: bool
+    ) -> Tuple[List[dict], List[str]]:
+        group = attributes["name"].upper()
+        return self.__process_profile(
+            {
+                "add": lambda: self.__add_group_command(group),
+                "alter": lambda segments: self.__alter_group_command(group, segments),
+                "list": lambda segments: self.__list_group_command(group, segments),
+                "delete": lambda: self.__delete_group_command(group),
+            },
+            group in self.groups,
+            attributes,
+            segments,
+            precheck,
+        )
+
+    def __add_group(
+        self,
+        group: str,
+        segments: dict,
+        owner: str,
+        superior_group: Union[str, None],
+    ) -> None:
+        self.groups[group] = {
+            "base": {"owner": owner, "termuacc": True},
+            "created": self.__today(),
+        }
+        if superior_group is not None:
+            self.groups[group]["base"]["supgroup"] = superior_group
+        self.__apply_segments(self.groups[group], segments)
+
+    def __add_group_command(self, group: str) -> dict:
+        image = f"ADDGROUP {group} "
+        if group in self.groups or group in self.users:
+            return self.__command(image, [f"IKJ56702I INVALID GROUP, {group}"], INVALID)
+        default_group = self.users[self.issuer]["base"]["defgroup"].upper()
+        self.__add_group(group, {}, owner=self.issuer, superior_group=default_group)
+        return self.__command(image)
+
+    def __alter_group_command(self, group: str, segments: dict) -> dict:
+        image = self.__image("ALTGROUP", group, segments)
+        if group not in self.groups:
+            return self.__command(image, [f"IKJ56702I INVALID GROUP, {group}"], INVALID)
+        error = self.__validate_segments(segments)
+        if error:
+            return self.__command(image, [error], INVALID)
+        self.__apply_segments(self.groups[group], segments)
+        return self.__command(image)
+
+    def __delete_group_command(self, group: str) -> dict:
+        image = f"DELGROUP {group}"
+        if group not in self.groups:
+            return self.__command(image, [f"IKJ56702I INVALID GROUP, {group}"], INVALID)
+        del self.groups[group]
+        for connection in [key for key in self.connections if key[1] == group]:
+            del self.connections[connection]
+        self.__remove_from_access_lists(group)
+        return self.__command(image)
+
+    def __list_group_command(self, group: str, segments: dict) -> dict:
+        image = f"LISTGRP {group} " + "".join(
+            f" {segment.upper():<8}" for segment in segments if segment != "base"
+        )
+        if group not in self.groups:
+            return self.__command(
+                image, ["ICH51003I NAME NOT FOUND IN RACF DATA SET"], NOT_FOUND
+            )
+        base = self.groups[group]["base"]
+        superior_group = self.__upper(base.get("supgroup", "NONE"))
+        messages = [
+            f"INFORMATION FOR GROUP {group}",
+            f"    SUPERIOR GROUP={superior_group:<8}     "
+            + f"OWNER={self.__upper(base['owner']):<8}    "
+            + f"CREATED={self.groups[group]['created']}",
+            f"    INSTALLATION DATA={base['data']}"
+            if "data" in base
+            else "    NO INSTALLATION DATA",
+            f"    MODEL DATA SET={self.__upper(base['model'])}"
+            if "model" in base
+            else "    NO MODEL DATA SET",
+            "    TERMUACC" if base.get("termuacc") else "    NO TERMUACC",
+        ]
+        subgroups = [
+            subgroup
+            for subgroup, profile in self.groups.items()
+            if self.__upper(profile["base"].get("supgroup", "")) == group
+        ]
+        if subgroups:
+            messages.append(
+                "    SUBGROUP(S)= " + " ".join(f"{name:<8}" for name in subgroups)
+            )
+        else:
+            messages.append("    NO SUBGROUPS")
+        connections = [
+            (userid, connection)
+            for (userid, connected_group), connection in self.connections.items()
+            if connected_group == group
+        ]
+        if connections:
+            messages.append(
+                "    USER(S)=      ACCESS=      ACCESS COUNT=      UNIVERSAL ACCESS="
+            )
+        else:
+            messages.append("    NO USERS")
+        for userid, connection in connections:
+            messages += [
+                f"      {userid:<8}      {connection['auth']:<8}      000000"
+                + f"               {connection['uacc']}",
+                f"         CONNECT ATTRIBUTES={self.__connect_attributes(connection)}",
+                "         REVOKE DATE=NONE                 RESUME DATE=NONE",
+            ]
+        messages += self.__list_segments(self.groups[group], "group", segments)
+        return self.__command(image, messages)
+
+    # ============================================================================
+    # Group Connections
+    # ============================================================================
+    def __process_connection(
+        self, attributes: dict, segments: dict, _: bool
+    ) -> Tuple[List[dict], List[str]]:
+        return ([self.__connection_command(attributes, segments)], [])
+
+    def __connection_command(self, attributes: dict, segments: dict) -> dict:
+        userid = attributes["name"].upper()
+        group = attributes["group"].upper()
+        if attributes.get("operation") == "del":
+            image = f"REMOVE  {userid}  GROUP       ({group})"
+            if (userid, group) not in self.connections:
+                return self.__command(
+                    image,
+                    [f"ICH03002I {userid:<8} WAS NOT CONNECTED TO GROUP."],
+                    NOT_FOUND,
+                )
+            del self.connections[(userid, group)]
+            return self.__command(image)
+        image = self.__image(f"CONNECT {userid}  GROUP       ({group})", "", segments)
+        if userid not in self.users or group not in self.groups:
+            return self.__command(
+                image,
+                [
+                    "ICH51003I NAME NOT FOUND IN RACF DATA SET",
+                    "ICH02003I USER(S) NOT CONNECTED.",
+                ],
+                INVALID,
+            )
+        if (userid, group) not in self.connections:
+            self.__connect(userid, group)
+        connection = self.connections[(userid, group)]
+        for trait, operation, value in segments.get("base", []):
+            if trait in ("auth", "uacc", "owner"):
+                if operation != "del":
+                    connection[trait] = value.upper()
+            elif operation == "del":
+                connection["attributes"].pop(trait, None)
+            else:
+                connection["attributes"][trait] = True
+        return self.__command(image)
+
+    def __connect(self, userid: str, group: str) -> None:
+        self.connections[(userid, group)] = {
+            "auth": "USE",
+            "owner": self.issuer,
+            "uacc": "NONE",
+            "created": self.__today(),
+            "attributes": {},
+        }
+
+    def __connect_attributes(self, connection: dict) -> str:
+        attributes = [
+            {"oper": "OPERATIONS", "grpacc": "GRPACC"}.get(trait, trait.upper())
+            for trait in connection["attributes"]
+        ]
+        return " ".join(attributes) if attributes else "NONE"
+
+    # ============================================================================
+    # Data Set Profiles
+    # ============================================================================
+    def __process_data_set(
+        self, attributes: dict, segments: dict, precheck: bool
+    ) -> Tuple[List[dict], List[str]]:
+        data_set = attributes["name"].upper()
+        return self.__process_profile(
+            {
+                "add": lambda: self.__add_data_set_command(data_set, attributes),
+                "alter": lambda segments: self.__alter_data_set_command(
+                    data_set, segments
+                ),
+                "list": lambda segments: self.__list_data_set_command(
+                    data_set, segments
+                ),
+                "delete": lambda: self.__delete_data_set_command(data_set),
+            },
+            data_set in self.data_sets,
+            attributes,
+            segments,
+            precheck,
+        )
+
+    def __add_data_set_command(self, data_set: str, attributes: dict) -> dict:
+        image = f"ADDSD                ('{data_set}')"
+        high_level_qualifier = data_set.split(".")[0]
+        if data_set in self.data_sets:
+            return self.__command(
+                image, [f"ICH09017I {data_set} ALREADY DEFINED TO RACF"], NOT_FOUND
+            )
+        if (
+            high_level_qualifier not in self.users
+            and high_level_qualifier not in self.groups
+        ):
+            return self.__command(
+                image,
+                [
+                    f"ICH09006I USER OR GROUP {high_level_qualifier:<8} "
+                    + "NOT DEFINED TO RACF"
+                ],
+                NOT_FOUND,
+            )
+        generic = attributes.get("generic") == "yes" or any(
+            character in data_set for character in "*%"
+        )
+        self.data_sets[data_set] = {
+            "base": {"owner": high_level_qualifier, "uacc": "NONE"},
+            "created": self.__today(),
+            "generic": generic,
+            "volume": attributes.get("volume", "").upper(),
+            "access_list": {},
+        }
+        return self.__command(image)
+
+    def __alter_data_set_command(self, data_set: str, segments: dict) -> dict:
+        image = self.__image("ALTDSD", f"              ('{data_set}') ", segments)
+        if data_set not in self.data_sets:
+            return self.__command(
+                image, [f"ICH22001I {data_set} NOT DEFINED TO RACF"], NOT_FOUND
+            )
+        error = self.__validate_segments(segments)
+        if error:
+            return self.__command(image, [error], INVALID)
+        self.__apply_segments(self.data_sets[data_set], segments)
+        return self.__command(image)
+
+    def __delete_data_set_command(self, data_set: str) -> dict:
+        image = f"DELDSD               ('{data_set}')"
+        if data_set not in self.data_sets:
+            return self.__command(
+                image, [f"ICH09020I {data_set} NOT DEFINED TO RACF"], NOT_FOUND
+            )
+        del self.data_sets[data_set]
+        return self.__command(image)
+
+    def __list_data_set_command(self, data_set: str, segments: dict) -> dict:
+        image = f"LISTDSD  DATASET     ('{data_set}')" + "".join(
+            f" {segment.upper()}" for segment in segments if segment != "base"
+        )
+        if data_set not in self.data_sets:
+            return self.__command(
+                image,
+                [f"ICH35003I NO RACF DESCRIPTION FOUND FOR {data_set}"],
+                NOT_FOUND,
+            )
+        profile = self.data_sets[data_set]
+        base = profile["base"]
+        messages = [
+            f"INFORMATION FOR DATASET {data_set}"
+            + (" (G)" if profile["generic"] else ""),
+            None,
+            "LEVEL  OWNER    UNIVERSAL ACCESS   WARNING   ERASE",
+            "-----  -------- ----------------   -------   -----",
+            f" {int(base.get('level', 0)):02}    {self.__upper(base['owner']):<8}"
+            + f"        {self.__upper(base['uacc']):<8}      "
+            + f"{'YES' if base.get('warning') else 'NO':<3}     "
+            + ("YES" if base.get("erase") else "NO"),
+            None,
+            "AUDITING",
+            "--------",
+            "FAILURES(READ)",
+            None,
+            "NOTIFY",
+            "--------",
+            self.__upper(base["notify"])
+            if "notify" in base
+            else "NO USER TO BE NOTIFIED",
+            None,
+            "YOUR ACCESS  CREATION GROUP  DATASET TYPE",
+            "-----------  --------------  ------------",
+            " ALTER        SYS1           NON-VSAM",
+            None,
+        ]
+        if profile["volume"]:
+            messages += [
+                "VOLUMES ON WHICH DATASET RESIDES",
+                "--------------------------------",
+                profile["volume"],
+                None,
+            ]
+        messages.append(
+            f"INSTALLATION DATA={base['data']}"
+            if "data" in base
+            else "NO INSTALLATION DATA"
+        )
+        messages += self.__list_segments(profile, "dataset", segments)
+        return self.__command(image, messages)
+
+    # ============================================================================
+    # General Resource Profiles
+    # ============================================================================
+    def __process_resource(
+        self, attributes: dict, segments: dict, precheck: bool
+    ) -> Tuple[List[dict], List[str]]:
+        key = (attributes["class"].upper(), attributes["name"])
+        return self.__process_profile(
+            {
+                "add": lambda: self.__add_resource_command(key),
+                "alter": lambda segments: self.__alter_resource_command(key, segments),
+                "list": lambda segments: self.__list_resource_command(key, segments),
+                "delete": lambda: self.__delete_resource_command(key),
+            },
+            key in self.resources,
+            attributes,
+            segments,
+            precheck,
+        )
+
+    def __raclist_messages(self, class_name: str, update: str) -> List[str]:
+        if class_name not in self.setropts["raclist"]:
+            return []
+        return [
+            f"RACLISTED PROFILES FOR {class_name} WILL NOT REFLECT THE {update} "
+            + "UNTIL A SETROPTS REFRESH IS ISSUED."
+        ]
+
+    def __add_resource_command(self, key: Tuple[str, str]) -> dict:
+        (class_name, resource) = key
+        image = f"RDEFINE {class_name:<20} ({resource}) "
+        if class_name not in self.classes:
+            return self.__command(
+                image,
+                [
+                    f"IKJ56702I INVALID CLASS, {class_name}",
+                    "IKJ56701I MISSING ENTITY NAME+",
+                    "IKJ56701I MISSING NAME OF ENTITY IN SPECIFIED CLASS",
+                ],
+                INVALID,
+            )
+        if key in self.resources:
+            return self.__command(
+                image,
+                [f"ICH10102I {resource} ALREADY DEFINED TO CLASS {class_name}."],
+                NOT_FOUND,
+            )
+        self.resources[key] = {
+            "base": {"owner": self.issuer, "uacc": "NONE"},
+            "created": self.__today(),
+            "generic": any(character in resource for character in "*%&"),
+            "access_list": {},
+        }
+        return self.__command(
+            image,
+            [
+                f"ICH10006I {message}"
+                for message in self.__raclist_messages(class_name, "ADDITION(S)")
+            ],
+        )
+
+    def __alter_resource_command(self, key: Tuple[str, str], segments: dict) -> dict:
+        (class_name, resource) = key
+        image = self.__image(f"RALTER  {class_name:<20} ({resource}) ", "", segments)
+        if class_name not in self.classes:
+            return self.__command(
+                image, [f"IKJ56702I INVALID CLASS, {class_name}"], INVALID
+            )
+        if key not in self.resources:
+            return self.__command(
+                image,
+                [f"ICH11001I {resource} NOT DEFINED TO CLASS {class_name}."],
+                NOT_FOUND,
+            )
+        error = self.__validate_segments(segments)
+        if error:
+            return self.__command(image, [error], INVALID)
+        self.__apply_segments(self.resources[key], segments)
+        return self.__command(
+            image,
+            [
+                f"ICH11009I {message}"
+                for message in self.__raclist_messages(class_name, "UPDATE(S)")
+            ],
+        )
+
+    def __delete_resource_command(self, key: Tuple[str, str]) -> dict:
+        (class_name, resource) = key
+        image = f"RDELETE {class_name:<20} ({resource}) "
+        if key not in self.resources:
+            return self.__command(
+                image,
+                [f"ICH12102I {resource} NOT DEFINED TO CLASS {class_name}."],
+                NOT_FOUND,
+            )
+        del self.resources[key]
+        return self.__command(
+            image,
+            [
+                f"ICH12002I {message}"
+                for message in self.__raclist_messages(class_name, "DELETION(S)")
+            ],
+        )
+
+    def __list_resource_command(self, key: Tuple[str, str], segments: dict) -> dict:
+        (class_name, resource) = key
+        image = f"RLIST   {class_name:<20} ({resource}) " + "".join(
+            f" {segment.upper()}" for segment in segments if segment != "base"
+        )
+        if key not in self.resources:
+            return self.__command(image, [f"ICH13003I {resource} NOT FOUND"], NOT_FOUND)
+        profile = self.resources[key]
+        base = profile["base"]
+        your_access = (
+            "ALTER"
+            if self.__upper(base["owner"]) == self.issuer
+            else self.__upper(base["uacc"])
+        )
+        messages = [
+            "CLASS      NAME",
+            "-----      ----",
+            f"{class_name:<10} {resource}" + (" (G)" if profile["generic"] else ""),
+            " ",
+            "LEVEL  OWNER      UNIVERSAL ACCESS  YOUR ACCESS  WARNING",
+            "-----  --------   ----------------  -----------  -------",
+            f" {int(base.get('level', 0)):02}    {self.__upper(base['owner']):<8}"
+            + f"        {self.__upper(base['uacc']):<8}          {your_access:>5}    "
+            + ("YES" if base.get("warning") else "NO"),
+            " ",
+            "INSTALLATION DATA",
+            "-----------------",
+            base.get("data", "NONE"),
+            " ",
+            "APPLICATION DATA",
+            "----------------",
+            base.get("appldata", "NONE"),
+            " ",
+            "AUDITING",
+            "--------",
+            "FAILURES(READ)",
+            " ",
+            "NOTIFY",
+            "------",
+            self.__upper(base["notify"])
+            if "notify" in base
+            else "NO USER TO BE NOTIFIED",
+        ]
+        messages += self.__list_segments(profile, "resource", segments)
+        return self.__command(image, messages)
+
+    # ============================================================================
+    # Permits
+    # ============================================================================
+    def __process_permission(
+        self, attributes: dict, segments: dict, _: bool
+    ) -> Tuple[List[dict], List[str]]:
+        return ([self.__permit_command(attributes, segments)], [])
+
+    def __permit_command(self, attributes: dict, segments: dict) -> dict:
+        class_name = attributes["class"].upper()
+        name = attributes["name"]
+        if class_name == "DATASET":
+            profile = self.data_sets.get(name.upper())
+        else:
+            profile = self.resources.get((class_name, name))
+        traits = {trait: value for trait, _, value in segments.get("base", [])}
+        authid = traits.get("authid", "").upper()
+        access = traits.get("access", "READ").upper()
+        if attributes.get("operation") == "del":
+            image = (
+                f"PERMIT               {name} CLASS({class_name})  DELETE       "
+                + f"ID          ({authid})"
+            )
+            if profile is None or authid not in profile["access_list"]:
+                return self.__command(
+                    image,
+                    [f"ICH06002I {authid:<8} NOT AUTHORIZED, DELETE IGNORED"],
+                    NOT_FOUND,
+                )
+            del profile["access_list"][authid]
+            return self.__command(image)
+        image = (
+            f"PERMIT               {name} CLASS({class_name})  ACCESS      ({access}) "
+            + f"ID          ({authid})"
+        )
+        if profile is None:
+            return self.__command(
+                image, [f"ICH06004I {name} NOT DEFINED TO RACF"], INVALID
+            )
+        if authid not in self.users and authid not in self.groups:
+            return self.__command(
+                image, [f"ICH06007I {authid} NOT DEFINED TO RACF"], NOT_FOUND
+            )
+        if access not in ACCESS_LEVELS:
+            return self.__command(
+                image, [f"IKJ56702I INVALID ACCESS AUTHORITY, {access}"], INVALID
+            )
+        profile["access_list"][authid] = access
+        return self.__command(
+            image,
+            [
+                f"ICH06011I {message}"
+                for message in self.__raclist_messages(class_name, "UPDATE(S)")
+            ],
+        )
+
+    def __remove_from_access_lists(self, authid: str) -> None:
+        for profile in list(self.data_sets.values()) + list(self.resources.values()):
+            profile["access_list"].pop(authid, None)
+
+    # ============================================================================
+    # SETROPTS
+    # ============================================================================
+    def __process_setropts(
+        self, _: dict, segments: dict, __: bool
+    ) -> Tuple[List[dict], List[str]]:
+        return ([self.__setropts_command(segments)], [])
+
+    def __setropts_command(self, segments: dict) -> dict:
+        traits = segments.get("base", [])
+        if any(trait == "list" for trait, _, _ in traits):
+            return self.__command("SETROPTS   LIST", list_setropts(self.setropts))
+        image = self.__image("SETROPTS", "", segments)
+        for trait, _, value in traits:
+            if trait not in SETROPTS_CLASS_LISTS or value is None:
+                continue
+            for class_name in value.upper().split():
+                if class_name not in self.classes | {"DATASET", "USER", "GROUP"}:
+                    return self.__command(
+                        image,
+                        [f"IKJ56702I INVALID {self.__keyword(trait)}, {class_name}"],
+                        INVALID,
+                    )
+        # Refreshing raclisted classes doesn't change any options.
+        if not any(trait == "refresh" for trait, _, _ in traits):
+            for trait, operation, value in traits:
+                self.__apply_setropts_option(trait, operation, value)
+        return self.__command(image, ["ICH14063I SETROPTS command complete."])
+
+    def __apply_setropts_option(
+        self, option: str, operation: Union[str, None], value: Union[str, None]
+    ) -> None:
+        if option in SETROPTS_CLASS_LISTS and value is not None:
+            class_list = self.setropts[option]
+            for class_name in value.upper().split():
+                if operation == "del" and class_name in class_list:
+                    class_list.remove(class_name)
+                elif operation != "del" and class_name not in class_list:
+                    class_list.append(class_name)
+        elif operation == "del":
+            self.setropts.pop(option, None)
+        else:
+            self.setropts[option] = True if value is None else value
+
+    # ============================================================================
+    # Segments
+    # ============================================================================
+    def __apply_segments(self, profile: dict, segments: dict) -> None:
+        """Apply the traits in each segment of a security definition to a profile."""
+        for segment, traits in segments.items():
+            if segment not in profile:
+                profile[segment] = {}
+            for trait, operation, value in traits:
+                if operation in ("add", "remove"):
+                    values = profile[segment].get(trait, [])
+                    for token in value.upper().split():
+                        if operation == "add" and token not in values:
+                            values.append(token)
+                        if operation == "remove" and token in values:
+                            values.remove(token)
+                    profile[segment][trait] = values
+                elif operation == "del":
+                    profile[segment].pop(trait, None)
+                else:
+                    profile[segment][trait] = True if value is None else value
+            if not profile[segment] and segment != "base":
+                del profile[segment]
+
+    def __validate_segments(self, segments: dict) -> Union[str, None]:
+        """Return an error message for trait values that RACF would reject."""
+        for traits in segments.values():
+            for trait, operation, value in traits:
+                if operation == "del" or value is None:
+                    continue
+                if trait == "uacc" and value.upper() not in ACCESS_LEVELS:
+                    return f"IKJ56702I INVALID UNIVERSAL ACCESS, {value.upper()}"
+                if trait in ("uid", "gid") and (
+                    not value.isdigit() or int(value) > 2147483647
+                ):
+                    return f"IKJ56702I INVALID {trait.upper()}, {value}"
+        return None
+
+    def __list_segments(
+        self, profile: dict, profile_type: str, segments: dict
+    ) -> List[str]:
+        """List the additional segments of a profile that were requested."""
+        messages = []
+        for segment in segments:
+            if segment == "base":
+                continue
+            messages.append(" ")
+            if segment not in profile:
+                messages.append(f"NO {segment.upper()} INFORMATION")
+                continue
+            messages += [f"{segment.upper()} INFORMATION", "----------------"]
+            fields = profile[segment]
+            listing_fields = SEGMENT_LISTING_FIELDS.get((profile_type, segment), [])
+            for trait in listing_fields + [
+                trait for trait in fields if trait not in listing_fields
+            ]:
+                if trait not in fields and trait not in SEGMENT_LISTING_DEFAULTS:
+                    continue
+                value = fields.get(trait, SEGMENT_LISTING_DEFAULTS.get(trait))
+                if trait in ("uid", "gid"):
+                    value = f"{int(value):010}"
+                elif isinstance(value, list):
+                    value = " ".join(value)
+                elif value is True:
+                    value = "YES"
+                messages.append(f"{self.__keyword(trait)}= {value}")
+        return messages
+
+    # ============================================================================
+    # Helpers
+    # ============================================================================
+    def __command(
+        self,
+        image: str,
+        messages: Union[List[Union[str, None]], None] = None,
+        return_codes: Tuple[int, int, int] = SUCCESS,
+    ) -> dict:
+        """Build the result of a RACF command."""
+        (saf_return_code, return_code, reason_code) = return_codes
+        return {
+            "safreturncode": saf_return_code,
+            "returncode": return_code,
+            "reasoncode": reason_code,
+            "image": image,
+            "messages": messages if messages is not None else [],
+        }
+
+    def __image(self, command: str, name: str, segments: dict) -> str:
+        """Build the command image for the traits in a security definition."""
+        operands = []
+        for segment, traits in segments.items():
+            keywords = []
+            for trait, operation, value in traits:
+                keyword = self.__keyword(trait)
+                if operation in ("del", "remove"):
+                    keyword = f"NO{keyword}"
+                if value is not None:
+                    if not value.replace(" ", "").isalnum():
+                        value = f"'{value}'"
+                    keyword = f"{keyword:<12}({value})"
+                keywords.append(keyword)
+            if segment == "base":
+                operands += keywords
+            elif keywords:
+                operands.append(f"{segment.upper():<8} ({' '.join(keywords)})")
+        return f"{command} {name} " + " ".join(operands)
+
+    def __keyword(self, trait: str) -> str:
+        return KEYWORDS.get(trait, trait.upper())
+
+    def __tag(self, keyword: str) -> str:
+        return {"OPERATIONS": "oper"}.get(keyword, keyword.lower())
+
+    def __upper(self, value: Union[str, bool]) -> str:
+        return str(value).upper()
+
+    def __today(self) -> str:
+        return date.today().strftime("%y.%j")
@@ -0,0 +1,117 @@
+"""Listing of SETROPTS options built by the RACF simulator."""
+
+from typing import List, Union
+
+SETROPTS_CLASS_LISTS = {
+    "classtat": "STATISTICS",
+    "audit": "AUDIT CLASSES",
+    "classact": "ACTIVE CLASSES",
+    "generic": "GENERIC PROFILE CLASSES",
+    "gencmd": "GENERIC COMMAND CLASSES",
+    "genlist": "GENLIST CLASSES",
+    "global": "GLOBAL CHECKING CLASSES",
+    "raclist": "SETR RACLIST CLASSES",
+}
+
+
+def upper(value: Union[str, bool]) -> str:
+    """Show an option value the way RACF lists it."""
+    return str(value).upper()
+
+
+def list_setropts(options: dict) -> List[str]:
+    """Build the messages that 'SETROPTS LIST' issues for the given options."""
+
+    def active(option: str, if_active: str, if_inactive: str) -> str:
+        return if_active if options.get(option) else if_inactive
+
+    messages = [
+        "ATTRIBUTES = "
+        + active("initstat", "INITSTATS", "NOINITSTATS")
+        + active("whenprog", " WHEN(PROGRAM -- BASIC)", "")
+        + f" TERMINAL({upper(options.get('terminal', 'READ'))})"
+    ]
+    for trait, label in SETROPTS_CLASS_LISTS.items():
+        if trait == "audit" and not options[trait]:
+            continue
+        messages += wrap_class_list(f"{label} = ", options[trait])
+    messages += ["GLOBAL=YES RACLIST ONLY = NONE"]
+    messages += [
+        "AUTOMATIC DATASET PROTECTION "
+        + active("adsp", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "ENHANCED GENERIC NAMING " + active("egn", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "REAL DATA SET NAMES OPTION " + active("realdsn", "IS ACTIVE", "IS INACTIVE"),
+        "JES-BATCHALLRACF OPTION " + active("jesbatch", "IS ACTIVE", "IS INACTIVE"),
+        "JES-XBMALLRACF OPTION " + active("jesxbm", "IS ACTIVE", "IS INACTIVE"),
+        "JES-EARLYVERIFY OPTION " + active("jesearly", "IS ACTIVE", "IS INACTIVE"),
+        "PROTECT-ALL OPTION " + active("protall", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "TAPE DATA SET PROTECTION " + active("tapedsn", "IS ACTIVE", "IS INACTIVE"),
+        f"SECURITY RETENTION PERIOD IN EFFECT IS {int(options.get('retpd', 0)):>5} DAYS.",
+        "ERASE-ON-SCRATCH " + active("erase", "IS ACTIVE", "IS INACTIVE"),
+        "SINGLE LEVEL NAMES NOT ALLOWED",
+        "LIST OF GROUPS ACCESS CHECKING "
+        + active("grplist", "IS ACTIVE.", "IS INACTIVE."),
+        f"INACTIVE USERIDS ARE BEING AUTOMATICALLY REVOKED AFTER {options['inactive']} DAYS."
+        if "inactive" in options
+        else "INACTIVE USERIDS ARE NOT BEING AUTOMATICALLY REVOKED.",
+        "DATA SET MODELLING NOT BEING DONE FOR GDGS.",
+        "USER DATA SET MODELLING IS NOT BEING DONE.",
+        "GROUP DATA SET MODELLING IS NOT BEING DONE.",
+        "PASSWORD PROCESSING OPTIONS:",
+        "THE ACTIVE PASSWORD ENCRYPTION ALGORITHM IS "
+        + upper(options.get("pwdalg", "LEGACY")),
+        f"PASSWORD CHANGE INTERVAL IS {int(options.get('interval', 186)):>3} DAYS.",
+        "PASSWORD MINIMUM CHANGE INTERVAL IS "
+        + f"{int(options.get('minchang', 0)):>3} DAYS.",
+        "MIXED CASE PASSWORD SUPPORT "
+        + active("mixdcase", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "SPECIAL CHARACTERS " + active("pwdspec", "ARE ALLOWED.", "ARE NOT ALLOWED."),
+        f"{int(options['history'])} GENERATIONS OF PREVIOUS PASSWORDS BEING MAINTAINED."
+        if "history" in options
+        else "NO PASSWORD HISTORY BEING MAINTAINED.",
+        f"AFTER {int(options['revoke']):>2} CONSECUTIVE UNSUCCESSFUL PASSWORD "
+        + "ATTEMPTS, A USERID WILL BE REVOKED."
+        if "revoke" in options
+        else "USERIDS NOT BEING AUTOMATICALLY REVOKED.",
+        "PASSWORD EXPIRATION WARNING LEVEL IS "
+        + f"{int(options.get('warning', 10)):>3} DAYS.",
+        "INSTALLATION PASSWORD SYNTAX RULES:",
+        "RULE 1  LENGTH(4:8)   ********",
+        "LEGEND:",
+        "A-ALPHA C-CONSONANT L-ALPHANUM N-NUMERIC V-VOWEL W-NOVOWEL *-ANYTHING",
+        "c-MIXED CONSONANT m-MIXED NUMERIC v-MIXED VOWEL $-NATIONAL s-SPECIAL",
+        "x-MIXED ALL",
+        "DEFAULT RVARY PASSWORD IS IN EFFECT FOR THE SWITCH FUNCTION.",
+        "DEFAULT RVARY PASSWORD IS IN EFFECT FOR THE STATUS FUNCTION.",
+        "SECLABEL CONTROL IS NOT IN EFFECT",
+        "GENERIC OWNER ONLY " + active("genowner", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "COMPATIBILITY MODE " + active("compmode", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        "MULTI-LEVEL QUIET IS NOT IN EFFECT",
+        "MULTI-LEVEL STABLE IS NOT IN EFFECT",
+        "NO WRITE-DOWN IS NOT IN EFFECT",
+        "MULTI-LEVEL ACTIVE IS NOT IN EFFECT",
+        "CATALOGUED DATA SETS ONLY, IS NOT IN EFFECT",
+        "USER-ID FOR JES NJEUSERID IS : ????????",
+        "USER-ID FOR JES UNDEFINEDUSER IS : ++++++++",
+        "PARTNER LU-VERIFICATION SESSIONKEY INTERVAL MAXIMUM/DEFAULT IS    30 DAYS.",
+        "ADDCREATOR " + active("addcreat", "IS IN EFFECT", "IS NOT IN EFFECT"),
+        f"KERBLVL = {int(options.get('kerblvl', 0)):>5}",
+        "MULTI-LEVEL FILE SYSTEM IS NOT IN EFFECT",
+        "MULTI-LEVEL INTERPROCESS COMMUNICATIONS IS NOT IN EFFECT",
+        "MULTI-LEVEL NAME HIDING IS NOT IN EFFECT",
+        "SECURITY LABEL BY SYSTEM IS NOT IN EFFECT",
+        "PRIMARY LANGUAGE DEFAULT : " + upper(options.get("primlang", "ENU")),
+        "SECONDARY LANGUAGE DEFAULT : " + upper(options.get("seclang", "ENU")),
+    ]
+    return messages
+
+
+def wrap_class_list(heading: str, class_list: List[str]) -> List[str]:
+    """List classes eight to a line, following the heading."""
+    if not class_list:
+        return [f"{heading}NONE"]
+    lines = []
+    for i in range(0, len(class_list), 8):
+        lines.append(" ".join(class_list[i : i + 8]))
+    lines[0] = heading + lines[0]
+    return lines
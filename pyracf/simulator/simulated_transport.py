@@ -0,0 +1,152 @@
+"""Transport that answers security requests using an in-memory RACF database."""
+
+import platform
+import time
+import xml.etree.ElementTree as XMLBuilder
+from typing import Tuple, Union
+
+from defusedxml.ElementTree import fromstring
+
+from pyracf.common.transport import Transport
+
+from .racf_database import RacfDatabase
+
+# Security definitions that the simulator knows how to process.
+SUPPORTED_DEFINITIONS = [
+    "user",
+    "group",
+    "groupconnection",
+    "dataset",
+    "resource",
+    "permission",
+    "systemsettings",
+]
+
+# Security definitions whose traits are not grouped into segments.
+DEFINITIONS_WITHOUT_SEGMENTS = ["groupconnection", "permission", "systemsettings"]
+
+
+class SimulatedTransport(Transport):
+    """
+    Answer security requests using an in-memory RACF database.
+    Responses are built the same way IRRSMO00 builds them, so the whole
+    pipeline from request generation to profile parsing can be exercised
+    off platform. 'latency' is the number of seconds each call takes,
+    which can be used to approximate the time RACF takes to process requests.
+    """
+
+    def __init__(
+        self, database: Union[RacfDatabase, None] = None, latency: float = 0.0
+    ) -> None:
+        if database is None:
+            database = RacfDatabase()
+        self.database = database
+        self.latency = latency
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        """Process a security request using the in-memory RACF database."""
+        # Sleep outside of the database lock so that concurrent
+        # calls overlap the same way that calls to IRRSMO00 do.
+        if self.latency:
+            time.sleep(self.latency)
+        request = fromstring(request_xml.decode(self.__encoding()))
+        result = XMLBuilder.Element(
+            "securityresult",
+            {"xmlns": "http://www.ibm.com/systems/zos/saf/IRRSMO00Result1"},
+        )
+        (return_code, reason_code) = (0, 0)
+        for definition in request:
+            definition_return_codes = self.__process_definition(
+                result, definition, precheck=bool(options & 2)
+            )
+            if return_code == 0:
+                (return_code, reason_code) = definition_return_codes
+        XMLBuilder.SubElement(result, "returncode").text = str(return_code)
+        XMLBuilder.SubElement(result, "reasoncode").text = str(reason_code)
+        response_xml = XMLBuilder.tostring(result, encoding=self.__encoding())
+        saf_return_code = 0 if return_code == 0 else 4
+        return (response_xml, saf_return_code, return_code, reason_code)
+
+    def __process_definition(
+        self, result: XMLBuilder.Element, definition, precheck: bool
+    ) -> Tuple[int, int]:
+        """
+        Process a security definition, add its result to the
+        security result and return its return and reason codes.
+        """
+        definition_type = self.__local_name(definition.tag)
+        attributes = dict(definition.attrib)
+        result_definition = XMLBuilder.SubElement(
+            result, definition_type, self.__result_attributes(attributes)
+        )
+        if definition_type not in SUPPORTED_DEFINITIONS:
+            self.__add_error(result_definition, definition_type)
+            return (2000, 68)
+        (commands, info) = self.database.process(
+            definition_type,
+            attributes,
+            self.__get_segments(definition_type, definition),
+            precheck=precheck,
+        )
+        for message in info:
+            XMLBuilder.SubElement(result_definition, "info").text = message
+        return_code = 0
+        for command in commands:
+            self.__add_command(result_definition, command)
+            if command["returncode"] != 0:
+                return_code = 4
+        return (return_code, 0)
+
+    def __get_segments(self, definition_type: str, definition) -> dict:
+        """
+        Build a dictionary of segments that contain lists of
+        ('trait', 'operation', 'value') tuples from a security definition.
+        """
+        if definition_type in DEFINITIONS_WITHOUT_SEGMENTS:
+            return {"base": self.__get_traits(definition)}
+        return {
+            self.__local_name(segment.tag): self.__get_traits(segment)
+            for segment in definition
+        }
+
+    def __get_traits(self, element) -> list:
+        traits = []
+        for trait in element:
+            value = trait.text.strip() if trait.text and trait.text.strip() else None
+            traits.append(
+                (self.__local_name(trait.tag), trait.attrib.get("operation"), value)
+            )
+        return traits
+
+    def __result_attributes(self, attributes: dict) -> dict:
+        result_attributes = dict(attributes)
+        if "name" in result_attributes and "class" not in result_attributes:
+            result_attributes["name"] = result_attributes["name"].upper()
+        return result_attributes
+
+    def __add_command(self, result_definition: XMLBuilder.Element, command: dict):
+        command_element = XMLBuilder.SubElement(result_definition, "command")
+        for key in ["safreturncode", "returncode", "reasoncode", "image"]:
+            XMLBuilder.SubElement(command_element, key).text = str(command[key])
+        for message in command["messages"]:
+            XMLBuilder.SubElement(command_element, "message").text = message
+
+    def __add_error(self, result_definition: XMLBuilder.Element, definition_type: str):
+        error = XMLBuilder.SubElement(result_definition, "error")
+        for key, value in [
+            ("errorfunction", "10"),
+            ("errorcode", "2000"),
+            ("errorreason", "68"),
+            ("errormessage", f"Unsupported security definition '{definition_type}'."),
+        ]:
+            XMLBuilder.SubElement(error, key).text = value
+
+    def __local_name(self, tag: str) -> str:
+        """Remove the namespace from a tag."""
+        return tag.rsplit("}", 1)[-1]
+
+    def __encoding(self) -> str:
+        # Request XML is dumped as utf-8 when not running on z/OS.
+        if platform.system() == "OS/390":
+            return "cp1047"
+        return "utf-8"
@@ -0,0 +1,3 @@
+"""Record security requests made through a transport and replay them."""
+from .recording_transport import RecordingTransport, read_recording
+from .traffic_replayer import TrafficReplayer
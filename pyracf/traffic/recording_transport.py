@@ -0,0 +1,77 @@
+"""Transport wrapper that records security requests and their results."""
+
+import json
+import platform
+import re
+import threading
+import time
+from typing import Iterator, Tuple
+
+from pyracf.common.logger import Logger
+from pyracf.common.transport import Transport
+
+# Traits whose values are secrets that must never be written to a recording.
+SECRET_TRAITS_REGEX = re.compile(
+    r"<racf:(?:password|phrase|bindpw)(?:\s[^>]*)?>([^<]+)</racf:"
+)
+
+
+def read_recording(path: str) -> Iterator[dict]:
+    """Read the records in a recording in the order they were written."""
+    with open(path, "r", encoding="utf-8") as recording:
+        for line in recording:
+            if line.strip():
+                yield json.loads(line)
+
+
+class RecordingTransport(Transport):
+    """
+    Record every security request made through another transport.
+    Each call is appended to 'path' as one line of JSON containing the wall-clock
+    time the call was made, the IRRSMO00 options, the request and result XML,
+    the return and reason codes and how long the call took in seconds.
+    Passwords and passphrases are redacted before anything is written.
+    """
+
+    __logger = Logger()
+
+    def __init__(self, transport: Transport, path: str) -> None:
+        self.transport = transport
+        self.path = path
+        self.__lock = threading.Lock()
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        """Make the request using the wrapped transport and record it."""
+        timestamp = time.time()
+        start = time.perf_counter()
+        response = self.transport.call(request_xml, options)
+        latency = time.perf_counter() - start
+        request_text = request_xml.decode(self.__encoding())
+        redact_strings = SECRET_TRAITS_REGEX.findall(request_text)
+        self.__write_record(
+            {
+                "timestamp": timestamp,
+                "options": options,
+                "latency": latency,
+                "request": self.__logger.redact_strings(request_text, redact_strings),
+                "response": self.__logger.redact_strings(
+                    response[0].decode(self.__encoding()), redact_strings
+                ),
+                "returnCodes": list(response[1:]),
+            }
+        )
+        return response
+
+    def __write_record(self, record: dict) -> None:
+        line = json.dumps(record, separators=(",", ":")) + "\n"
+        # Records are appended one line at a time so that a recording
+        # can be read while it is still being written.
+        with self.__lock:
+            with open(self.path, "a", encoding="utf-8") as recording:
+                recording.write(line)
+
+    def __encoding(self) -> str:
+        # Request XML is dumped as utf-8 when not running on z/OS.
+        if platform.system() == "OS/390":
+            return "cp1047"
+        return "utf-8"
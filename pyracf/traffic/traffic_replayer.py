@@ -0,0 +1,75 @@
+"""Replay recorded security requests through a transport."""
+
+import platform
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from pyracf.common.transport import Transport
+
+from .recording_transport import read_recording
+
+
+class TrafficReplayer:
+    """
+    Replay the security requests in a recording through a transport.
+    Requests are sent at the same offsets from the start of the replay as
+    they were made from the start of the recording, divided by 'speed', so
+    a speed of 1 replays at the original rate and a speed of 2 at twice the
+    original rate. A speed of 0 sends every request as soon as possible.
+    Requests are made from a pool of 'threads' threads so that slow
+    requests don't hold up the requests that follow them.
+    """
+
+    def __init__(
+        self, transport: Transport, speed: float = 1.0, threads: int = 8
+    ) -> None:
+        if speed < 0:
+            raise ValueError("'speed' must not be negative.")
+        self.transport = transport
+        self.speed = speed
+        self.threads = threads
+
+    def replay(self, path: str) -> List[dict]:
+        """
+        Replay the recording at 'path' and return a dictionary for each request
+        containing the recorded and replayed latencies and return codes.
+        """
+        records = list(read_recording(path))
+        if not records:
+            return []
+        first_timestamp = records[0]["timestamp"]
+        with ThreadPoolExecutor(max_workers=self.threads) as executor:
+            start = time.perf_counter()
+            futures = []
+            for record in records:
+                if self.speed:
+                    offset = (record["timestamp"] - first_timestamp) / self.speed
+                    delay = offset - (time.perf_counter() - start)
+                    if delay > 0:
+                        time.sleep(delay)
+                futures.append(executor.submit(self.__replay_record, record))
+            return [future.result() for future in futures]
+
+    def __replay_record(self, record: dict) -> dict:
+        start = time.perf_counter()
+        (_, saf_return_code, racf_return_code, racf_reason_code) = self.transport.call(
+            record["request"].encode(self.__encoding()), record["options"]
+        )
+        return {
+            "options": record["options"],
+            "recordedLatency": record["latency"],
+            "replayedLatency": time.perf_counter() - start,
+            "recordedReturnCodes": record["returnCodes"],
+            "replayedReturnCodes": [
+                saf_return_code,
+                racf_return_code,
+                racf_reason_code,
+            ],
+        }
+
+    def __encoding(self) -> str:
+        # Request XML is dumped as utf-8 when not running on z/OS.
+        if platform.system() == "OS/390":
+            return "cp1047"
+        return "utf-8"
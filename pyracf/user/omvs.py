@@ -1,15 +1,17 @@
+from ..common.transport import Transport
 from ..utils import get_message_value
 
 
 class Omvs:
-    __slots__ = ["_name"]
+    __slots__ = ["_name", "_transport"]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, transport: Transport | None = None):
         self._name = name
+        self._transport = transport
 
     @property
     def home(self):
-        return get_message_value(self._name, "omvs", "HOME")
+        return self._get_value("HOME")
 
     @property
     def max_address_space_size(self):
@@ -37,12 +39,15 @@ class Omvs:
 
     @property
     def program(self):
-        return get_message_value(self._name, "omvs", "PROGRAM")
+        return self._get_value("PROGRAM")
 
     @property
     def uid(self):
-        return int(get_message_value(self._name, "omvs", "UID"))
+        return int(self._get_value("UID"))
 
     def _get_max_value(self, key: str):
-        value = get_message_value(self._name, "omvs", key)
+        value = self._get_value(key)
         return None if value == "NONE" else int(value)
+
+    def _get_value(self, key: str):
+        return get_message_value(self._name, "omvs", key, transport=self._transport)
@@ -1,36 +1,41 @@
+from ..common.transport import Transport
 from ..utils import get_message_value
 
 
 class Tso:
-    __slots__ = ["_name"]
+    __slots__ = ["_name", "_transport"]
 
-    def __init__(self, name: str):
+    def __init__(self, name: str, transport: Transport | None = None):
         self._name = name
+        self._transport = transport
 
     @property
     def account_number(self):
-        return get_message_value(self._name, "tso", "ACCTNUM")
+        return self._get_value("ACCTNUM")
 
     @property
     def command(self):
-        return get_message_value(self._name, "tso", "COMMAND")
+        return self._get_value("COMMAND")
 
     @property
     def max_size(self):
-        return int(get_message_value(self._name, "tso", "MAXSIZE"))
+        return int(self._get_value("MAXSIZE"))
 
     @property
     def proc(self):
-        return get_message_value(self._name, "tso", "PROC")
+        return self._get_value("PROC")
 
     @property
     def size(self):
-        return int(get_message_value(self._name, "tso", "SIZE"))
+        return int(self._get_value("SIZE"))
 
     @property
     def unit(self):
-        return get_message_value(self._name, "tso", "UNIT")
+        return self._get_value("UNIT")
 
     @property
     def user_data(self):
-        return get_message_value(self._name, "tso", "USERDATA")
+        return self._get_value("USERDATA")
+
+    def _get_value(self, key: str):
+        return get_message_value(self._name, "tso", key, transport=self._transport)
@@ -2,7 +2,9 @@
 
 from typing import List, Literal, Union
 
+from pyracf.common.request_sink import RequestSink
 from pyracf.common.security_admin import SecurityAdmin
+from pyracf.common.transport import Transport
 
 from .user_request import UserRequest
 
@@ -202,13 +204,41 @@ class UserAdmin(SecurityAdmin):
             "workattr:waemail": "waemail",
         },
     }
+    _profile_fields = {
+        "base:class_authorizations": "classAuthorizations",
+        "base:data": "installationData",
+        "base:dfltgrp": "defaultGroup",
+        "base:model": "modelName",
+        "base:name": "name",
+        "base:owner": "owner",
+        "base:passint": "passwordInterval",
+        "omvs:assize": "assizemax",
+        "omvs:cputime": "cputimemax",
+        "omvs:fileproc": "fileprocmax",
+        "omvs:home": "home",
+        "omvs:memlimit": "memlimit",
+        "omvs:mmaparea": "mmapareamax",
+        "omvs:procuser": "procusermax",
+        "omvs:program": "program",
+        "omvs:shmemmax": "shmemmax",
+        "omvs:threads": "threadsmax",
+        "omvs:uid": "uid",
+    }
+    _profile_attributes = {
+        "base:auditor": "auditor",
+        "base:operations": "operations",
+        "base:roaudit": "roaudit",
+        "base:special": "special",
+    }
+    _case_sensitive_fields = ("base:data", "omvs:home", "omvs:program")
 
     def __init__(
         self,
         debug: bool = False,
-        generate_requests_only: bool = False,
+        generate_requests_only: Union[bool, RequestSink] = False,
         add_field_data: Union[dict, None] = None,
         overwrite_field_data: Union[dict, None] = None,
+        transport: Union[Transport, None] = None,
     ) -> None:
         super().__init__(
             "user",
@@ -216,6 +246,7 @@ class UserAdmin(SecurityAdmin):
             generate_requests_only=generate_requests_only,
             add_field_data=add_field_data,
             overwrite_field_data=overwrite_field_data,
+            transport=transport,
         )
 
     # ============================================================================
@@ -296,16 +327,52 @@ class UserAdmin(SecurityAdmin):
         return self._get_field(profile, "base", "classAuthorizations")
 
     def set_class_authorizations(
-        self, userid: str, class_authorizations: List[str]
-    ) -> Union[dict, bytes]:
+        self,
+        userid: str,
+        class_authorizations: List[str],
+        current_class_authorizations: Union[List[str], None] = None,
+    ) -> Union[dict, Literal[False], bytes]:
         """
         Set a user's class authorizations.
-        removes the user's current class authorizations and then recreates
-        the class authorizations list using the list that the user provides.
+        Makes one alter that removes the classes that aren't in the list that
+        the user provides and adds the ones that are missing, or returns False
+        if there is nothing to change. The user's current class authorizations
+        are extracted unless 'current_class_authorizations' are provided. In
+        generate requests only mode, they are empty unless they are provided.
         """
-        delete_result = self.delete_all_class_authorizations(userid)
-        add_result = self.add_class_authorizations(userid, class_authorizations)
-        return self._to_steps([delete_result, add_result])
+        if current_class_authorizations is None:
+            current_class_authorizations = self.get_class_authorizations(userid)
+        if isinstance(current_class_authorizations, str):
+            # A single class is extracted as a string.
+            current_class_authorizations = [current_class_authorizations]
+        elif not isinstance(current_class_authorizations, list):
+            # None when the user has no class authorizations. In generate requests
+            # only mode, this is the request XML of the extract, and there is no
+            # profile to read them from, so every class in the list is added.
+            current_class_authorizations = []
+        current_classes = [
+            class_name.lower() for class_name in current_class_authorizations
+        ]
+        classes = [class_name.lower() for class_name in class_authorizations]
+        traits = {}
+        remove_class_authorizations = [
+            class_name
+            for class_name in current_class_authorizations
+            if class_name.lower() not in classes
+        ]
+        if remove_class_authorizations:
+            traits["remove:base:class_authorizations"] = remove_class_authorizations
+        add_class_authorizations = [
+            class_name
+            for class_name in class_authorizations
+            if class_name.lower() not in current_classes
+        ]
+        if add_class_authorizations:
+            traits["add:base:class_authorizations"] = add_class_authorizations
+        if not traits:
+            return False
+        result = self.alter(userid, traits=traits)
+        return self._to_steps(result)
 
     def add_class_authorizations(
         self, userid: str, class_authorizations: Union[str, List[str]]
@@ -325,10 +392,16 @@ class UserAdmin(SecurityAdmin):
         )
         return self._to_steps(result)
 
-    def delete_all_class_authorizations(self, userid: str) -> Union[dict, Literal[False], bytes]:
+    def delete_all_class_authorizations(
+        self, userid: str
+    ) -> Union[dict, Literal[False], bytes]:
         """Delete all classes from a users class authorizations."""
         current_class_authorizations = self.get_class_authorizations(userid)
-        if not current_class_authorizations:
+        # In generate requests only mode, the remove request is always generated,
+        # including when the extract was written to a 'RequestSink' and is empty.
+        if not current_class_authorizations and not isinstance(
+            current_class_authorizations, bytes
+        ):
             return False
         return self.remove_class_authorizations(userid, current_class_authorizations)
 
@@ -394,7 +467,21 @@ class UserAdmin(SecurityAdmin):
         self._build_segment_dictionaries(traits)
         user_request = UserRequest(userid, "set")
         self._build_xml_segments(user_request, alter=True)
-        return self._make_request(user_request, irrsmo00_options=3)
+        return self._make_request(user_request, irrsmo00_options=3, deferrable=True)
+
+    def ensure(self, userid: str, traits: dict) -> Union[dict, Literal[False], bytes]:
+        """
+        Alter only the traits of a user that differ from its profile,
+        which is extracted once. Returns False without making an alter
+        if the profile already has all of the traits.
+        """
+        profile = self.extract(
+            userid, segments=self._get_ensure_segments(traits), profile_only=True
+        )
+        changed_traits = self._get_changed_traits(profile, traits)
+        if not changed_traits:
+            return False
+        return self.alter(userid, traits=changed_traits)
 
     def extract(
         self, userid: str, segments: dict = {}, profile_only: bool = False
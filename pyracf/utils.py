@@ -1,20 +1,14 @@
-import platform
+from .common.irrsmo00 import IRRSMO00
+from .common.security_request_error import SecurityRequestError
+from .common.security_result import SecurityResult
+from .common.transport import Transport
+from .user.user_request import UserRequest
 
-import xmltodict
 
-from .models import _Response
-
-if platform.system() == "OS/390":
-    from cpyracf import call_irrsmo00
-else:
-    # Ignore import of extension on non-z/OS platforms to allow for unit testing off platform.
-    def call_irrsmo00(*, xml_str, xml_len, opts):
-        _ = xml_str, xml_len, opts
-        return b""
-
-
-def get_message_value(name: str, segment: str, key: str):
-    messages = get_messages(name, segment)
+def get_message_value(
+    name: str, segment: str, key: str, transport: Transport | None = None
+):
+    messages = get_messages(name, segment, transport=transport)
     return next(
         (
             line[len(key) + 2 :]
@@ -24,20 +18,21 @@ def get_message_value(name: str, segment: str, key: str):
     )
 
 
-def get_messages(name: str, segment: str | None = None):
-    request_xml = (
-        "<?xml version='1.0' encoding='cp1047'?>"
-        + "<securityrequest xmlns='http://www.ibm.com/systems/zos/saf' xmlns:racf='http://www.ibm.com/systems/zos/racf'>"
-        + f"<user name='{name}' operation='listdata' requestid='UserRequest'>"
-        + (f"<{segment} />" if segment is not None else "")
-        + "</user>"
-        + "</securityrequest>"
-    ).encode("cp1047")
-    response_text = call_irrsmo00(
-        xml_str=request_xml,
-        xml_len=len(request_xml),
-        opts=1,
-    ).decode("cp1047")
-    return _Response(
-        **xmltodict.parse(response_text)
-    ).security_result.user.command.message
+def get_messages(
+    name: str, segment: str | None = None, transport: Transport | None = None
+):
+    user_request = UserRequest(name, "listdata")
+    if segment is not None:
+        user_request.build_segment(segment, True, {}, extract=True)
+    result_xml = IRRSMO00(transport=transport).call_racf(
+        user_request.dump_request_xml(), decode=False
+    )
+    result_dictionary = SecurityResult(result_xml).get_result_dictionary()
+    if result_dictionary["securityResult"]["returnCode"] != 0:
+        raise SecurityRequestError(result_dictionary)
+    messages = result_dictionary["securityResult"]["user"]["commands"][0]["messages"]
+    # Message offsets used by the object model don't count leading
+    # whitespace, and blank messages are treated as missing.
+    return [
+        message.strip() or None if message is not None else None for message in messages
+    ]
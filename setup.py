@@ -52,10 +52,13 @@ def main():
             "pyracf.access",
             "pyracf.common",
             "pyracf.connection",
+            "pyracf.daemon",
             "pyracf.data_set",
             "pyracf.group",
             "pyracf.resource",
             "pyracf.setropts",
+            "pyracf.simulator",
+            "pyracf.traffic",
             "pyracf.user",
         ],
         package_dir={"": "."},
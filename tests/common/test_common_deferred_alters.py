@@ -0,0 +1,153 @@
+"""Test holding back alters and merging them by profile."""
+
+import unittest
+
+import __init__
+
+from pyracf import ConnectionAdmin, SecurityRequestError, SetroptsAdmin, UserAdmin
+from pyracf.simulator import SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class TestCommonDeferredAlters(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.user_admin = UserAdmin(transport=SimulatedTransport())
+        self.user_admin.add("squidwrd")
+
+    # ============================================================================
+    # Merging Alters
+    # ============================================================================
+    def test_deferred_merges_setters_for_the_same_profile_into_one_alter(self):
+        user_admin = UserAdmin(generate_requests_only=True)
+        with user_admin.deferred() as results:
+            user_admin.set_omvs_uid("squidwrd", 2424)
+            user_admin.set_omvs_home("squidwrd", "/u/squidwrd")
+            user_admin.set_omvs_program("squidwrd", "/bin/sh")
+            self.assertEqual(results, [])
+        self.assertEqual(
+            results,
+            [
+                user_admin.alter(
+                    "squidwrd",
+                    traits={
+                        "omvs:uid": 2424,
+                        "omvs:home": "/u/squidwrd",
+                        "omvs:program": "/bin/sh",
+                    },
+                )
+            ],
+        )
+
+    def test_deferred_keeps_alters_that_set_the_same_trait_apart(self):
+        user_admin = UserAdmin(generate_requests_only=True)
+        with user_admin.deferred() as results:
+            user_admin.add_class_authorizations("squidwrd", "tstcls01")
+            user_admin.set_omvs_uid("leonard", 2424)
+            user_admin.add_class_authorizations("squidwrd", "tstcls02")
+            user_admin.set_omvs_uid("squidwrd", 2525)
+        self.assertEqual(
+            results,
+            [
+                user_admin.alter(
+                    "squidwrd", traits={"add:base:class_authorizations": ["tstcls01"]}
+                ),
+                user_admin.alter("leonard", traits={"omvs:uid": 2424}),
+                user_admin.alter(
+                    "squidwrd",
+                    traits={
+                        "add:base:class_authorizations": ["tstcls02"],
+                        "omvs:uid": 2525,
+                    },
+                ),
+            ],
+        )
+
+    def test_deferred_keeps_adding_to_and_removing_from_a_trait_apart(self):
+        user_admin = UserAdmin(generate_requests_only=True)
+        with user_admin.deferred() as results:
+            user_admin.add_class_authorizations("squidwrd", "tstcls01")
+            user_admin.remove_class_authorizations("squidwrd", "tstcls01")
+        self.assertEqual(
+            results,
+            [
+                user_admin.add_class_authorizations("squidwrd", "tstcls01"),
+                user_admin.remove_class_authorizations("squidwrd", "tstcls01"),
+            ],
+        )
+
+    def test_deferred_merges_connection_and_setropts_setters(self):
+        connection_admin = ConnectionAdmin(generate_requests_only=True)
+        with connection_admin.deferred() as results:
+            connection_admin.give_group_special_authority("squidwrd", "testgrp0")
+            connection_admin.give_group_operations_authority("squidwrd", "testgrp0")
+        self.assertEqual(
+            results,
+            [
+                connection_admin.alter(
+                    "squidwrd",
+                    "testgrp0",
+                    traits={"base:special": True, "base:operations": True},
+                )
+            ],
+        )
+        setropts_admin = SetroptsAdmin(generate_requests_only=True)
+        with setropts_admin.deferred() as results:
+            setropts_admin.add_audit_class("elijtest")
+            setropts_admin.add_active_class("elijtest")
+        self.assertEqual(
+            results,
+            [
+                setropts_admin.alter(
+                    options={
+                        "base:audit_class": "elijtest",
+                        "base:active_class": "elijtest",
+                    }
+                )
+            ],
+        )
+
+    # ============================================================================
+    # Results
+    # ============================================================================
+    def test_deferred_setter_steps_hold_the_merged_alter_result(self):
+        with self.user_admin.deferred() as results:
+            uid_steps = self.user_admin.set_omvs_uid("squidwrd", 2424)
+            home_steps = self.user_admin.set_omvs_home("squidwrd", "/u/squidwrd")
+            self.assertEqual(uid_steps, {"step1": {}})
+        self.assertEqual(uid_steps, {"step1": results[0]})
+        self.assertEqual(home_steps, {"step1": results[0]})
+        self.assertEqual(results[0]["securityResult"]["returnCode"], 0)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+        self.assertEqual(self.user_admin.get_omvs_home("squidwrd"), "/u/squidwrd")
+
+    def test_deferred_makes_held_back_alters_before_other_requests(self):
+        with self.user_admin.deferred() as results:
+            self.user_admin.set_omvs_uid("squidwrd", 2424)
+            self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+            self.user_admin.set_omvs_home("squidwrd", "/u/squidwrd")
+        self.assertEqual(len(results), 2)
+
+    def test_deferred_makes_every_held_back_alter_if_one_of_them_fails(self):
+        with self.assertRaises(SecurityRequestError) as exception:
+            with self.user_admin.deferred() as results:
+                leonard_steps = self.user_admin.set_omvs_uid("leonard", 9999999999)
+                squidwrd_steps = self.user_admin.set_omvs_uid("squidwrd", 2424)
+        self.assertEqual(len(results), 2)
+        self.assertEqual(leonard_steps, {"step1": exception.exception.result})
+        self.assertNotEqual(leonard_steps["step1"]["securityResult"]["returnCode"], 0)
+        self.assertEqual(squidwrd_steps, {"step1": results[1]})
+        self.assertEqual(results[1]["securityResult"]["returnCode"], 0)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+
+    def test_deferred_discards_held_back_alters_if_the_block_raises(self):
+        with self.assertRaises(KeyError):
+            with self.user_admin.deferred() as results:
+                self.user_admin.set_omvs_uid("squidwrd", 2424)
+                raise KeyError("squidwrd")
+        self.assertEqual(results, [])
+        self.assertIsNone(self.user_admin.get_omvs_uid("squidwrd"))
+        self.assertNotIn("alter", vars(self.user_admin))
@@ -0,0 +1,135 @@
+"""Test table driven cp1047 conversion."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.user.test_user_constants as TestUserConstants
+from pyracf.common.ebcdic import (
+    cp1047_to_parser_bytes,
+    decode_cp1047,
+    encode_cp1047,
+    strip_xml_declaration,
+)
+from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.common.security_result import SecurityResult
+from pyracf.common.transport import Transport
+from pyracf.user.user_request import UserRequest
+
+# Resolves F401
+__init__
+
+
+class TestCommonEbcdic(unittest.TestCase):
+    maxDiff = None
+
+    # ============================================================================
+    # Translation Tables
+    # ============================================================================
+    def test_encode_cp1047_uses_ibm_1047_code_points(self):
+        self.assertEqual(
+            encode_cp1047("aZ09 <>[]^¬\n"),
+            b"\x81\xe9\xf0\xf9\x40\x4c\x6e\xad\xbd\x5f\xb0\x25",
+        )
+
+    def test_decode_cp1047_round_trips_every_byte(self):
+        every_byte = bytes(range(256))
+        self.assertEqual(encode_cp1047(decode_cp1047(every_byte)), every_byte)
+
+    def test_encode_cp1047_raises_unicode_encode_error_for_unmapped_characters(self):
+        with self.assertRaises(UnicodeEncodeError) as exception:
+            encode_cp1047("€")
+        self.assertEqual(exception.exception.encoding, "cp1047")
+
+    def test_encode_cp1047_replaces_unmapped_characters_with_references(self):
+        self.assertEqual(
+            decode_cp1047(encode_cp1047("€", errors="xmlcharrefreplace")), "&#8364;"
+        )
+
+    # ============================================================================
+    # Parser Bytes
+    # ============================================================================
+    def test_strip_xml_declaration(self):
+        self.assertEqual(
+            strip_xml_declaration(b'<?xml version="1.0" encoding="IBM-1047"?><a/>'),
+            b"<a/>",
+        )
+        self.assertEqual(strip_xml_declaration(b"<a/>"), b"<a/>")
+
+    def test_cp1047_to_parser_bytes_hands_ascii_results_over_as_is(self):
+        self.assertEqual(
+            cp1047_to_parser_bytes(
+                encode_cp1047('<?xml version="1.0" encoding="IBM-1047"?><a>b</a>')
+            ),
+            b"<a>b</a>",
+        )
+
+    def test_cp1047_to_parser_bytes_declares_latin_1_for_other_results(self):
+        result_xml = TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML.replace(
+            "SQUIDWRD", "SQUIDWRD¬Ä"
+        )
+        parser_bytes = cp1047_to_parser_bytes(encode_cp1047(result_xml))
+        self.assertTrue(
+            parser_bytes.startswith(b'<?xml version="1.0" encoding="ISO-8859-1"?>')
+        )
+        self.assertEqual(
+            SecurityResult(parser_bytes).get_result_dictionary(),
+            SecurityResult(result_xml).get_result_dictionary(),
+        )
+
+    # ============================================================================
+    # Request And Result XML
+    # ============================================================================
+    @patch("pyracf.common.security_request.platform.system")
+    def test_dump_request_xml_matches_element_tree_cp1047_output(
+        self,
+        system_mock: Mock,
+    ):
+        system_mock.return_value = "OS/390"
+        user_request = UserRequest("squidwrd", "set")
+        user_request._build_segment(
+            "base",
+            {"base:name": {"value": "Squidward € Tentacles", "operation": None}},
+            {"base:name": "name"},
+        )
+        request_xml = user_request.dump_request_xml()
+        self.assertTrue(
+            request_xml.startswith(
+                encode_cp1047("<?xml version='1.0' encoding='cp1047'?>")
+            )
+        )
+        self.assertIn(
+            "Squidward &#8364; Tentacles",
+            decode_cp1047(request_xml),
+        )
+        self.assertEqual(
+            decode_cp1047(request_xml),
+            "<?xml version='1.0' encoding='cp1047'?>\n"
+            + user_request.dump_request_xml(encoding="unicode").replace("€", "&#8364;"),
+        )
+
+    @patch("pyracf.common.irrsmo00.platform.system")
+    def test_irrsmo00_hands_cp1047_result_xml_to_the_parser_as_bytes(
+        self,
+        system_mock: Mock,
+    ):
+        system_mock.return_value = "OS/390"
+        transport = Mock(spec=Transport)
+        transport.call.return_value = (
+            encode_cp1047(TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML),
+            0,
+            0,
+            0,
+        )
+        irrsmo00 = IRRSMO00(transport=transport)
+        self.assertEqual(
+            irrsmo00.call_racf(b"", 3),
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML,
+        )
+        self.assertEqual(
+            SecurityResult(
+                irrsmo00.call_racf(b"", 3, decode=False)
+            ).get_result_dictionary(),
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_DICTIONARY,
+        )
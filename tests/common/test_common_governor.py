@@ -0,0 +1,258 @@
+"""Test limiting concurrent IRRSMO00 calls."""
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Tuple
+from unittest.mock import patch
+
+import __init__
+
+from pyracf import DeadlineExceededError, UserAdmin
+from pyracf.common.ebcdic import encode_cp1047
+from pyracf.common.governor import (
+    CALL_DEADLINE,
+    Governor,
+    call_deadline,
+    call_priority,
+    get_lane,
+)
+from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.simulator import SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class ConcurrencyTrackingTransport(SimulatedTransport):
+    """Keep track of the most calls that were ever in flight at the same time."""
+
+    def __init__(self) -> None:
+        super().__init__(latency=0.02)
+        self.__lock = threading.Lock()
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        with self.__lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            return super().call(request_xml, options)
+        finally:
+            with self.__lock:
+                self.in_flight -= 1
+
+
+class TestCommonGovernor(unittest.TestCase):
+    maxDiff = None
+
+    def wait_until_waiting(self, governor: Governor, lane: str, waiting: int):
+        for _ in range(500):
+            if governor.get_statistics()[lane]["waiting"] == waiting:
+                return
+            time.sleep(0.01)
+        self.fail(f"{waiting} calls never waited in the '{lane}' lane.")
+
+    def start_calls_in_order(self, governor: Governor, priorities: list) -> tuple:
+        order = []
+        threads = []
+
+        def write(priority: str):
+            with governor.call_slot("write", priority):
+                order.append(priority)
+
+        for priority in priorities:
+            threads.append(threading.Thread(target=write, args=(priority,)))
+            threads[-1].start()
+            self.wait_until_waiting(governor, "write", len(threads))
+        return (order, threads)
+
+    # ============================================================================
+    # Lanes
+    # ============================================================================
+    def test_get_lane_treats_listdata_requests_as_reads(self):
+        request_xml = (
+            '<user name="SQUIDWRD" operation="listdata" requestid="UserRequest">'
+        )
+        self.assertEqual(get_lane(request_xml.encode("utf-8")), "read")
+        self.assertEqual(get_lane(encode_cp1047(request_xml)), "read")
+
+    def test_get_lane_treats_set_and_del_requests_as_writes(self):
+        self.assertEqual(get_lane(b'<user operation="set">'), "write")
+        self.assertEqual(get_lane(b'<user operation="del">'), "write")
+
+    # ============================================================================
+    # Limits
+    # ============================================================================
+    def test_governor_rejects_limits_below_one(self):
+        with self.assertRaises(ValueError):
+            Governor(write_limit=0)
+
+    def test_governor_limits_concurrent_writes_but_not_reads(self):
+        transport = ConcurrencyTrackingTransport()
+        UserAdmin(transport=transport).add("squidwrd", traits={})
+        governor = Governor(write_limit=2)
+        with patch.object(IRRSMO00, "governor", governor):
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                list(
+                    executor.map(
+                        lambda uid: UserAdmin(transport=transport).alter(
+                            "squidwrd", traits={"omvs:uid": uid}
+                        ),
+                        range(6),
+                    )
+                )
+            self.assertEqual(transport.max_in_flight, 2)
+            transport.max_in_flight = 0
+            with ThreadPoolExecutor(max_workers=6) as executor:
+                list(
+                    executor.map(
+                        lambda _: UserAdmin(transport=transport).extract("squidwrd"),
+                        range(6),
+                    )
+                )
+            self.assertGreater(transport.max_in_flight, 2)
+        statistics = governor.get_statistics()
+        self.assertEqual(statistics["write"]["calls"], 6)
+        self.assertEqual(statistics["write"]["maxInFlight"], 2)
+        self.assertEqual(statistics["write"]["inFlight"], 0)
+        self.assertEqual(statistics["write"]["waiting"], 0)
+        self.assertGreater(statistics["write"]["queueWaitTime"], 0)
+        self.assertEqual(statistics["read"]["calls"], 6)
+        self.assertIsNone(statistics["read"]["limit"])
+
+    def test_governor_raising_limit_releases_waiting_calls(self):
+        governor = Governor(write_limit=1)
+        entered = threading.Event()
+
+        def write():
+            with governor.call_slot("write"):
+                entered.set()
+
+        with governor.call_slot("write"):
+            thread = threading.Thread(target=write)
+            thread.start()
+            self.wait_until_waiting(governor, "write", 1)
+            governor.set_limits(write_limit=2)
+            thread.join(timeout=5)
+        self.assertTrue(entered.is_set())
+
+    def test_governor_reset_statistics(self):
+        governor = Governor()
+        with governor.call_slot("read"):
+            pass
+        governor.reset_statistics()
+        self.assertEqual(
+            governor.get_statistics()["read"],
+            {
+                "limit": None,
+                "inFlight": 0,
+                "maxInFlight": 0,
+                "waiting": 0,
+                "calls": 0,
+                "expired": 0,
+                "queueWaitTime": 0.0,
+                "maxQueueWaitTime": 0.0,
+                "interactive": {
+                    "waiting": 0,
+                    "calls": 0,
+                    "expired": 0,
+                    "queueWaitTime": 0.0,
+                    "maxQueueWaitTime": 0.0,
+                },
+                "bulk": {
+                    "waiting": 0,
+                    "calls": 0,
+                    "expired": 0,
+                    "queueWaitTime": 0.0,
+                    "maxQueueWaitTime": 0.0,
+                },
+            },
+        )
+
+    # ============================================================================
+    # Priorities
+    # ============================================================================
+    def test_governor_lets_interactive_calls_go_before_bulk_calls(self):
+        governor = Governor(write_limit=1)
+        with governor.call_slot("write"):
+            (order, threads) = self.start_calls_in_order(
+                governor, ["bulk", "bulk", "interactive"]
+            )
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(order, ["interactive", "bulk", "bulk"])
+
+    def test_governor_lets_starved_bulk_calls_go_first(self):
+        governor = Governor(write_limit=1, starvation_timeout=0)
+        with governor.call_slot("write"):
+            (order, threads) = self.start_calls_in_order(
+                governor, ["bulk", "interactive"]
+            )
+        for thread in threads:
+            thread.join(timeout=5)
+        self.assertEqual(order, ["bulk", "interactive"])
+
+    def test_governor_rejects_unknown_priority(self):
+        with self.assertRaises(ValueError):
+            with Governor().call_slot("read", "urgent"):
+                pass
+        with self.assertRaises(ValueError):
+            UserAdmin().set_call_priority("urgent")
+
+    def test_call_priority_overrides_admin_priority(self):
+        transport = SimulatedTransport()
+        user_admin = UserAdmin(transport=transport)
+        user_admin.add("squidwrd", traits={})
+        user_admin.set_call_priority("bulk")
+        governor = Governor()
+        with patch.object(IRRSMO00, "governor", governor):
+            user_admin.extract("squidwrd")
+            with call_priority("interactive"):
+                user_admin.extract("squidwrd")
+        statistics = governor.get_statistics()
+        self.assertEqual(statistics["read"]["bulk"]["calls"], 1)
+        self.assertEqual(statistics["read"]["interactive"]["calls"], 1)
+
+    # ============================================================================
+    # Deadlines
+    # ============================================================================
+    def test_call_deadline_abandons_calls_still_waiting_at_deadline(self):
+        transport = SimulatedTransport()
+        user_admin = UserAdmin(transport=transport)
+        user_admin.add("squidwrd", traits={})
+        governor = Governor(write_limit=1)
+        with patch.object(IRRSMO00, "governor", governor):
+            with governor.call_slot("write"):
+                with self.assertRaises(DeadlineExceededError) as exception:
+                    with call_deadline(0.1):
+                        user_admin.set_omvs_uid("squidwrd", 2424)
+        # The call starts waiting after the request has been built, which is
+        # after the deadline starts, so it waits a little less than 0.1 seconds.
+        self.assertGreaterEqual(exception.exception.queue_wait_time, 0.05)
+        statistics = governor.get_statistics()["write"]
+        self.assertEqual(statistics["expired"], 1)
+        self.assertEqual(statistics["calls"], 1)
+        self.assertEqual(statistics["waiting"], 0)
+        self.assertIsNone(user_admin.get_omvs_uid("squidwrd"))
+
+    def test_call_deadline_abandons_calls_made_after_deadline(self):
+        transport = SimulatedTransport()
+        user_admin = UserAdmin(transport=transport)
+        user_admin.add("squidwrd", traits={})
+        with patch.object(IRRSMO00, "governor", Governor()):
+            with call_deadline(0):
+                with self.assertRaises(DeadlineExceededError):
+                    user_admin.extract("squidwrd")
+            user_admin.extract("squidwrd")
+
+    def test_call_deadline_keeps_earliest_deadline_when_nested(self):
+        with call_deadline(10):
+            outer_deadline = CALL_DEADLINE.get()
+            with call_deadline(60):
+                self.assertEqual(CALL_DEADLINE.get(), outer_deadline)
+            with call_deadline(1):
+                self.assertLess(CALL_DEADLINE.get(), outer_deadline)
+        self.assertIsNone(CALL_DEADLINE.get())
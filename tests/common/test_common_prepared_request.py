@@ -0,0 +1,163 @@
+"""Test requests that are prepared once and run for many profiles."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import AccessAdmin, DataSetAdmin, UserAdmin
+from pyracf.common.request_sink import RequestSink
+
+# Resolves F401
+__init__
+
+
+@patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
+class TestCommonPreparedRequest(unittest.TestCase):
+    maxDiff = None
+    user_admin = UserAdmin(generate_requests_only=True)
+    omvs_traits = {
+        "omvs:uid": 2424,
+        "omvs:home": "/u/squidwrd",
+        "omvs:program": "/bin/sh",
+    }
+
+    # ============================================================================
+    # Prepared Requests Match Their Operations
+    # ============================================================================
+    def test_prepared_alter_matches_alter_for_every_profile(
+        self,
+        call_racf_mock: Mock,
+    ):
+        prepared_alter = self.user_admin.prepare("alter", list(self.omvs_traits))
+        for uid, userid in enumerate(["squidwrd", "leonard", "elijtest"]):
+            traits = {**self.omvs_traits, "omvs:uid": uid, "omvs:home": f"/u/{userid}"}
+            self.assertEqual(
+                prepared_alter.run(userid, traits=traits),
+                self.user_admin.alter(userid, traits=traits),
+            )
+        call_racf_mock.assert_not_called()
+
+    def test_prepared_request_escapes_arguments_and_trait_values(
+        self,
+        call_racf_mock: Mock,
+    ):
+        prepared_add = self.user_admin.prepare("add", ["base:name", "omvs:home"])
+        traits = {"base:name": 'Squidward "Tentacles"', "omvs:home": "/u/<&>"}
+        self.assertEqual(
+            prepared_add.run('squid"&wrd', traits=traits),
+            self.user_admin.add('squid"&wrd', traits=traits),
+        )
+
+    def test_prepared_request_with_keyword_arguments_matches_operation(
+        self,
+        call_racf_mock: Mock,
+    ):
+        data_set_admin = DataSetAdmin(generate_requests_only=True)
+        prepared_alter = data_set_admin.prepare(
+            "alter", ["base:owner"], volume="vol001", generic=True
+        )
+        self.assertEqual(
+            prepared_alter.run("esswein.test.**", traits={"base:owner": "eswein"}),
+            data_set_admin.alter(
+                "esswein.test.**",
+                traits={"base:owner": "eswein"},
+                volume="vol001",
+                generic=True,
+            ),
+        )
+        access_admin = AccessAdmin(generate_requests_only=True)
+        prepared_add = access_admin.prepare("add", ["base:access"])
+        self.assertEqual(
+            prepared_add.run(
+                "TESTING", "ELIJTEST", "ESWIFT", traits={"base:access": "READ"}
+            ),
+            access_admin.add(
+                "TESTING", "ELIJTEST", "ESWIFT", traits={"base:access": "READ"}
+            ),
+        )
+
+    def test_prepared_request_falls_back_to_operation_for_other_traits(
+        self,
+        call_racf_mock: Mock,
+    ):
+        prepared_alter = self.user_admin.prepare("alter", list(self.omvs_traits))
+        for traits in [
+            {**self.omvs_traits, "omvs:uid": False},
+            {**self.omvs_traits, "omvs:home": ""},
+            {"omvs:uid": 2424},
+            {**self.omvs_traits, "base:special": True},
+        ]:
+            self.assertEqual(
+                prepared_alter.run("squidwrd", traits=traits),
+                self.user_admin.alter("squidwrd", traits=traits),
+            )
+
+    # ============================================================================
+    # Secrets
+    # ============================================================================
+    def test_prepared_request_redacts_passwords_from_result(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ADD_USER_PASSWORD_RESULT_SUCCESS_XML
+        )
+        traits = dict(TestUserConstants.TEST_ADD_USER_REQUEST_TRAITS_PASSWORD)
+        del traits["base:special"]
+        prepared_add = UserAdmin().prepare("add", list(traits))
+        result = prepared_add.run("squidwrd", traits=traits)
+        self.assertNotIn(traits["base:password"], str(result))
+        self.assertNotIn(
+            traits["base:password"].encode("utf-8"),
+            self.user_admin.prepare("add", list(traits)).run("squidwrd", traits=traits),
+        )
+
+    # ============================================================================
+    # Errors
+    # ============================================================================
+    def test_prepared_request_in_deferred_block_is_made_after_held_back_alters(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        )
+        user_admin = UserAdmin()
+        prepared_alter = user_admin.prepare("alter", ["omvs:uid"])
+        with user_admin.deferred():
+            user_admin.set_omvs_home("squidwrd", "/u/squidwrd")
+            call_racf_mock.assert_not_called()
+            prepared_alter.run("squidwrd", traits={"omvs:uid": 2424})
+        requests = [call.args[0] for call in call_racf_mock.call_args_list]
+        self.assertEqual(len(requests), 2)
+        self.assertIn(b"<home", requests[0])
+        self.assertIn(b"<uid", requests[1])
+
+    def test_prepared_request_is_written_to_request_sink(
+        self,
+        call_racf_mock: Mock,
+    ):
+        requests = []
+        user_admin = UserAdmin(generate_requests_only=RequestSink(requests.append))
+        prepared_alter = user_admin.prepare("alter", list(self.omvs_traits))
+        self.assertEqual(prepared_alter.run("squidwrd", traits=self.omvs_traits), b"")
+        self.assertEqual(
+            requests, [self.user_admin.alter("squidwrd", traits=self.omvs_traits)]
+        )
+
+    def test_prepare_raises_value_error_for_operations_without_traits(
+        self,
+        call_racf_mock: Mock,
+    ):
+        with self.assertRaises(ValueError):
+            self.user_admin.prepare("extract", ["omvs"])
+
+    def test_prepared_request_raises_type_error_for_wrong_number_of_arguments(
+        self,
+        call_racf_mock: Mock,
+    ):
+        prepared_alter = self.user_admin.prepare("alter", ["omvs:uid"])
+        with self.assertRaises(TypeError):
+            prepared_alter.run("squidwrd", "sys1", traits={"omvs:uid": 2424})
@@ -0,0 +1,159 @@
+"""Test comparing traits with extracted profiles and ensuring profiles have them."""
+
+import unittest
+from unittest.mock import patch
+
+import __init__
+
+from pyracf import DataSetAdmin, GroupAdmin, ResourceAdmin, UserAdmin
+from pyracf.common.profile_diff import field_changed
+from pyracf.simulator import RacfDatabase, SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class TestCommonProfileDiff(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.transport = SimulatedTransport(RacfDatabase(classes=["elijtest"]))
+        self.user_admin = UserAdmin(transport=self.transport)
+        self.user_admin.add("squidwrd", traits={"base:owner": "leonard"})
+
+    def ensure_and_count_calls(self, ensure, *arguments):
+        with patch.object(
+            self.transport, "call", wraps=self.transport.call
+        ) as transport_call:
+            result = ensure(*arguments)
+        return (result, transport_call.call_count)
+
+    # ============================================================================
+    # Field Comparison
+    # ============================================================================
+    def test_field_changed_compares_values_without_case(self):
+        self.assertFalse(field_changed("leonard", "LEONARD", None))
+        self.assertFalse(field_changed(2424, "2424", None))
+        self.assertTrue(field_changed(2424, 2525, None))
+        self.assertTrue(field_changed(None, "leonard", None))
+
+    def test_field_changed_always_changes_case_sensitive_fields_with_upper_case(self):
+        self.assertTrue(
+            field_changed("/u/squidwrd", "/u/SquidWrd", None, case_sensitive=True)
+        )
+        self.assertTrue(
+            field_changed("/u/squidwrd", "/u/SQUIDWRD", None, case_sensitive=True)
+        )
+        self.assertFalse(
+            field_changed("/u/squidwrd", "/u/squidwrd", None, case_sensitive=True)
+        )
+        self.assertTrue(
+            field_changed("/u/squidwrd", "/u/leonard", None, case_sensitive=True)
+        )
+
+    def test_field_changed_compares_words_split_by_the_profile_formatter(self):
+        self.assertFalse(
+            field_changed(["squidward", "tentacles"], "Squidward Tentacles", None)
+        )
+        self.assertTrue(
+            field_changed(["squidward", "tentacles"], "Tentacles Squidward", None)
+        )
+        self.assertFalse(
+            field_changed(["tstcls02", "tstcls01"], ["tstcls01", "tstcls02"], None)
+        )
+
+    def test_field_changed_treats_values_extracted_as_none_as_unset(self):
+        self.assertFalse(field_changed(None, "NONE", None))
+        self.assertTrue(field_changed("read", "none", None))
+
+    def test_field_changed_for_add_remove_and_delete(self):
+        self.assertFalse(field_changed(["tstcls01", "tstcls02"], ["tstcls01"], "add"))
+        self.assertTrue(field_changed(["tstcls01"], ["tstcls01", "tstcls02"], "add"))
+        self.assertFalse(field_changed(["tstcls01"], ["tstcls02"], "remove"))
+        self.assertTrue(field_changed(["tstcls01"], ["tstcls01"], "remove"))
+        self.assertFalse(field_changed(None, False, None))
+        self.assertTrue(field_changed(0, False, None))
+        self.assertTrue(field_changed("leonard", True, "delete"))
+
+    # ============================================================================
+    # Ensure
+    # ============================================================================
+    def test_user_admin_ensure_only_alters_traits_that_differ(self):
+        result = self.user_admin.ensure(
+            "squidwrd",
+            {"base:owner": "LEONARD", "base:special": True, "omvs:uid": 2424},
+        )
+        self.assertEqual(
+            result["securityResult"]["user"]["commands"][0]["image"],
+            "ALTUSER SQUIDWRD SPECIAL OMVS     (UID         (2424))",
+        )
+
+    def test_user_admin_ensure_makes_no_alter_when_nothing_differs(self):
+        traits = {
+            "base:special": True,
+            "base:auditor": False,
+            "add:base:class_authorizations": ["elijtest"],
+            "omvs:home": "/u/squidwrd",
+        }
+        self.user_admin.ensure("squidwrd", traits)
+        (result, call_count) = self.ensure_and_count_calls(
+            self.user_admin.ensure, "squidwrd", traits
+        )
+        self.assertIs(result, False)
+        self.assertEqual(call_count, 1)
+
+    def test_user_admin_ensure_alters_case_sensitive_fields_that_differ_in_case(self):
+        self.user_admin.alter("squidwrd", traits={"omvs:home": "/u/squidwrd"})
+        result = self.user_admin.ensure("squidwrd", {"omvs:home": "/u/SquidWrd"})
+        self.assertIsNot(result, False)
+        self.assertEqual(
+            result["securityResult"]["user"]["commands"][0]["image"],
+            "ALTUSER SQUIDWRD OMVS     (HOME        ('/u/SquidWrd'))",
+        )
+
+    def test_user_admin_ensure_always_alters_traits_that_cant_be_compared(self):
+        (result, call_count) = self.ensure_and_count_calls(
+            self.user_admin.ensure, "squidwrd", {"base:password": "GIyTTqdF"}
+        )
+        self.assertIsNot(result, False)
+        self.assertEqual(call_count, 2)
+
+    def test_group_admin_ensure(self):
+        group_admin = GroupAdmin(transport=self.transport)
+        group_admin.add("testgrp0")
+        traits = {"base:owner": "leonard", "base:termuacc": True, "omvs:gid": 1234567}
+        group_admin.ensure("testgrp0", traits)
+        (result, call_count) = self.ensure_and_count_calls(
+            group_admin.ensure, "testgrp0", traits
+        )
+        self.assertIs(result, False)
+        self.assertEqual(call_count, 1)
+
+    def test_resource_admin_ensure(self):
+        resource_admin = ResourceAdmin(transport=self.transport)
+        resource_admin.add("testing", "elijtest")
+        traits = {"base:universal_access": "None", "base:appldata": "testing"}
+        resource_admin.ensure("testing", "elijtest", traits)
+        (result, call_count) = self.ensure_and_count_calls(
+            resource_admin.ensure, "testing", "elijtest", traits
+        )
+        self.assertIs(result, False)
+        self.assertEqual(call_count, 1)
+
+    def test_data_set_admin_ensure(self):
+        data_set_admin = DataSetAdmin(transport=self.transport)
+        data_set_admin.add("SQUIDWRD.TEST", traits={})
+        traits = {"base:universal_access": "read", "base:data": "test data set"}
+        data_set_admin.ensure("SQUIDWRD.TEST", traits)
+        (result, call_count) = self.ensure_and_count_calls(
+            data_set_admin.ensure, "SQUIDWRD.TEST", traits
+        )
+        self.assertIs(result, False)
+        self.assertEqual(call_count, 1)
+
+    def test_ensure_alters_all_traits_in_generate_requests_only_mode(self):
+        user_admin = UserAdmin(generate_requests_only=True)
+        self.assertEqual(
+            user_admin.ensure("squidwrd", {"omvs:uid": 2424}),
+            user_admin.alter("squidwrd", traits={"omvs:uid": 2424}),
+        )
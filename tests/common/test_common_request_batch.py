@@ -0,0 +1,127 @@
+"""Test batches of operations that are made in as few requests as possible."""
+
+import unittest
+from unittest.mock import patch
+
+import __init__
+
+from pyracf import SecurityRequestError, UserAdmin
+from pyracf.common.security_result import SecurityResult
+from pyracf.simulator import SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class TestCommonRequestBatch(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.user_admin = UserAdmin(transport=SimulatedTransport())
+
+    # ============================================================================
+    # Packing Requests
+    # ============================================================================
+    def test_batch_packs_definitions_with_unique_request_ids(self):
+        batch = UserAdmin(generate_requests_only=True).batch()
+        batch.add("squidwrd", traits={"omvs:uid": 2424})
+        batch.delete("leonard")
+        self.assertEqual(
+            batch.run(),
+            [
+                b'<securityrequest xmlns="http://www.ibm.com/systems/zos/saf" '
+                + b'xmlns:racf="http://www.ibm.com/systems/zos/racf">'
+                + b'<user name="squidwrd" operation="set" requestid="UserRequest1">'
+                + b"<omvs><uid>2424</uid></omvs></user>"
+                + b'<user name="leonard" operation="del" requestid="UserRequest2" />'
+                + b"</securityrequest>"
+            ],
+        )
+        self.assertEqual(len(batch), 0)
+
+    def test_batch_splits_requests_by_size_and_irrsmo00_options(self):
+        batch = UserAdmin(generate_requests_only=True).batch(max_definitions=2)
+        for userid in ["squidwrd", "leonard", "elijtest"]:
+            batch.add(userid, traits={"omvs:uid": 2424})
+        batch.alter("squidwrd", traits={"omvs:uid": 2525})
+        requests = batch.run()
+        self.assertEqual([request.count(b"<user ") for request in requests], [2, 1, 1])
+        batch = UserAdmin(generate_requests_only=True).batch(max_request_length=300)
+        for userid in ["squidwrd", "leonard", "elijtest"]:
+            batch.delete(userid)
+        requests = batch.run()
+        self.assertEqual([request.count(b"<user ") for request in requests], [2, 1])
+        self.assertTrue(all(len(request) <= 300 for request in requests))
+
+    def test_batch_redacts_passwords_from_requests(self):
+        batch = UserAdmin(generate_requests_only=True).batch()
+        batch.add("squidwrd", traits={"base:password": "GIyTTqdF"})
+        batch.add("leonard", traits={"base:passphrase": "PassPhrasesAreCool!"})
+        (request,) = batch.run()
+        self.assertNotIn(b"GIyTTqdF", request)
+        self.assertNotIn(b"PassPhrasesAreCool!", request)
+
+    def test_batch_raises_value_error_for_less_than_one_definition(self):
+        with self.assertRaises(ValueError):
+            self.user_admin.batch(max_definitions=0)
+
+    # ============================================================================
+    # Demultiplexing Results
+    # ============================================================================
+    def test_batch_returns_results_of_each_operation_in_order(self):
+        batch = self.user_admin.batch(max_definitions=2)
+        batch.add("squidwrd", traits={"omvs:uid": 2424})
+        batch.add("leonard", traits={"omvs:uid": 2525})
+        batch.alter("squidwrd", traits={"omvs:home": "/u/squidwrd"})
+        batch.extract("leonard", segments={"omvs": True}, profile_only=True)
+        batch.delete("leonard")
+        results = batch.run()
+        self.assertEqual(
+            [
+                (
+                    result["securityResult"]["user"]["name"],
+                    result["securityResult"]["user"]["operation"],
+                    result["securityResult"]["user"]["requestId"],
+                    result["securityResult"]["returnCode"],
+                )
+                for result in results[0:3] + results[4:]
+            ],
+            [
+                ("SQUIDWRD", "set", "UserRequest", 0),
+                ("LEONARD", "set", "UserRequest", 0),
+                ("SQUIDWRD", "set", "UserRequest", 0),
+                ("LEONARD", "del", "UserRequest", 0),
+            ],
+        )
+        self.assertEqual(results[3]["omvs"]["uid"], 2525)
+        self.assertEqual(self.user_admin.get_omvs_home("squidwrd"), "/u/squidwrd")
+
+    def test_batch_reports_errors_for_each_operation(self):
+        self.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+        batch = self.user_admin.batch()
+        batch.extract("missing")
+        batch.extract("squidwrd")
+        (error, result) = batch.run()
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.extract("missing")
+        self.assertIsInstance(error, SecurityRequestError)
+        self.assertEqual(error.result, exception.exception.result)
+        self.assertEqual(result, self.user_admin.extract("squidwrd"))
+
+    def test_batch_only_parses_successful_results_when_they_are_accessed(self):
+        batch = self.user_admin.batch()
+        batch.add("squidwrd", traits={"omvs:uid": 2424})
+        batch.add("leonard", traits={"omvs:uid": 2525})
+        with patch.object(
+            SecurityResult,
+            "get_definition_results",
+            autospec=True,
+            side_effect=SecurityResult.get_definition_results,
+        ) as get_definition_results_mock:
+            results = batch.run()
+            get_definition_results_mock.assert_not_called()
+            self.assertEqual(
+                [result["securityResult"]["user"]["name"] for result in results],
+                ["SQUIDWRD", "LEONARD"],
+            )
+        get_definition_results_mock.assert_called_once()
@@ -0,0 +1,77 @@
+"""Test streaming generated requests into a request sink."""
+
+import io
+import unittest
+
+import __init__
+
+from pyracf import GroupAdmin, UserAdmin
+from pyracf.common.request_sink import RequestSink
+
+# Resolves F401
+__init__
+
+
+class TestCommonRequestSink(unittest.TestCase):
+    maxDiff = None
+    user_admin = UserAdmin(generate_requests_only=True)
+
+    def test_request_sink_writes_requests_to_a_file_as_they_are_generated(self):
+        request_file = io.BytesIO()
+        request_sink = RequestSink(request_file)
+        user_admin = UserAdmin(generate_requests_only=request_sink)
+        self.assertEqual(user_admin.add("squidwrd", traits={"omvs:uid": 2424}), b"")
+        self.assertEqual(user_admin.set_omvs_home("squidwrd", "/u/squidwrd"), b"")
+        self.assertEqual(
+            request_file.getvalue(),
+            self.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+            + b"\n"
+            + self.user_admin.set_omvs_home("squidwrd", "/u/squidwrd")
+            + b"\n",
+        )
+        self.assertEqual(request_sink.request_count, 2)
+        self.assertEqual(request_sink.byte_count, len(request_file.getvalue()) - 2)
+
+    def test_request_sink_calls_a_callable_with_each_request(self):
+        requests = []
+        request_sink = RequestSink(requests.append)
+        group_admin = GroupAdmin(generate_requests_only=request_sink)
+        group_admin.set_omvs_gid("testgrp0", 1234567)
+        group_admin.delete("testgrp0")
+        generated_group_admin = GroupAdmin(generate_requests_only=True)
+        self.assertEqual(
+            requests,
+            [
+                generated_group_admin.set_omvs_gid("testgrp0", 1234567),
+                generated_group_admin.delete("testgrp0"),
+            ],
+        )
+        self.assertEqual(request_sink.request_count, 2)
+        self.assertEqual(request_sink.byte_count, sum(map(len, requests)))
+
+    def test_request_sink_writes_redacted_requests(self):
+        requests = []
+        user_admin = UserAdmin(generate_requests_only=RequestSink(requests.append))
+        user_admin.set_password("squidwrd", "GIyTTqdF")
+        self.assertNotIn(b"GIyTTqdF", requests[0])
+        self.assertEqual(
+            requests[0], self.user_admin.set_password("squidwrd", "GIyTTqdF")
+        )
+
+    def test_request_sink_writes_batched_requests(self):
+        requests = []
+        user_admin = UserAdmin(generate_requests_only=RequestSink(requests.append))
+        batch = user_admin.batch()
+        batch.alter("squidwrd", traits={"omvs:uid": 2424})
+        batch.alter("leonard", traits={"omvs:uid": 2525})
+        self.assertEqual(batch.run(), [b""])
+        self.assertEqual(len(requests), 1)
+        self.assertIn(b'<user name="leonard"', requests[0])
+
+    def test_request_sink_writes_requests_of_setters_that_extract_first(self):
+        requests = []
+        user_admin = UserAdmin(generate_requests_only=RequestSink(requests.append))
+        self.assertEqual(user_admin.delete_all_class_authorizations("squidwrd"), b"")
+        self.assertEqual(len(requests), 2)
+        self.assertEqual(requests[0], self.user_admin.extract("squidwrd"))
+        self.assertIn(b'<racf:clauth operation="remove">', requests[1])
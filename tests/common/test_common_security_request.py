@@ -0,0 +1,99 @@
+"""Test serializing security requests."""
+
+import unittest
+import xml.etree.ElementTree as XMLBuilder
+
+import __init__
+
+from pyracf.user.user_request import UserRequest
+
+# Resolves F401
+__init__
+
+
+class TestCommonSecurityRequest(unittest.TestCase):
+    maxDiff = None
+
+    def test_dump_request_xml_serializes_once_for_each_encoding(self):
+        user_request = UserRequest("squidwrd", "set")
+        request_xml = user_request.dump_request_xml(encoding="utf-8")
+        self.assertIs(user_request.dump_request_xml(encoding="utf-8"), request_xml)
+        self.assertIs(user_request.dump_request_xml(), request_xml)
+        self.assertEqual(
+            user_request.dump_request_xml(encoding="us-ascii"), request_xml
+        )
+        self.assertIsNot(
+            user_request.dump_request_xml(encoding="us-ascii"), request_xml
+        )
+
+    def test_building_segments_invalidates_serialized_request_xml(self):
+        user_request = UserRequest("squidwrd", "set")
+        request_xml = user_request.dump_request_xml(encoding="utf-8")
+        user_request._build_segment(
+            "omvs",
+            {"omvs:uid": {"value": 2424, "operation": None}},
+            {"omvs:uid": "uid"},
+        )
+        self.assertNotIn(b"<uid>", request_xml)
+        self.assertIn(
+            b"<omvs><uid>2424</uid></omvs>",
+            user_request.dump_request_xml(encoding="utf-8"),
+        )
+
+    # ============================================================================
+    # Matches ElementTree
+    # ============================================================================
+    def test_dump_request_xml_escapes_text_and_attributes_like_element_tree(self):
+        user_request = UserRequest('squid"&<wrd>\t\n', "set")
+        user_request._build_segment(
+            "base",
+            {
+                "base:name": {
+                    "value": 'Squidward & "Tentacles" <€>',
+                    "operation": None,
+                },
+                "base:special": {"value": True, "operation": "delete"},
+                "base:owner": {"value": "", "operation": None},
+            },
+            {"base:name": "name", "base:special": "special", "base:owner": "owner"},
+            alter=True,
+        )
+        racf_request = XMLBuilder.Element("securityrequest")
+        racf_request.attrib = {
+            "xmlns": "http://www.ibm.com/systems/zos/saf",
+            "xmlns:racf": "http://www.ibm.com/systems/zos/racf",
+        }
+        security_definition = XMLBuilder.SubElement(racf_request, "user")
+        security_definition.attrib = {
+            "name": 'squid"&<wrd>\t\n',
+            "operation": "set",
+            "requestid": "UserRequest",
+        }
+        segment = XMLBuilder.SubElement(security_definition, "base")
+        name = XMLBuilder.SubElement(segment, "name", {"operation": "set"})
+        name.text = 'Squidward & "Tentacles" <€>'
+        XMLBuilder.SubElement(segment, "special", {"operation": "del"})
+        owner = XMLBuilder.SubElement(segment, "owner", {"operation": "set"})
+        owner.text = ""
+        for encoding in ["utf-8", "us-ascii", "latin-1", "unicode"]:
+            self.assertEqual(
+                user_request.dump_request_xml(encoding=encoding),
+                XMLBuilder.tostring(racf_request, encoding=encoding),
+            )
+
+    def test_dump_request_xml_writes_empty_segments_only_for_extract(self):
+        user_request = UserRequest("squidwrd", "listdata")
+        user_request._build_segment("omvs", True, {}, extract=True)
+        user_request._build_segment("tso", {}, {}, extract=True)
+        user_request._build_segment(
+            "base",
+            {"base:special": False},
+            {"base:special": "special"},
+        )
+        self.assertEqual(
+            user_request.dump_request_xml(encoding="utf-8"),
+            b'<securityrequest xmlns="http://www.ibm.com/systems/zos/saf" '
+            + b'xmlns:racf="http://www.ibm.com/systems/zos/racf">'
+            + b'<user name="squidwrd" operation="listdata" requestid="UserRequest">'
+            + b"<omvs /></user></securityrequest>",
+        )
@@ -0,0 +1,169 @@
+"""Test parsing result XML into result dictionaries."""
+
+import copy
+import json
+import unittest
+from unittest.mock import Mock
+from xml.etree.ElementTree import ParseError
+
+import __init__
+from defusedxml import EntitiesForbidden
+
+from pyracf.common.security_result import LazyResultDictionary, SecurityResult
+
+# Resolves F401
+__init__
+
+RESULT_NAMESPACE = "http://www.ibm.com/systems/zos/saf/IRRSMO00Result1"
+
+
+def get_result_xml(definition_xml: str) -> str:
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        + f'<securityresult xmlns="{RESULT_NAMESPACE}">'
+        + '<user name="SQUIDWRD" operation="set" requestid="UserRequest">'
+        + definition_xml
+        + "</user><returncode>4</returncode><reasoncode>0</reasoncode>"
+        + "</securityresult>"
+    )
+
+
+class TestCommonSecurityResult(unittest.TestCase):
+    maxDiff = None
+
+    def test_security_result_extracts_info_and_commands(self):
+        result_xml = get_result_xml(
+            "<info>Definition exists. Add command skipped due to precheck option</info>"
+            + "<command><safreturncode>8</safreturncode><returncode>16</returncode>"
+            + "<reasoncode>4</reasoncode><image>ALTUSER SQUIDWRD NAME ('S &amp; T')"
+            + "</image><message>ICH21015I NAME NOT CHANGED</message><message/>"
+            + "</command>"
+        )
+        self.assertEqual(
+            SecurityResult(result_xml).get_result_dictionary(),
+            {
+                "securityResult": {
+                    "user": {
+                        "name": "SQUIDWRD",
+                        "operation": "set",
+                        "requestId": "UserRequest",
+                        "info": [
+                            "Definition exists. Add command skipped due to precheck option"
+                        ],
+                        "commands": [
+                            {
+                                "safReturnCode": 8,
+                                "returnCode": 16,
+                                "reasonCode": 4,
+                                "image": "ALTUSER SQUIDWRD NAME ('S & T')",
+                                "messages": ["ICH21015I NAME NOT CHANGED", None],
+                            }
+                        ],
+                    },
+                    "returnCode": 4,
+                    "reasonCode": 0,
+                }
+            },
+        )
+
+    def test_security_result_ignores_elements_after_an_error(self):
+        result_xml = get_result_xml(
+            "<error><errorfunction>10</errorfunction><errorcode>2000</errorcode>"
+            + "<errorreason>68</errorreason><errormessage>Invalid attribute value"
+            + "</errormessage></error><info>Ignored</info>"
+        )
+        self.assertEqual(
+            SecurityResult(result_xml).get_result_dictionary()["securityResult"][
+                "user"
+            ],
+            {
+                "name": "SQUIDWRD",
+                "operation": "set",
+                "requestId": "UserRequest",
+                "error": {
+                    "errorFunction": 10,
+                    "errorCode": 2000,
+                    "errorReason": 68,
+                    "errorMessage": "Invalid attribute value",
+                },
+            },
+        )
+
+    def test_security_result_parses_bytes_and_strings_the_same_way(self):
+        result_xml = get_result_xml(
+            "<command><image>LISTUSER SQUIDWRD</image></command>"
+        )
+        self.assertEqual(
+            SecurityResult(result_xml.encode("utf-8")).get_result_dictionary(),
+            SecurityResult(result_xml).get_result_dictionary(),
+        )
+
+    def test_security_result_rejects_entity_declarations(self):
+        result_xml = (
+            '<?xml version="1.0"?><!DOCTYPE lol [<!ENTITY lol "lol">'
+            + '<!ENTITY lol2 "&lol;&lol;&lol;&lol;">]>'
+            + f'<securityresult xmlns="{RESULT_NAMESPACE}">'
+            + "<returncode>&lol2;</returncode></securityresult>"
+        )
+        with self.assertRaises(EntitiesForbidden):
+            SecurityResult(result_xml).get_result_dictionary()
+
+    # ============================================================================
+    # Return Codes
+    # ============================================================================
+    def test_security_result_reads_return_codes_without_parsing(self):
+        result_xml = get_result_xml("<command><image>&bad;</image></command>")
+        security_result = SecurityResult(result_xml)
+        self.assertEqual(security_result.get_return_codes(), (4, 0))
+        with self.assertRaises(ParseError):
+            security_result.get_result_dictionary()
+
+    def test_security_result_parses_return_codes_it_cant_find(self):
+        result_xml = get_result_xml("").replace(
+            "<returncode>4</returncode>", "<returncode>4</returncode><!-- -->"
+        )
+        self.assertEqual(SecurityResult(result_xml).get_return_codes(), (4, 0))
+
+    def test_security_result_reads_return_codes_from_the_parsed_result(self):
+        result_xml = get_result_xml(
+            "<command><image>LISTUSER SQUIDWRD</image></command>"
+        )
+        security_result = SecurityResult(result_xml)
+        result_dictionary = security_result.get_result_dictionary()
+        self.assertIs(type(result_dictionary), dict)
+        self.assertEqual(security_result.get_return_codes(), (4, 0))
+        self.assertIs(security_result.get_result_dictionary(), result_dictionary)
+
+    # ============================================================================
+    # Lazy Result Dictionaries
+    # ============================================================================
+    def test_lazy_result_dictionary_is_filled_in_when_it_is_accessed(self):
+        security_result = SecurityResult(
+            get_result_xml("<command><image>ALTUSER SQUIDWRD</image></command>")
+        )
+        get_result_dictionary = Mock(side_effect=security_result.get_result_dictionary)
+        result_dictionary = LazyResultDictionary((4, 0), get_result_dictionary)
+        get_result_dictionary.assert_not_called()
+        self.assertEqual(result_dictionary, security_result.get_result_dictionary())
+        self.assertEqual(
+            json.loads(json.dumps(result_dictionary)),
+            security_result.get_result_dictionary(),
+        )
+        self.assertIs(type(copy.deepcopy(result_dictionary)), dict)
+        get_result_dictionary.assert_called_once()
+
+    def test_lazy_result_dictionary_fills_in_references_taken_before_it_is(self):
+        security_result = SecurityResult(
+            get_result_xml("<command><image>ALTUSER SQUIDWRD</image></command>")
+        )
+        result_dictionary = LazyResultDictionary(
+            (4, 0), security_result.get_result_dictionary
+        )
+        # 'dict.get()' reads the dictionary without accessing it.
+        security_result_dictionary = dict.get(result_dictionary, "securityResult")
+        self.assertEqual(security_result_dictionary, {"returnCode": 4, "reasonCode": 0})
+        self.assertIs(result_dictionary["securityResult"], security_result_dictionary)
+        self.assertEqual(
+            security_result_dictionary["user"]["commands"],
+            [{"image": "ALTUSER SQUIDWRD"}],
+        )
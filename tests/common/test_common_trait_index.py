@@ -0,0 +1,94 @@
+"""Test the index of accepted trait spellings."""
+
+import unittest
+
+import __init__
+
+from pyracf import UserAdmin
+from pyracf.common.trait_index import build_trait_index
+
+# Resolves F401
+__init__
+
+
+class TestCommonTraitIndex(unittest.TestCase):
+    maxDiff = None
+
+    def test_build_trait_index_maps_every_spelling_to_segment_tag_and_operation(self):
+        trait_index = build_trait_index(
+            {"base": {"base:name": "name"}, "omvs": {"omvs:uid": "uid"}}
+        )
+        self.assertEqual(
+            trait_index["base:name"], (("base", "base:name", "name", None),)
+        )
+        self.assertEqual(
+            trait_index["add:omvs:uid"], (("omvs", "omvs:uid", "uid", "add"),)
+        )
+        self.assertEqual(
+            trait_index["remove:omvs:uid"], (("omvs", "omvs:uid", "uid", "remove"),)
+        )
+        self.assertEqual(
+            trait_index["delete:base:name"], (("base", "base:name", "name", "delete"),)
+        )
+        self.assertNotIn("set:base:name", trait_index)
+        self.assertEqual(len(trait_index), 8)
+
+    def test_build_trait_index_prefers_traits_spelled_like_operations(self):
+        trait_index = build_trait_index(
+            {"base": {"base:name": "name", "add:base:name": "addname"}}
+        )
+        self.assertEqual(
+            trait_index["add:base:name"],
+            (("base", "add:base:name", "addname", None),),
+        )
+
+    def test_admin_rebuilds_trait_index_for_overwritten_field_data(self):
+        user_admin = UserAdmin(
+            generate_requests_only=True,
+            overwrite_field_data={"base": {"base:name": "name"}},
+        )
+        self.assertEqual(
+            user_admin.alter(
+                "squidwrd", traits={"base:name": "Squidward", "omvs:uid": 2424}
+            ),
+            b'<securityrequest xmlns="http://www.ibm.com/systems/zos/saf" '
+            + b'xmlns:racf="http://www.ibm.com/systems/zos/racf">'
+            + b'<user name="squidwrd" operation="set" requestid="UserRequest">'
+            + b'<base><name operation="set">Squidward</name></base>'
+            + b"</user></securityrequest>",
+        )
+        self.assertIn(
+            b"<uid",
+            UserAdmin(generate_requests_only=True).alter(
+                "squidwrd", traits={"omvs:uid": 2424}
+            ),
+        )
+
+    # ============================================================================
+    # Custom Field Data
+    # ============================================================================
+    def test_add_field_data_does_not_change_other_admins(self):
+        valid_segment_traits = UserAdmin._valid_segment_traits
+        UserAdmin(add_field_data={"omvs": {"omvs:newfield": "racf:newfield"}})
+        self.assertIs(UserAdmin._valid_segment_traits, valid_segment_traits)
+        self.assertNotIn("omvs:newfield", UserAdmin._valid_segment_traits["omvs"])
+        self.assertNotIn(
+            b"newfield",
+            UserAdmin(generate_requests_only=True).alter(
+                "squidwrd", traits={"omvs:newfield": "value", "omvs:uid": 2424}
+            ),
+        )
+
+    def test_admins_with_the_same_field_data_share_valid_segment_traits(self):
+        field_data = {"csdata": {"csdata:custom": "custom"}}
+        user_admin = UserAdmin(add_field_data=field_data)
+        other_user_admin = UserAdmin(add_field_data=dict(field_data))
+        self.assertIs(
+            user_admin._valid_segment_traits, other_user_admin._valid_segment_traits
+        )
+        self.assertIs(
+            user_admin._valid_segment_traits["omvs"],
+            UserAdmin._valid_segment_traits["omvs"],
+        )
+        with self.assertRaises(TypeError):
+            user_admin._valid_segment_traits["csdata"]["csdata:other"] = "other"
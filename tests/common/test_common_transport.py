@@ -0,0 +1,106 @@
+"""Test pluggable transports."""
+
+import unittest
+from typing import List, Tuple
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import DownstreamFatalError, SecurityRequestError, UserAdmin
+from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.common.transport import NativeTransport, Transport
+
+# Resolves F401
+__init__
+
+
+class CannedTransport(Transport):
+    """Respond to every request with the same response and keep track of requests."""
+
+    def __init__(
+        self, response_xml: str, saf_return_code: int = 0, racf_return_code: int = 0
+    ) -> None:
+        self.response_xml = response_xml.encode("utf-8")
+        self.saf_return_code = saf_return_code
+        self.racf_return_code = racf_return_code
+        self.requests: List[Tuple[bytes, int]] = []
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        self.requests.append((request_xml, options))
+        return (self.response_xml, self.saf_return_code, self.racf_return_code, 0)
+
+
+class TestCommonTransport(unittest.TestCase):
+    maxDiff = None
+
+    # ============================================================================
+    # Native Transport
+    # ============================================================================
+    @patch("pyracf.common.transport.call_irrsmo00")
+    def test_native_transport_passes_request_and_buffer_sizes_to_cpyracf(
+        self,
+        call_irrsmo00_mock: Mock,
+    ):
+        call_irrsmo00_mock.return_value = (b"<securityresult/>", 0, 0, 0)
+        transport = NativeTransport(buffer_size=4096, max_buffer_size=8192)
+        self.assertEqual(
+            transport.call(b"<securityrequest/>", 3), (b"<securityresult/>", 0, 0, 0)
+        )
+        call_irrsmo00_mock.assert_called_once_with(
+            xml_str=b"<securityrequest/>",
+            xml_len=18,
+            opts=3,
+            rsp_len=4096,
+            max_rsp_len=8192,
+        )
+
+    def test_irrsmo00_uses_native_transport_by_default(self):
+        self.assertIsInstance(IRRSMO00().transport, NativeTransport)
+
+    def test_transport_base_class_does_not_implement_call(self):
+        with self.assertRaises(NotImplementedError):
+            Transport().call(b"<securityrequest/>")
+
+    # ============================================================================
+    # Injected Transport
+    # ============================================================================
+    def test_user_admin_makes_requests_using_provided_transport(self):
+        transport = CannedTransport(
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        )
+        user_admin = UserAdmin(transport=transport)
+        self.assertEqual(
+            user_admin.alter(
+                "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+            ),
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_DICTIONARY,
+        )
+        self.assertEqual(len(transport.requests), 1)
+        request_xml, options = transport.requests[0]
+        self.assertEqual(request_xml, TestUserConstants.TEST_ALTER_USER_REQUEST_XML)
+        self.assertEqual(options, 3)
+
+    def test_user_admin_raises_security_request_error_from_provided_transport(self):
+        transport = CannedTransport(TestUserConstants.TEST_ALTER_USER_RESULT_ERROR_XML)
+        user_admin = UserAdmin(transport=transport)
+        with self.assertRaises(SecurityRequestError) as exception:
+            user_admin.alter(
+                "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+            )
+        self.assertEqual(
+            exception.exception.result,
+            TestUserConstants.TEST_ALTER_USER_RESULT_ERROR_DICTIONARY,
+        )
+
+    def test_user_admin_raises_downstream_fatal_error_when_transport_has_no_response(
+        self,
+    ):
+        transport = CannedTransport("", saf_return_code=8, racf_return_code=200)
+        user_admin = UserAdmin(transport=transport)
+        with self.assertRaises(DownstreamFatalError) as exception:
+            user_admin.alter(
+                "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+            )
+        self.assertEqual(exception.exception.saf_return_code, 8)
+        self.assertEqual(exception.exception.racf_return_code, 200)
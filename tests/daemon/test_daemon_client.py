@@ -0,0 +1,156 @@
+"""Test making admin calls through the pyRACF daemon."""
+
+import os
+import stat
+import tempfile
+import threading
+import unittest
+from typing import Tuple
+from unittest.mock import patch
+
+import __init__
+
+from pyracf import SecurityRequestError, UserAdmin
+from pyracf.daemon import DaemonCallError, DaemonClient, PyracfDaemon
+from pyracf.simulator import SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class CountingTransport(SimulatedTransport):
+    """Count the requests that reach the simulator."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.calls = 0
+        # Raised by the next call, if set.
+        self.error = None
+
+    def call(self, request_xml: bytes, options: int = 1) -> Tuple[bytes, int, int, int]:
+        self.calls += 1
+        if self.error is not None:
+            (error, self.error) = (self.error, None)
+            raise error
+        return super().call(request_xml, options)
+
+
+class TestDaemonClient(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.socket_path = os.path.join(self.directory.name, "pyracf.sock")
+        self.transport = CountingTransport()
+        self.daemon = None
+        self.start_daemon()
+
+    def tearDown(self):
+        self.daemon.shutdown()
+        self.daemon.server_close()
+        self.directory.cleanup()
+
+    def start_daemon(self, cache_ttl: float = 60.0):
+        self.daemon = PyracfDaemon(
+            self.socket_path, transport=self.transport, threads=2, cache_ttl=cache_ttl
+        )
+        threading.Thread(
+            target=self.daemon.serve_forever,
+            kwargs={"poll_interval": 0.01},
+            daemon=True,
+        ).start()
+
+    # ============================================================================
+    # Admin Calls
+    # ============================================================================
+    def test_daemon_client_returns_same_results_as_admin(self):
+        with DaemonClient(self.socket_path) as client:
+            client.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+            self.assertEqual(
+                client.user_admin.extract("squidwrd", segments={"omvs": True}),
+                UserAdmin(transport=self.transport).extract(
+                    "squidwrd", segments={"omvs": True}
+                ),
+            )
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 2424)
+
+    def test_daemon_client_raises_security_request_error(self):
+        with DaemonClient(self.socket_path) as client:
+            with self.assertRaises(SecurityRequestError) as exception:
+                client.user_admin.extract("squidwrd")
+        self.assertEqual(exception.exception.result["securityResult"]["returnCode"], 4)
+
+    def test_daemon_client_rejects_methods_that_are_not_admin_methods(self):
+        with DaemonClient(self.socket_path) as client:
+            with self.assertRaises(AttributeError):
+                client.user_admin.not_a_method("squidwrd")
+            with self.assertRaises(DaemonCallError) as exception:
+                client.call("UserAdmin", "_make_request")
+        self.assertEqual(exception.exception.error_type, "ValueError")
+
+    def test_daemon_client_raises_daemon_call_error_for_invalid_arguments(self):
+        with DaemonClient(self.socket_path) as client:
+            with self.assertRaises(DaemonCallError) as exception:
+                client.user_admin.extract()
+        self.assertEqual(exception.exception.error_type, "TypeError")
+
+    def test_daemon_client_rejects_admin_methods_that_cant_be_called_remotely(self):
+        with DaemonClient(self.socket_path) as client:
+            for method in (
+                "batch",
+                "deferred",
+                "ensure",
+                "prepare",
+                "set_call_priority",
+            ):
+                with self.assertRaises(AttributeError):
+                    getattr(client.user_admin, method)
+                with self.assertRaises(DaemonCallError) as exception:
+                    client.call("UserAdmin", method, "bulk")
+                self.assertEqual(exception.exception.error_type, "ValueError")
+
+    def test_daemon_answers_unexpected_errors_on_the_same_connection(self):
+        with DaemonClient(self.socket_path) as client:
+            client.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+            self.transport.error = RuntimeError("Transport failed.")
+            with self.assertRaises(DaemonCallError) as exception:
+                client.user_admin.set_omvs_uid("squidwrd", 1919)
+            self.assertEqual(exception.exception.error_type, "RuntimeError")
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 2424)
+
+    def test_daemon_answers_results_that_cant_be_sent_as_json_with_an_error(self):
+        with DaemonClient(self.socket_path) as client:
+            with patch.object(UserAdmin, "get_omvs_uid", return_value={2424}):
+                with self.assertRaises(DaemonCallError) as exception:
+                    client.user_admin.get_omvs_uid("squidwrd")
+            self.assertEqual(exception.exception.error_type, "TypeError")
+            client.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 2424)
+
+    # ============================================================================
+    # Profile Cache
+    # ============================================================================
+    def test_daemon_caches_reads_until_the_next_write(self):
+        with DaemonClient(self.socket_path) as client:
+            client.user_admin.add("squidwrd", traits={"omvs:uid": 2424})
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 2424)
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 2424)
+            self.assertEqual(self.transport.calls, 2)
+            client.user_admin.set_omvs_uid("squidwrd", 1919)
+            self.assertEqual(client.user_admin.get_omvs_uid("squidwrd"), 1919)
+
+    def test_daemon_does_not_cache_reads_when_cache_ttl_is_zero(self):
+        self.daemon.shutdown()
+        self.daemon.server_close()
+        self.start_daemon(cache_ttl=0)
+        with DaemonClient(self.socket_path) as client:
+            client.user_admin.add("squidwrd", traits={})
+            client.user_admin.extract("squidwrd")
+            client.user_admin.extract("squidwrd")
+        self.assertEqual(self.transport.calls, 3)
+
+    # ============================================================================
+    # Socket
+    # ============================================================================
+    def test_daemon_socket_is_only_accessible_to_owner(self):
+        self.assertEqual(stat.S_IMODE(os.stat(self.socket_path).st_mode), 0o600)
@@ -7,7 +7,6 @@ import __init__
 
 import tests.data_set.test_data_set_constants as TestDataSetConstants
 from pyracf import DataSetAdmin, SecurityRequestError
-from pyracf.common.irrsmo00 import IRRSMO00
 
 # Resolves F401
 __init__
@@ -16,7 +15,6 @@ __init__
 @patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
 class TestDataSetGetters(unittest.TestCase):
     maxDiff = None
-    IRRSMO00.__init__ = Mock(return_value=None)
     data_set_admin = DataSetAdmin()
 
     # ============================================================================
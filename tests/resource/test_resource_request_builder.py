@@ -1,13 +1,11 @@
 """Test general resource profile request builder."""
 
 import unittest
-from unittest.mock import Mock
 
 import __init__
 
 import tests.resource.test_resource_constants as TestResourceConstants
 from pyracf import ResourceAdmin
-from pyracf.common.irrsmo00 import IRRSMO00
 
 # Resolves F401
 __init__
@@ -15,7 +13,6 @@ __init__
 
 class TestResourceRequestBuilder(unittest.TestCase):
     maxDiff = None
-    IRRSMO00.__init__ = Mock(return_value=None)
     resource_admin = ResourceAdmin(generate_requests_only=True)
 
     def test_resource_admin_build_add_resource_request(self):
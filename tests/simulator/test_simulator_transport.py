@@ -0,0 +1,266 @@
+"""Test the in-memory RACF simulator."""
+
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+import tests.data_set.test_data_set_constants as TestDataSetConstants
+import tests.group.test_group_constants as TestGroupConstants
+import tests.resource.test_resource_constants as TestResourceConstants
+import tests.setropts.test_setropts_constants as TestSetroptsConstants
+import tests.user.test_user_constants as TestUserConstants
+from pyracf import (
+    AccessAdmin,
+    ConnectionAdmin,
+    DataSetAdmin,
+    GroupAdmin,
+    ResourceAdmin,
+    SecurityRequestError,
+    SetroptsAdmin,
+    UserAdmin,
+)
+from pyracf.simulator import RacfDatabase, SimulatedTransport
+
+# Resolves F401
+__init__
+
+
+class TestSimulatorTransport(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.transport = SimulatedTransport(RacfDatabase(classes=["ELIJTEST"]))
+        self.user_admin = UserAdmin(transport=self.transport)
+        self.group_admin = GroupAdmin(transport=self.transport)
+
+    def get_sample_profile(self, sample: dict, definition_type: str) -> dict:
+        return sample["securityResult"][definition_type]["commands"][0]["profiles"][0]
+
+    # ============================================================================
+    # Users
+    # ============================================================================
+    def test_simulator_user_listing_parses_like_racf_listing(self):
+        self.user_admin.add(
+            "squidwrd",
+            traits={
+                "base:name": "Squidward",
+                "base:special": True,
+                "omvs:uid": 2424,
+                "omvs:home": "/u/squidwrd",
+                "omvs:program": "/bin/sh",
+            },
+        )
+        profile = self.user_admin.extract(
+            "squidwrd", segments={"omvs": True}, profile_only=True
+        )
+        sample_profile = self.get_sample_profile(
+            TestUserConstants.TEST_EXTRACT_USER_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+            "user",
+        )
+        self.assertEqual(profile["base"].keys(), sample_profile["base"].keys())
+        self.assertEqual(profile["omvs"], sample_profile["omvs"])
+        self.assertEqual(profile["base"]["name"], "squidward")
+        self.assertEqual(profile["base"]["attributes"], ["special", "protected"])
+        self.assertEqual(list(profile["base"]["groups"].keys()), ["SYS1"])
+
+    def test_simulator_delete_user(self):
+        self.user_admin.add("squidwrd", traits={})
+        self.user_admin.delete("squidwrd")
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.extract("squidwrd")
+        self.assertEqual(
+            exception.exception.result["securityResult"]["user"]["commands"][0][
+                "messages"
+            ],
+            ["ICH30001I UNABLE TO LOCATE USER    ENTRY SQUIDWRD"],
+        )
+
+    def test_simulator_add_user_that_already_exists(self):
+        self.user_admin.add("squidwrd", traits={})
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.add("squidwrd", traits={})
+        commands = exception.exception.result["securityResult"]["user"]["commands"]
+        self.assertEqual(commands[0]["returnCode"], 16)
+        self.assertEqual(
+            commands[0]["messages"], ["IKJ56702I INVALID USERID, SQUIDWRD"]
+        )
+
+    def test_simulator_alter_user_skips_add_command_with_precheck(self):
+        self.user_admin.add("squidwrd", traits={})
+        result = self.user_admin.alter("squidwrd", traits={"omvs:uid": 2424})
+        self.assertEqual(
+            result["securityResult"]["user"]["info"],
+            ["Definition exists. Add command skipped due  to precheck option"],
+        )
+        self.assertEqual(len(result["securityResult"]["user"]["commands"]), 1)
+        self.assertEqual(self.user_admin.get_omvs_uid("squidwrd"), 2424)
+
+    def test_simulator_rejects_invalid_uid(self):
+        self.user_admin.add("squidwrd", traits={})
+        with self.assertRaises(SecurityRequestError) as exception:
+            self.user_admin.alter("squidwrd", traits={"omvs:uid": 9999999999})
+        self.assertEqual(
+            exception.exception.result["securityResult"]["user"]["commands"][0][
+                "messages"
+            ],
+            ["IKJ56702I INVALID UID, 9999999999"],
+        )
+
+    # ============================================================================
+    # Groups and Connections
+    # ============================================================================
+    def test_simulator_group_listing_parses_like_racf_listing(self):
+        self.group_admin.add("testgrp0", traits={"omvs:gid": 1234567})
+        self.user_admin.add("eswift", traits={})
+        ConnectionAdmin(transport=self.transport).add("eswift", "testgrp0")
+        profile = self.group_admin.extract(
+            "testgrp0", segments={"omvs": True}, profile_only=True
+        )
+        sample_profile = self.get_sample_profile(
+            TestGroupConstants.TEST_EXTRACT_GROUP_RESULT_BASE_OMVS_SUCCESS_DICTIONARY,
+            "group",
+        )
+        self.assertEqual(profile["base"].keys(), sample_profile["base"].keys())
+        self.assertEqual(profile["omvs"], sample_profile["omvs"])
+        self.assertEqual(
+            [user["userid"] for user in profile["base"]["users"]], ["eswift"]
+        )
+
+    def test_simulator_give_group_special_authority(self):
+        self.group_admin.add("testgrp0", traits={})
+        self.user_admin.add("eswift", traits={})
+        connection_admin = ConnectionAdmin(transport=self.transport)
+        connection_admin.add("eswift", "testgrp0")
+        connection_admin.give_group_special_authority("eswift", "testgrp0")
+        profile = self.user_admin.extract("eswift", profile_only=True)
+        self.assertEqual(
+            profile["base"]["groups"]["TESTGRP0"]["connectAttributes"], ["special"]
+        )
+
+    def test_simulator_delete_connection_that_does_not_exist(self):
+        with self.assertRaises(SecurityRequestError) as exception:
+            ConnectionAdmin(transport=self.transport).delete("eswift", "testgrp0")
+        self.assertEqual(
+            exception.exception.result["securityResult"]["groupConnection"]["commands"][
+                0
+            ]["messages"],
+            ["ICH03002I ESWIFT   WAS NOT CONNECTED TO GROUP."],
+        )
+
+    # ============================================================================
+    # Data Set Profiles
+    # ============================================================================
+    def test_simulator_data_set_listing_parses_like_racf_listing(self):
+        self.user_admin.add("eswift", traits={})
+        data_set_admin = DataSetAdmin(transport=self.transport)
+        data_set_admin.add(
+            "ESWIFT.TEST.T1136242.P3020470",
+            traits={"base:universal_access": "READ"},
+            volume="USRAT2",
+        )
+        profile = data_set_admin.extract(
+            "ESWIFT.TEST.T1136242.P3020470", profile_only=True
+        )
+        sample_profile = self.get_sample_profile(
+            TestDataSetConstants.TEST_EXTRACT_DATA_SET_RESULT_BASE_SUCCESS_DICTIONARY,
+            "dataSet",
+        )
+        self.assertEqual(profile, sample_profile)
+
+    def test_simulator_add_data_set_with_undefined_high_level_qualifier(self):
+        with self.assertRaises(SecurityRequestError) as exception:
+            DataSetAdmin(transport=self.transport).add("ESWIFT.TEST", traits={})
+        self.assertEqual(
+            exception.exception.result["securityResult"]["dataSet"]["commands"][0][
+                "messages"
+            ],
+            ["ICH09006I USER OR GROUP ESWIFT   NOT DEFINED TO RACF"],
+        )
+
+    # ============================================================================
+    # General Resource Profiles and Permits
+    # ============================================================================
+    def test_simulator_resource_listing_parses_like_racf_listing(self):
+        resource_admin = ResourceAdmin(transport=self.transport)
+        resource_admin.add(
+            "TESTING", "ELIJTEST", traits={"base:universal_access": "NONE"}
+        )
+        profile = resource_admin.extract("TESTING", "ELIJTEST", profile_only=True)
+        sample_profile = self.get_sample_profile(
+            TestResourceConstants.TEST_EXTRACT_RESOURCE_RESULT_BASE_SUCCESS_DICTIONARY,
+            "resource",
+        )
+        self.assertEqual(profile["base"].keys(), sample_profile["base"].keys())
+        self.assertEqual(profile["base"]["class"], "elijtest")
+        self.assertEqual(profile["base"]["name"], "testing")
+
+    def test_simulator_add_resource_in_undefined_class(self):
+        with self.assertRaises(SecurityRequestError) as exception:
+            ResourceAdmin(transport=self.transport).add("TESTING", "NOTACLAS", {})
+        self.assertEqual(
+            exception.exception.result["securityResult"]["resource"]["commands"][0][
+                "messages"
+            ][0],
+            "IKJ56702I INVALID CLASS, NOTACLAS",
+        )
+
+    def test_simulator_permit_and_delete_permit(self):
+        ResourceAdmin(transport=self.transport).add("TESTING", "ELIJTEST", {})
+        self.user_admin.add("eswift", traits={})
+        access_admin = AccessAdmin(transport=self.transport)
+        access_admin.add(
+            "TESTING", "ELIJTEST", "eswift", traits={"base:access": "READ"}
+        )
+        access_admin.delete("TESTING", "ELIJTEST", "eswift")
+        with self.assertRaises(SecurityRequestError) as exception:
+            access_admin.delete("TESTING", "ELIJTEST", "eswift")
+        self.assertEqual(
+            exception.exception.result["securityResult"]["permission"]["commands"][0][
+                "messages"
+            ],
+            ["ICH06002I ESWIFT   NOT AUTHORIZED, DELETE IGNORED"],
+        )
+
+    # ============================================================================
+    # SETROPTS
+    # ============================================================================
+    def test_simulator_setropts_listing_parses_like_racf_listing(self):
+        setropts_admin = SetroptsAdmin(transport=self.transport)
+        setropts_admin.add_active_class("ELIJTEST")
+        setropts_admin.add_raclist_class("ELIJTEST")
+        profile = setropts_admin.list_racf_options(options_only=True)
+        sample_profile = self.get_sample_profile(
+            TestSetroptsConstants.TEST_LIST_SETROPTS_RESULT_SUCCESS_DICTIONARY,
+            "systemSettings",
+        )
+        self.assertEqual(profile.keys(), sample_profile.keys())
+        self.assertEqual(
+            setropts_admin.get_class_attributes("ELIJTEST"), ["active", "raclist"]
+        )
+        setropts_admin.remove_active_class("ELIJTEST")
+        self.assertEqual(setropts_admin.get_class_attributes("ELIJTEST"), ["raclist"])
+
+    # ============================================================================
+    # Transport
+    # ============================================================================
+    @patch("pyracf.simulator.simulated_transport.time.sleep")
+    def test_simulator_sleeps_for_latency(self, sleep_mock: Mock):
+        transport = SimulatedTransport(latency=0.25)
+        UserAdmin(transport=transport).add("squidwrd", traits={})
+        sleep_mock.assert_called_once_with(0.25)
+
+    def test_simulator_rejects_unsupported_definition(self):
+        (
+            response_xml,
+            saf_return_code,
+            racf_return_code,
+            racf_reason_code,
+        ) = self.transport.call(
+            b'<securityrequest xmlns="http://www.ibm.com/systems/zos/saf">'
+            + b'<certificate name="TESTING" operation="set" /></securityrequest>'
+        )
+        self.assertEqual(
+            (saf_return_code, racf_return_code, racf_reason_code), (4, 2000, 68)
+        )
+        self.assertIn(b"<errorcode>2000</errorcode>", response_xml)
@@ -8,12 +8,24 @@ import __init__
 from tests.access.test_access_debug_logging import TestAccessDebugLogging
 from tests.access.test_access_request_builder import TestAccessRequestBuilder
 from tests.access.test_access_result_parser import TestAccessResultParser
+from tests.common.test_common_deferred_alters import TestCommonDeferredAlters
+from tests.common.test_common_ebcdic import TestCommonEbcdic
+from tests.common.test_common_governor import TestCommonGovernor
+from tests.common.test_common_prepared_request import TestCommonPreparedRequest
+from tests.common.test_common_profile_diff import TestCommonProfileDiff
+from tests.common.test_common_request_batch import TestCommonRequestBatch
+from tests.common.test_common_request_sink import TestCommonRequestSink
+from tests.common.test_common_security_request import TestCommonSecurityRequest
+from tests.common.test_common_security_result import TestCommonSecurityResult
+from tests.common.test_common_trait_index import TestCommonTraitIndex
+from tests.common.test_common_transport import TestCommonTransport
 from tests.connection.test_connection_debug_logging import TestConnectionDebugLogging
 from tests.connection.test_connection_request_builder import (
     TestConnectionRequestBuilder,
 )
 from tests.connection.test_connection_result_parser import TestConnectionResultParser
 from tests.connection.test_connection_setters import TestConnectionSetters
+from tests.daemon.test_daemon_client import TestDaemonClient
 from tests.data_set.test_data_set_debug_logging import TestDataSetDebugLogging
 from tests.data_set.test_data_set_getters import TestDataSetGetters
 from tests.data_set.test_data_set_request_builder import TestDataSetRequestBuilder
@@ -34,8 +46,11 @@ from tests.setropts.test_setropts_getters import TestSetroptsGetters
 from tests.setropts.test_setropts_request_builder import TestSetroptsRequestBuilder
 from tests.setropts.test_setropts_result_parser import TestSetroptsResultParser
 from tests.setropts.test_setropts_setters import TestSetroptsSetters
+from tests.simulator.test_simulator_transport import TestSimulatorTransport
+from tests.traffic.test_traffic_recording import TestTrafficRecording
 from tests.user.test_user_debug_logging import TestUserDebugLogging
 from tests.user.test_user_getters import TestUserGetters
+from tests.user.test_user_object_model import TestUserObjectModel
 from tests.user.test_user_request_builder import TestUserRequestBuilder
 from tests.user.test_user_result_parser import TestUserResultParser
 from tests.user.test_user_setters import TestUserSetters
@@ -52,6 +67,17 @@ def __test_suite() -> unittest.TestSuite:
         TestAccessResultParser,
         TestAccessRequestBuilder,
         TestAccessDebugLogging,
+        TestCommonTransport,
+        TestCommonEbcdic,
+        TestCommonGovernor,
+        TestCommonTraitIndex,
+        TestCommonSecurityRequest,
+        TestCommonPreparedRequest,
+        TestCommonRequestBatch,
+        TestCommonRequestSink,
+        TestCommonDeferredAlters,
+        TestCommonProfileDiff,
+        TestCommonSecurityResult,
         TestConnectionResultParser,
         TestConnectionRequestBuilder,
         TestConnectionSetters,
@@ -76,9 +102,13 @@ def __test_suite() -> unittest.TestSuite:
         TestSetroptsGetters,
         TestSetroptsSetters,
         TestSetroptsDebugLogging,
+        TestSimulatorTransport,
+        TestTrafficRecording,
+        TestDaemonClient,
         TestUserResultParser,
         TestUserRequestBuilder,
         TestUserGetters,
+        TestUserObjectModel,
         TestUserSetters,
         TestUserDebugLogging,
     ]
@@ -0,0 +1,116 @@
+"""Test recording and replaying security requests."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import Mock, patch
+
+import __init__
+
+from pyracf import GroupAdmin, UserAdmin
+from pyracf.simulator import SimulatedTransport
+from pyracf.traffic import RecordingTransport, TrafficReplayer, read_recording
+
+# Resolves F401
+__init__
+
+
+class TestTrafficRecording(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "traffic.jsonl")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def write_recording(self, records: list):
+        with open(self.path, "w", encoding="utf-8") as recording:
+            for record in records:
+                recording.write(json.dumps(record) + "\n")
+
+    # ============================================================================
+    # Recording
+    # ============================================================================
+    def test_recording_transport_records_requests_and_results(self):
+        transport = RecordingTransport(SimulatedTransport(), self.path)
+        GroupAdmin(transport=transport).add("testgrp0", traits={})
+        UserAdmin(transport=transport).alter("squidwrd", traits={"omvs:uid": 2424})
+        records = list(read_recording(self.path))
+        self.assertEqual([record["options"] for record in records], [1, 3])
+        self.assertEqual(records[0]["returnCodes"], [0, 0, 0])
+        self.assertIn('<group name="testgrp0"', records[0]["request"])
+        self.assertIn("ADDGROUP TESTGRP0", records[0]["response"])
+        self.assertLessEqual(records[0]["timestamp"], records[1]["timestamp"])
+        self.assertGreaterEqual(records[1]["latency"], 0)
+
+    def test_recording_transport_redacts_password_and_passphrase(self):
+        transport = RecordingTransport(SimulatedTransport(), self.path)
+        UserAdmin(transport=transport).add(
+            "squidwrd",
+            traits={
+                "base:password": "GIyTTqdF",
+                "base:passphrase": "PassPhrasesAreCool!",
+            },
+        )
+        with open(self.path, "r", encoding="utf-8") as recording:
+            recording_text = recording.read()
+        self.assertNotIn("GIyTTqdF", recording_text)
+        self.assertNotIn("PassPhrasesAreCool!", recording_text)
+        record = next(read_recording(self.path))
+        self.assertIn("<racf:password>********</racf:password>", record["request"])
+        self.assertIn("PASSWORD    (********)", record["response"])
+
+    # ============================================================================
+    # Replay
+    # ============================================================================
+    def test_traffic_replayer_replays_recorded_requests(self):
+        transport = RecordingTransport(SimulatedTransport(), self.path)
+        user_admin = UserAdmin(transport=transport)
+        user_admin.add("squidwrd", traits={})
+        user_admin.alter("squidwrd", traits={"omvs:uid": 2424})
+        results = TrafficReplayer(SimulatedTransport(), speed=0).replay(self.path)
+        self.assertEqual(
+            [result["replayedReturnCodes"] for result in results],
+            [[0, 0, 0], [0, 0, 0]],
+        )
+        self.assertEqual(
+            [result["recordedReturnCodes"] for result in results],
+            [[0, 0, 0], [0, 0, 0]],
+        )
+
+    @patch("pyracf.traffic.traffic_replayer.time.sleep")
+    def test_traffic_replayer_scales_recorded_rate(self, sleep_mock: Mock):
+        request = (
+            '<securityrequest xmlns="http://www.ibm.com/systems/zos/saf" '
+            + 'xmlns:racf="http://www.ibm.com/systems/zos/racf">'
+            + '<systemsettings operation="set" requestid="SetroptsRequest">'
+            + "<racf:list /></systemsettings></securityrequest>"
+        )
+        self.write_recording(
+            [
+                {
+                    "timestamp": timestamp,
+                    "options": 1,
+                    "latency": 0.001,
+                    "request": request,
+                    "response": "",
+                    "returnCodes": [0, 0, 0],
+                }
+                for timestamp in [1000.0, 1010.0, 1030.0]
+            ]
+        )
+        results = TrafficReplayer(SimulatedTransport(), speed=2, threads=1).replay(
+            self.path
+        )
+        self.assertEqual(len(results), 3)
+        delays = [call.args[0] for call in sleep_mock.call_args_list]
+        self.assertEqual(len(delays), 2)
+        self.assertAlmostEqual(delays[0], 5.0, places=1)
+        self.assertAlmostEqual(delays[1], 15.0, places=1)
+
+    def test_traffic_replayer_rejects_negative_speed(self):
+        with self.assertRaises(ValueError):
+            TrafficReplayer(SimulatedTransport(), speed=-1)
@@ -187,6 +187,9 @@ TEST_USER_DELETE_ALL_CLASS_AUTHORIZATIONS_XML = get_sample(
 TEST_USER_SET_CLASS_AUTHORIZATIONS_XML = get_sample(
     "user_set_class_authorizations_request.xml"
 )
+TEST_USER_SET_CLASS_AUTHORIZATIONS_ADD_AND_REMOVE_XML = get_sample(
+    "user_set_class_authorizations_add_and_remove_request.xml"
+)
 TEST_USER_SET_OMVS_UID_XML = get_sample("user_set_omvs_uid_request.xml")
 TEST_USER_SET_OMVS_HOME_XML = get_sample("user_set_omvs_home_request.xml")
 TEST_USER_SET_OMVS_PROGRAM_XML = get_sample("user_set_omvs_program_request.xml")
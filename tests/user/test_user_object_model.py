@@ -0,0 +1,43 @@
+"""Test the RacfUser object model."""
+
+import unittest
+
+import __init__
+
+from pyracf import SecurityRequestError, UserAdmin
+from pyracf.simulator import SimulatedTransport
+from pyracf.user import RacfUser
+from pyracf.utils import get_messages
+
+# Resolves F401
+__init__
+
+
+class TestUserObjectModel(unittest.TestCase):
+    maxDiff = None
+
+    def setUp(self):
+        self.transport = SimulatedTransport()
+        UserAdmin(transport=self.transport).add(
+            "squidwrd",
+            traits={"omvs:uid": 2424, "omvs:home": "/u/squidwrd"},
+        )
+
+    def test_get_messages_makes_listdata_request_through_transport(self):
+        messages = get_messages("squidwrd", "omvs", transport=self.transport)
+        self.assertEqual(messages[1][:19], "DEFAULT-GROUP=SYS1 ")
+        self.assertIn("OMVS INFORMATION", messages)
+        self.assertIn(None, messages)
+
+    def test_get_messages_raises_security_request_error_for_undefined_user(self):
+        with self.assertRaises(SecurityRequestError):
+            get_messages("eswift", transport=self.transport)
+
+    def test_racf_user_properties(self):
+        racf_user = RacfUser("squidwrd", transport=self.transport)
+        self.assertEqual(racf_user.user, "SQUIDWRD")
+        self.assertEqual(racf_user.default_group, "SYS1")
+        self.assertEqual(racf_user.password_interval, 186)
+        self.assertEqual(racf_user.omvs.uid, 2424)
+        self.assertEqual(racf_user.omvs.home, "/u/squidwrd")
+        self.assertIsNone(racf_user.omvs.max_threads)
@@ -1,13 +1,11 @@
 """Test user request builder."""
 
 import unittest
-from unittest.mock import Mock
 
 import __init__
 
 import tests.user.test_user_constants as TestUserConstants
 from pyracf import UserAdmin
-from pyracf.common.irrsmo00 import IRRSMO00
 
 # Resolves F401
 __init__
@@ -15,7 +13,6 @@ __init__
 
 class TestUserRequestBuilder(unittest.TestCase):
     maxDiff = None
-    IRRSMO00.__init__ = Mock(return_value=None)
     user_admin = UserAdmin(generate_requests_only=True)
     test_password = "GIyTTqdF"
     test_passphrase = "PassPhrasesAreCool!"
@@ -7,7 +7,7 @@ import __init__
 
 import tests.user.test_user_constants as TestUserConstants
 from pyracf import SecurityRequestError, UserAdmin
-from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.common.security_result import SecurityResult
 
 # Resolves F401
 __init__
@@ -16,7 +16,6 @@ __init__
 @patch("pyracf.common.irrsmo00.IRRSMO00.call_racf")
 class TestUserResultParser(unittest.TestCase):
     maxDiff = None
-    IRRSMO00.__init__ = Mock(return_value=None)
     user_admin = UserAdmin()
     test_password = "GIyTTqdF"
     test_passphrase = "PassPhrasesAreCool!"
@@ -70,6 +69,28 @@ class TestUserResultParser(unittest.TestCase):
             TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_DICTIONARY,
         )
 
+    def test_user_admin_only_parses_alter_user_success_xml_when_it_is_accessed(
+        self,
+        call_racf_mock: Mock,
+    ):
+        call_racf_mock.return_value = (
+            TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_XML
+        )
+        with patch.object(
+            SecurityResult,
+            "get_result_dictionary",
+            autospec=True,
+            side_effect=SecurityResult.get_result_dictionary,
+        ) as get_result_dictionary_mock:
+            result = self.user_admin.alter(
+                "squidwrd", traits=TestUserConstants.TEST_ALTER_USER_REQUEST_TRAITS
+            )
+            get_result_dictionary_mock.assert_not_called()
+            self.assertEqual(
+                result, TestUserConstants.TEST_ALTER_USER_RESULT_SUCCESS_DICTIONARY
+            )
+        get_result_dictionary_mock.assert_called_once()
+
     # Error: invalid parameter "name"
     def test_user_admin_can_parse_alter_user_error_xml(
         self,
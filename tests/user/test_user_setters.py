@@ -7,7 +7,7 @@ import __init__
 
 import tests.user.test_user_constants as TestUserConstants
 from pyracf import UserAdmin
-from pyracf.common.irrsmo00 import IRRSMO00
+from pyracf.simulator import RacfDatabase, SimulatedTransport
 
 # Resolves F401
 __init__
@@ -15,7 +15,6 @@ __init__
 
 class TestUserSetters(unittest.TestCase):
     maxDiff = None
-    IRRSMO00.__init__ = Mock(return_value=None)
     user_admin = UserAdmin(generate_requests_only=True)
 
     # ============================================================================
@@ -137,19 +136,41 @@ class TestUserSetters(unittest.TestCase):
         get_class_authorizations_mock.return_value = [
             "facility",
             "terminal",
-            "xfacilit",
         ]
         result = self.user_admin.set_class_authorizations(
             "squidwrd", ["terminal", "xfacilit"]
         )
         self.assertEqual(
             result,
-            (
-                TestUserConstants.TEST_USER_DELETE_ALL_CLASS_AUTHORIZATIONS_XML
-                + TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
-            ),
+            TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_ADD_AND_REMOVE_XML,
         )
 
+    @patch("pyracf.user.user_admin.UserAdmin.get_class_authorizations")
+    def test_user_admin_build_set_class_authorizations_with_current_class_authorizations(
+        self,
+        get_class_authorizations_mock: Mock,
+    ):
+        result = self.user_admin.set_class_authorizations(
+            "squidwrd",
+            ["TERMINAL", "xfacilit"],
+            current_class_authorizations=["facility", "terminal"],
+        )
+        get_class_authorizations_mock.assert_not_called()
+        self.assertEqual(
+            result,
+            TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_ADD_AND_REMOVE_XML,
+        )
+
+    def test_user_admin_set_class_authorizations_returns_false_if_nothing_changes(
+        self,
+    ):
+        result = self.user_admin.set_class_authorizations(
+            "squidwrd",
+            ["terminal", "xfacilit"],
+            current_class_authorizations=["xfacilit", "terminal"],
+        )
+        self.assertFalse(result)
+
     @patch("pyracf.user.user_admin.UserAdmin.get_class_authorizations")
     def test_user_admin_build_set_class_authorizations_no_existinsg_class_authorizations_request(
         self,
@@ -163,6 +184,54 @@ class TestUserSetters(unittest.TestCase):
             result, TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
         )
 
+    @patch("pyracf.user.user_admin.UserAdmin.get_class_authorizations")
+    def test_user_admin_build_set_class_authorizations_when_none_are_extracted(
+        self,
+        get_class_authorizations_mock: Mock,
+    ):
+        get_class_authorizations_mock.return_value = None
+        result = self.user_admin.set_class_authorizations(
+            "squidwrd", ["terminal", "xfacilit"]
+        )
+        self.assertEqual(
+            result, TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
+        )
+
+    def test_user_admin_build_set_class_authorizations_adds_every_class_when_unknown(
+        self,
+    ):
+        result = self.user_admin.set_class_authorizations(
+            "squidwrd", ["terminal", "xfacilit"]
+        )
+        self.assertEqual(
+            result, TestUserConstants.TEST_USER_SET_CLASS_AUTHORIZATIONS_XML
+        )
+
+    def test_user_admin_set_class_authorizations_reads_current_class_authorizations(
+        self,
+    ):
+        user_admin = UserAdmin(
+            transport=SimulatedTransport(
+                RacfDatabase(classes=["facility", "terminal", "xfacilit"])
+            )
+        )
+        user_admin.add("squidwrd")
+        user_admin.set_class_authorizations("squidwrd", ["facility"])
+        self.assertEqual(user_admin.get_class_authorizations("squidwrd"), ["facility"])
+        result = user_admin.set_class_authorizations(
+            "squidwrd", ["terminal", "xfacilit"]
+        )
+        self.assertEqual(
+            result["step1"]["securityResult"]["user"]["commands"][0]["image"],
+            "ALTUSER SQUIDWRD NOCLAUTH    (facility) CLAUTH      (terminal xfacilit)",
+        )
+        self.assertEqual(
+            user_admin.get_class_authorizations("squidwrd"), ["terminal", "xfacilit"]
+        )
+        self.assertFalse(
+            user_admin.set_class_authorizations("squidwrd", ["xfacilit", "terminal"])
+        )
+
     # ============================================================================
     # OMVS UID
     # ============================================================================